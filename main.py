@@ -17,8 +17,13 @@ from src.data_loader import DataLoader # Veri okuma / yazma
 from src.graph_builder import DeliveryGraph # Noktalar arası mesafe grafı
 from src.astar import AStarPathfinder  # A* algoritması
 from src.csp_solver import CSPSolver  # CSP çözücü
+from src.csp_decomposition import DecomposedCSPSolver  # Bölgesel ayrıştırmalı paralel CSP
 from src.genetic_algorithm import GeneticAlgorithm  # Genetik algoritma
+from src.vectorized_ga import VectorizedGeneticAlgorithm # NumPy tabanlı GA motoru
+from src.island_ga import IslandGeneticAlgorithm # Ada modeli GA
 from src.multi_trip_planner import MultiTripPlanner  # Çok turlu planlayıcı
+from src.order_stream import OrderStream # Çevrimiçi sipariş akışı
+from src.event_log import event_log # Planlayıcı olay günlüğü
 from src.detailed_reporter import DetailedReporter # Ayrıntılı rapor üretici
 from src.visualizer import Visualizer # Grafik & harita çizimi
 from src.data_generator import DataGenerator # Rastgele senaryo üretici
@@ -82,20 +87,61 @@ def run_astar_optimization(graph, drones, deliveries, visualize=True):
     }
 
 # CSP ile optimizasyon
-def run_csp_optimization(drones, deliveries, no_fly_zones, graph):
-    """CSP çözücü ile optimizasyon"""
+def run_csp_optimization(drones, deliveries, no_fly_zones, graph, mode='fc',
+                         lazy_domains=False, max_set_size=3, time_limit=None, require_active=False):
+    """CSP çözücü ile optimizasyon
+    
+    mode: 'fc' ilk tutarlı çözüm, 'bnb' en yüksek kapsama, 'cbj' backjumping + nogood öğrenme,
+          'decompose' tüm senaryoyu bölgelere ayırıp paralel çözer
+    lazy_domains / max_set_size: domain'ler arama sırasında üretilir (3'ten büyük setlerde zorunlu)
+    time_limit: arama süresi (saniye); süre dolarsa her mod o ana kadar bulunan en iyi (fc / cbj'de
+                kısmi, atanmamış drone'lar boş) çözümü döndürür
+    require_active: 'cbj' modunda her drone en az bir teslimat almalı (boş set yasak; arama başarısız olabilir)
+    """
     print("🧩 CSP Çözücü çalıştırılıyor...") # Kullanıcıya bilgi ver
     start_time = time.time() # Başlangıç zamanı kaydedilir
     
-    # Büyük problemler için veri setini küçült
-    max_deliveries = min(30, len(deliveries)) # Maksimum 30 teslimatla sınırlama
-    max_drones = min(8, len(drones)) # Maksimum 8 drone ile çözümleme yap
+    if time_limit is not None:
+        lazy_domains = True # Domain üretimi de süre bütçesine dahil olsun
     
-    csp_solver = CSPSolver(drones[:max_drones], deliveries[:max_deliveries], 
-                          no_fly_zones, graph)
-    
-    # Forward checking ile CSP çözümü başlatılır
-    solution = csp_solver.solve_with_forward_checking()
+    if mode == 'decompose':
+        # Veri seti küçültülmez: her drone üssü çevresindeki küme ayrı süreçte çözülür
+        max_deliveries = len(deliveries)
+        csp_solver = DecomposedCSPSolver(drones, deliveries, no_fly_zones, graph,
+                                         lazy_domains=lazy_domains, max_set_size=max_set_size,
+                                         time_limit=time_limit)
+    else:
+        # Büyük problemler için veri setini küçült
+        max_deliveries = min(30, len(deliveries)) # Maksimum 30 teslimatla sınırlama
+        max_drones = min(8, len(drones)) # Maksimum 8 drone ile çözümleme yap
+        
+        csp_solver = CSPSolver(drones[:max_drones], deliveries[:max_deliveries], 
+                              no_fly_zones, graph, lazy_domains, max_set_size)
+    
+    if mode == 'decompose':
+        solution = csp_solver.solve()
+        print(f"   · {len(csp_solver.clusters)} küme çözüldü, "
+              f"{len(csp_solver.repaired_deliveries)} sınır teslimatı onarımla eklendi")
+    elif mode == 'bnb':
+        # Branch-and-bound (anytime): her iyileşen çözüm bulunduğu anda raporlanır
+        def report(record):
+            print(f"   · {record['elapsed']:.3f}s, {record['nodes']} düğüm: "
+                  f"incumbent={record['quality']['covered_deliveries']}, sınır={record['bound']}, "
+                  f"boşluk=%{record['gap']*100:.1f}")
+        
+        solution = csp_solver.solve_optimal(time_limit=time_limit, on_solution=report)
+        final = csp_solver.progress_log[-1]
+        status = "süre doldu" if csp_solver.budget_hit else "arama tamamlandı"
+        print(f"   · {status}: incumbent={final['incumbent']}, sınır={final['bound']}, "
+              f"boşluk=%{final['gap']*100:.1f}")
+    elif mode == 'cbj':
+        # Conflict-directed backjumping: tekrar eden başarısız kombinasyonlar nogood ile elenir
+        solution = csp_solver.solve_with_backjumping(time_limit=time_limit, allow_idle=not require_active)
+    else:
+        # Forward checking ile CSP çözümü başlatılır
+        solution = csp_solver.solve_with_forward_checking(time_limit=time_limit)
+    if mode in ('fc', 'cbj') and csp_solver.budget_hit:
+        print(f"   · süre doldu: en iyi kısmi atama ({csp_solver.best_partial_coverage} teslimat) kullanılıyor")
     execution_time = time.time() - start_time # Çalışma süresi hesaplanır
     
     if solution: # Eğer geçerli bir çözüm bulunduysa
@@ -107,6 +153,14 @@ def run_csp_optimization(drones, deliveries, no_fly_zones, graph):
         print(f"   - Teslimat oranı: %{quality['coverage_rate']*100:.1f}")
         print(f"   - Drone kullanım oranı: %{quality['drone_utilization']*100:.1f}")
         print(f"   - Çalışma süresi: {execution_time:.3f} saniye")
+        if csp_solver.search_stats:
+            print(f"   - Arama: {csp_solver.search_stats['nodes_visited']} düğüm, "
+                  f"{csp_solver.search_stats['backjumps']} backjump, "
+                  f"{csp_solver.search_stats['nogood_hits']} nogood isabeti")
+        if mode == 'cbj' and not require_active and not csp_solver.search_stats['backjumps']:
+            # Boş set her drone için geçerli: arama hiç başarısız olmaz, cbj sıradan derinlik öncelikli aramaya iner
+            print("   · Not: boşta kalma serbestken backjumping devreye girmez; "
+                  "çakışmalı arama için --csp-require-active kullanın")
         
         return { # Başarılı çözüm sonuçları döndürülür
             'solution': solution,
@@ -114,6 +168,10 @@ def run_csp_optimization(drones, deliveries, no_fly_zones, graph):
             'delivery_rate': quality['coverage_rate'],
             'drone_utilization': quality['drone_utilization'],
             'execution_time': execution_time,
+            'progress_log': getattr(csp_solver, 'progress_log', []), # B&B modunda incumbent / sınır geçmişi
+            'nodes_visited': csp_solver.search_stats.get('nodes_visited', 0), # Arama sayaçları
+            'backjumps': csp_solver.search_stats.get('backjumps', 0),
+            'nogood_hits': csp_solver.search_stats.get('nogood_hits', 0),
             'success': True
         }
     else:
@@ -124,15 +182,34 @@ def run_csp_optimization(drones, deliveries, no_fly_zones, graph):
             'delivery_count': 0, # Teslimat yapılmadı
             'delivery_rate': 0, # Teslimat oranı 0
             'execution_time': execution_time,
+            'nodes_visited': csp_solver.search_stats.get('nodes_visited', 0),
+            'backjumps': csp_solver.search_stats.get('backjumps', 0),
+            'nogood_hits': csp_solver.search_stats.get('nogood_hits', 0),
             'success': False # Başarısız işaretle
         }
     
     # Genetik Algoritma ile optimizasyon
-def run_genetic_algorithm(drones, deliveries, no_fly_zones, graph, generations=100):
+def run_genetic_algorithm(drones, deliveries, no_fly_zones, graph, generations=100, engine='object', n_workers=1,
+                          n_islands=1, migration_interval=10, crossover_operator='drone', memetic=False,
+                          stagnation_limit=None, adaptive_rates=False, restart_after=None,
+                          replacement='generational'):
     print("🧬 Genetic Algorithm çalıştırılıyor...") # Kullanıcıya bilgi ver
     start_time = time.time() # Algoritmanın çalışma süresini ölçmek için başlangıç zamanı alınır
     
-    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph) # Genetik algoritma nesnesi oluşturulur
+    # 'vectorized' motoru tüm popülasyonu NumPy dizisi olarak tek seferde değerlendirir
+    # Birden fazla ada istenirse her popülasyon ayrı süreçte evrilir ve periyodik göç yapılır
+    if n_islands > 1:
+        ga = IslandGeneticAlgorithm(drones, deliveries, no_fly_zones, graph, n_islands, migration_interval)
+    else:
+        ga_class = VectorizedGeneticAlgorithm if engine == 'vectorized' else GeneticAlgorithm
+        ga = ga_class(drones, deliveries, no_fly_zones, graph) # Genetik algoritma nesnesi oluşturulur
+    ga.n_workers = n_workers # Nesne motorunda fitness hesabı için süreç sayısı
+    ga.crossover_operator = crossover_operator # 'drone', 'ox' veya 'pmx'
+    ga.memetic = memetic # Drone rotalarını 2-opt / Or-opt ile sırala
+    ga.stagnation_limit = stagnation_limit # İyileşmeyen nesil sınırı (erken durdurma)
+    ga.adaptive_rates = adaptive_rates # Çeşitliliğe göre mutasyon / çaprazlama oranı
+    ga.restart_after = restart_after # Durgunlukta elitler dışını yenile
+    ga.replacement = replacement # 'generational' veya 'steady_state'
     
    # Teslimat sayısı fazlaysa popülasyon büyüklüğü artırılır ve mutasyon oranı yükseltilir
     if len(deliveries) > 30:
@@ -157,6 +234,17 @@ def run_genetic_algorithm(drones, deliveries, no_fly_zones, graph, generations=1
     print(f"   - Teslimat oranı: %{(delivery_count/len(deliveries)*100):.1f}")
     print(f"   - Fitness skoru: {best_individual.fitness:.2f}")
     print(f"   - Çalışma süresi: {execution_time:.3f} saniye")
+    if getattr(ga, 'stopped_generation', None) is not None:
+        print(f"   - Erken durdurma: {len(ga.fitness_history)}/{ga.generations} nesil")
+    if getattr(ga, 'restarts', 0):
+        print(f"   - Yeniden başlatma: {ga.restarts}")
+    cache_stats = ga.get_cache_stats() # Fitness önbelleği istatistikleri
+    if cache_stats['evaluations']:
+        # Paralel modda alt rota önbellekleri işçilerde tutulur
+        route_info = (f", alt rota isabeti %{cache_stats['route_cache_hit_rate']*100:.1f}"
+                      if n_workers <= 1 else f", {n_workers} süreç")
+        print(f"   - Fitness hesaplama: {cache_stats['evaluations']} "
+              f"(önbellek isabeti %{cache_stats['fitness_cache_hit_rate']*100:.1f}{route_info})")
     # Sonuç döndürülür
     return {
         'individual': best_individual, # En iyi çözüm
@@ -165,15 +253,27 @@ def run_genetic_algorithm(drones, deliveries, no_fly_zones, graph, generations=1
         'delivery_rate': delivery_count / len(deliveries),  # Teslimat yüzdesi
         'fitness_score': best_individual.fitness, # Fitness değeri (başarı puanı)
         'fitness_history': ga.fitness_history, # Her jenerasyondaki fitness değerleri
+        'cache_history': ga.cache_history, # Her jenerasyondaki önbellek isabet oranı
+        'cache_stats': cache_stats, # Hesaplanan / atlanan / önbellekten gelen fitness sayıları
+        'island_histories': getattr(ga, 'island_histories', {}), # Ada modelinde ada başına geçmiş
+        'diversity_history': getattr(ga, 'diversity_history', []), # Uyarlamalı modda çeşitlilik
+        'generations_run': len(ga.fitness_history), # Erken durdurmada çalışan nesil sayısı
         'execution_time': execution_time # Algoritmanın çalışma süresi
     }
 
  #Multi-Trip sistemi ile optimizasyon
-def run_multi_trip_optimization(drones, deliveries, no_fly_zones, graph):
+def run_multi_trip_optimization(drones, deliveries, no_fly_zones, graph, strategy='greedy', alns_time=0.0,
+                                order_stream=None, chargers=None, partial_charging=False):
     print("🔄 Multi-Trip Planner çalıştırılıyor...") # Kullanıcıya bilgi ver
     
     planner = MultiTripPlanner(drones, deliveries, no_fly_zones, graph)  # MultiTripPlanner nesnesi oluşturulur
-    results = planner.plan_multi_trip_delivery() # Çok turlu teslimat planlaması yapılır
+    planner.strategy = strategy # Tur kurma stratejisi
+    planner.alns_time_budget = alns_time # Planlamadan sonra ALNS iyileştirme süresi
+    planner.chargers_per_depot = chargers # Depo başına şarj cihazı (None = sınırsız)
+    planner.partial_charging = partial_charging # Sadece sıradaki turun ihtiyacı kadar şarj
+    # Sipariş akışı verilirse teslimatlar dosyadaki serbest bırakılma zamanlarında gelir (çevrimiçi mod)
+    orders = OrderStream.from_jsonl(order_stream) if order_stream else None
+    results = planner.plan_multi_trip_delivery(orders) # Çok turlu teslimat planlaması yapılır
     
     # Detaylı raporu yazdır
     planner.print_detailed_report()
@@ -331,8 +431,58 @@ def main():
                        help="Veri dosyası yolu")
     parser.add_argument("--algorithm", choices=['astar', 'csp', 'ga', 'multitrip', 'all'], 
                        default='all', help="Çalıştırılacak algoritma")
+    parser.add_argument("--csp-mode", choices=['fc', 'bnb', 'cbj', 'decompose'], default='fc',
+                       help="CSP arama modu: fc (ilk çözüm), bnb (en yüksek kapsama), cbj (backjumping), "
+                            "decompose (bölgesel paralel çözüm)")
+    parser.add_argument("--csp-lazy", action="store_true",
+                       help="CSP domain'lerini arama sırasında tembel üret")
+    parser.add_argument("--csp-max-set-size", type=int, default=3,
+                       help="CSP'de drone başına en fazla teslimat (3'ten büyükse tembel domain)")
+    parser.add_argument("--csp-require-active", action="store_true",
+                       help="cbj modunda her drone en az bir teslimat almalı (boşta kalma yasak); bu olmadan "
+                            "arama hiç başarısız olmadığından backjump / nogood sayaçları sıfır kalır")
+    parser.add_argument("--time-limit", type=float, default=None,
+                       help="CSP arama süresi sınırı (saniye); bnb bu sürede bulunan en iyi çözümü verir. "
+                            "decompose modunda sınır küme başınadır (toplam süre küme sayısıyla artabilir)")
     parser.add_argument("--generations", type=int, default=100, 
                        help="GA için nesil sayısı")
+    parser.add_argument("--ga-engine", choices=['object', 'vectorized'], default='object',
+                       help="GA motoru: object (Individual listeleri) veya vectorized (NumPy popülasyon dizisi)")
+    parser.add_argument("--ga-workers", type=int, default=1,
+                       help="GA fitness hesabı için süreç sayısı (object motoru)")
+    parser.add_argument("--ga-crossover", choices=['drone', 'ox', 'pmx'], default='drone',
+                       help="GA çaprazlama operatörü: drone listesi takası veya dev tur üzerinde OX/PMX")
+    parser.add_argument("--ga-memetic", action="store_true",
+                       help="Memetik GA: drone rotalarını 2-opt / Or-opt yerel aramayla sırala")
+    parser.add_argument("--ga-stagnation", type=int, default=None,
+                       help="GA: bu kadar nesil iyileşme olmazsa erken dur")
+    parser.add_argument("--ga-adaptive", action="store_true",
+                       help="GA: mutasyon/çaprazlama oranlarını popülasyon çeşitliliğine göre ayarla")
+    parser.add_argument("--ga-restart", type=int, default=None,
+                       help="GA: bu kadar nesil iyileşme olmazsa elitler dışındaki popülasyonu yenile")
+    parser.add_argument("--ga-replacement", choices=['generational', 'steady_state'], default='generational',
+                       help="GA yenileme: tüm nesli yeniden kur veya yavruları en kötülerin yerine yerleştir")
+    parser.add_argument("--ga-islands", type=int, default=1,
+                       help="Ada modeli GA: ayrı süreçlerde evrilen popülasyon sayısı")
+    parser.add_argument("--ga-migration-interval", type=int, default=10,
+                       help="Ada modelinde kaç nesilde bir en iyi bireylerin göç edeceği")
+    parser.add_argument("--multitrip-strategy", choices=['greedy', 'savings', 'insertion'], default='greedy',
+                       help="Multi-trip tur kurma: greedy (öncelik sırası), savings (Clarke-Wright tasarruf) "
+                            "veya insertion (zaman pencereli ekleme)")
+    parser.add_argument("--multitrip-alns", type=float, default=0.0, metavar="SANIYE",
+                       help="Multi-trip planını verilen süre boyunca ALNS ile iyileştir (0 = kapalı)")
+    parser.add_argument("--order-stream", metavar="DOSYA",
+                       help="Multi-trip için teslimatları JSONL sipariş akışından serbest bırakılma zamanlarında al")
+    parser.add_argument("--chargers", type=int, default=None, metavar="N",
+                       help="Multi-trip'te depo başına şarj cihazı sayısı; cihazlar doluyken drone'lar kuyrukta bekler")
+    parser.add_argument("--partial-charging", action="store_true",
+                       help="Multi-trip'te tam şarj yerine sadece sıradaki turun ihtiyacı kadar şarj et")
+    parser.add_argument("--log-level", choices=['debug', 'info', 'warning'], default='info',
+                       help="Planlayıcı ve GA olay seviyesi (debug: paket bazında ayrıntılı mesajlar)")
+    parser.add_argument("--quiet", action="store_true",
+                       help="Planlayıcı ve GA ilerleme mesajlarını konsola yazma (sadece uyarılar)")
+    parser.add_argument("--trace-file", default=None,
+                       help="Olayları JSONL olarak bu dosyaya yaz (her satır bir olay)")
     parser.add_argument("--output", default="results", 
                        help="Çıktı dizini")
     parser.add_argument("--visualize", action="store_true", 
@@ -341,6 +491,28 @@ def main():
                        help="Rastgele veri oluştur")
     
     args = parser.parse_args() # Komut satırı argümanlarını ayrıştır
+    if args.ga_engine == 'vectorized':
+        # Vektörel motor sadece temel GA döngüsünü çalıştırır; nesne motoruna özgü seçenekler yok sayılmaz, reddedilir
+        object_only = ['ga_workers', 'ga_crossover', 'ga_memetic', 'ga_stagnation', 'ga_adaptive',
+                       'ga_restart', 'ga_replacement', 'ga_islands']
+        unsupported = ['--' + dest.replace('_', '-') for dest in object_only
+                       if getattr(args, dest) != parser.get_default(dest)]
+        if unsupported:
+            parser.error(f"--ga-engine vectorized şu seçenekleri desteklemiyor: {', '.join(unsupported)}")
+    if args.ga_islands > 1:
+        # Adalar ayrı süreçlerde evrilir (süreç içi fitness havuzu yok) ve göç için hepsi tüm nesilleri çalıştırır
+        unsupported = [flag for flag, value in (('--ga-stagnation', args.ga_stagnation is not None),
+                                                ('--ga-workers', args.ga_workers != 1)) if value]
+        if unsupported:
+            parser.error(f"--ga-islands şu seçeneklerle kullanılamaz: {', '.join(unsupported)}")
+    if args.multitrip_alns > 0:
+        # ALNS turları sınırsız cihaz ve tam şarjla, tüm teslimatlar baştan biliniyormuş gibi yeniden zamanlar
+        unsupported = [flag for flag, value in (('--chargers', args.chargers is not None),
+                                                ('--partial-charging', args.partial_charging),
+                                                ('--order-stream', args.order_stream is not None)) if value]
+        if unsupported:
+            parser.error(f"--multitrip-alns şu seçeneklerle kullanılamaz: {', '.join(unsupported)}")
+    event_log.configure(level=args.log_level, quiet=args.quiet, trace_file=args.trace_file)
     
     print_header()  # Kullanıcıya başlık göster
     
@@ -386,14 +558,22 @@ def main():
         results['A*'] = run_astar_optimization(graph, drones, deliveries)
         
     if args.algorithm in ['csp', 'all']:
-        results['CSP'] = run_csp_optimization(drones, deliveries, no_fly_zones, graph)
+        results['CSP'] = run_csp_optimization(drones, deliveries, no_fly_zones, graph,
+                                              args.csp_mode, args.csp_lazy, args.csp_max_set_size,
+                                              args.time_limit, args.csp_require_active)
         
     if args.algorithm in ['ga', 'all']:
         results['GA'] = run_genetic_algorithm(drones, deliveries, no_fly_zones, 
-                                            graph, args.generations)
+                                            graph, args.generations, args.ga_engine,
+                                            args.ga_workers, args.ga_islands, args.ga_migration_interval,
+                                            args.ga_crossover, args.ga_memetic, args.ga_stagnation,
+                                            args.ga_adaptive, args.ga_restart, args.ga_replacement)
     
     if args.algorithm in ['multitrip', 'all']:
-        results['Multi-Trip'] = run_multi_trip_optimization(drones, deliveries, no_fly_zones, graph)
+        results['Multi-Trip'] = run_multi_trip_optimization(drones, deliveries, no_fly_zones, graph,
+                                                            args.multitrip_strategy, args.multitrip_alns,
+                                                            args.order_stream, args.chargers,
+                                                            args.partial_charging)
     
     # Karşılaştırma (birden çok algoritma varsa)
     if len(results) > 1:
@@ -426,6 +606,8 @@ def main():
         print("🖼️  Grafik dosyalarını görmek için:")
         print(f"   - {args.output}/ klasörünü açın")
         print("   - .png dosyalarını çift tıklayın")
+    
+    event_log.close() # İz dosyasını kapat
 
 if __name__ == "__main__": # Script doğrudan çalıştırıldığında main() tetiklenir
     main()
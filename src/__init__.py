@@ -14,9 +14,13 @@ from .drone import Drone # Drone sınıfı
 from .delivery_point import DeliveryPoint # Teslimat noktası sınıfı
 from .no_fly_zone import NoFlyZone # Uçuşa yasak alan sınıfı
 from .graph_builder import DeliveryGraph   # Teslimat grafı oluşturucu
+from .scenario_index import ScenarioIndex # Kimlik tabanlı senaryo indeksi
 from .astar import AStarPathfinder  # A* algoritması sınıfı
 from .csp_solver import CSPSolver # CSP problemi çözücü sınıf
+from .csp_decomposition import DecomposedCSPSolver # Bölgesel ayrıştırmalı paralel CSP
 from .genetic_algorithm import GeneticAlgorithm # Genetik algoritma sınıfı
+from .vectorized_ga import VectorizedGeneticAlgorithm # NumPy tabanlı GA
+from .island_ga import IslandGeneticAlgorithm # Ada modeli GA
 from .data_loader import DataLoader  # Veri yükleme sınıfı
 from .data_generator import DataGenerator # Rastgele veri üretici
 from .visualizer import Visualizer # Görselleştirme sınıfı
@@ -26,9 +30,13 @@ __all__ = [
     'DeliveryPoint',  # Teslimat noktası
     'NoFlyZone',  # Uçuşa yasak alanlar
     'DeliveryGraph', # Graf yapısı
+    'ScenarioIndex', # Senaryo indeksi
     'AStarPathfinder',  # A* algoritması
     'CSPSolver', # CSP çözücü
+    'DecomposedCSPSolver', # Paralel CSP çözücü
     'GeneticAlgorithm',  # Genetik algoritma
+    'VectorizedGeneticAlgorithm', # Vektörel genetik algoritma
+    'IslandGeneticAlgorithm', # Ada modeli genetik algoritma
     'DataLoader',  # Veri yükleyici
     'DataGenerator', # Veri oluşturucu
     'Visualizer'  # Grafik çizici
@@ -0,0 +1,491 @@
+"""
+ALNS İyileştirici - Çoklu tur planını uyarlamalı geniş komşuluk aramasıyla (ALNS) iyileştirir
+Bu dosya, planlayıcının ürettiği drone turlarını alır ve her iterasyonda bir yıkım operatörüyle (rastgele, en maliyetli, ilişkili/Shaw, no-fly zone'a yakın) birkaç teslimatı turlarından çıkarıp bir onarım operatörüyle (açgözlü, regret-2, regret-3) yeniden ekler. Operatörler başarılarına göre uyarlanan ağırlıklarla rulet tekerleğinden seçilir, yeni çözüm benzetimli tavlamayla kabul edilir ve arama süre bütçesi dolunca durur. Her drone'un zaman çizelgesi (şarj, no-fly zone beklemesi, varış zamanları) ayrı tutulur; bir hamle sadece dokunduğu drone'ları yeniden değerlendirir ve ekleme adayları önbellekteki gevşeklik (slack) sonek dizileriyle O(1) puanlanır.
+"""
+import math # Mesafe ve tavlama olasılığı
+import random # Operatör seçimi ve rastgele yıkım
+import time # Süre bütçesi
+import numpy as np # Komşu ve ilişki hesapları
+from typing import Dict, List, Optional, Tuple
+from .drone import Drone # Drone sınıfı
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+from .no_fly_zone import NoFlyZone # Uçuşa yasak bölge sınıfı
+from .trip_sequence import TripSequence # Tur enerjisi ve O(1) ekleme maliyeti
+
+Option = Tuple[float, int, Optional[int], int] # (maliyet, drone kimliği, tur sırası veya yeni tur için None, konum)
+
+class DroneSchedule:
+    """Bir drone'un tur dizisi ve değerlendirilmiş zaman çizelgesi; hamleler mevcut olanı değiştirmez, yenisini kurar"""
+
+    def __init__(self, drone: Drone, trips: List[TripSequence]):
+        self.drone = drone
+        self.trips = trips # Uçuş sırasıyla turlar
+        self.ready = [] # Tur öncesi drone'un boşa çıktığı zaman (şarjdan önce)
+        self.battery_before = [] # Tur öncesi batarya (şarjdan önce)
+        self.starts = [] # Her turun kalkış zamanı (dakika)
+        self.charged = [] # Turdan önce şarj edildi mi
+        self.arrivals = [] # Tur başına durak varış zamanları
+        self.offsets = [] # Turun ilk durağının düzleştirilmiş sırası
+        self.trip_lateness = [] # Tur başına toplam gecikme (dakika)
+        self.trip_violations = [] # Tur başına tolerans veya ufuk ihlali
+        self.index_of = {} # teslimat kimliği -> (tur sırası, konum)
+        self.slack = [] # Durak başına gevşeklik: hedefi aşmadan kaydırılabileceği süre (dakika)
+        self.late = [] # Durak pencere bitişini geçti mi (1/0)
+        self.suffix_slack = [] # Düzleştirilmiş sıra i'den itibaren en küçük gevşeklik
+        self.suffix_late = [] # Düzleştirilmiş sıra i'den itibaren geç kalan durak sayısı
+        self.energy = 0.0 # Toplam tur enerjisi
+        self.lateness = 0.0 # Toplam gecikme (dakika)
+        self.violations = 0 # Gecikme toleransını veya zaman ufkunu aşan durak sayısı
+        self.end_time = 0 # Son turun bitişi
+        self.battery = drone.max_battery # Son turdan sonra kalan batarya
+        self.cost = 0.0
+
+
+class ALNSImprover:
+    """Drone turları üzerinde uyarlamalı geniş komşuluk araması"""
+
+    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint], no_fly_zones: List[NoFlyZone],
+                 late_tolerance: int = 120, max_stops: int = 8, charge_time: int = 30,
+                 battery_threshold: float = 0.3, time_horizon: int = 480, seed: Optional[int] = None):
+        self.drones = {drone.id: drone for drone in drones}
+        self.deliveries = deliveries
+        self.by_id = {delivery.id: delivery for delivery in deliveries}
+        self.late_tolerance = late_tolerance # Pencere bitişinden sonra kabul edilen gecikme
+        self.max_stops = max_stops # Tur başına en fazla teslimat
+        self.charge_time = charge_time # Bir şarjın süresi (dakika, batarya dolar)
+        self.battery_threshold = battery_threshold # Bu oranın altında tur öncesi şarj
+        self.time_horizon = time_horizon # Bu zamandan sonra tur başlatılmaz
+        self.random = random.Random(seed)
+
+        # Amaç: enerji + late_penalty * gecikme dakikası + completion_penalty * drone bitiş zamanı
+        #       + unserved_penalty * (teslim edilmeyen veya toleransı aşan)
+        self.late_penalty = 100.0
+        self.completion_penalty = 100.0 # Turları sıkıştırıp bitişi uzatan (saatlik teslimatı düşüren) planlar cezalanır
+        self.unserved_penalty = 1e5
+        self.neighbour_count = 10 # Ekleme için bakılan en yakın teslimat sayısı (turları aday olur)
+        self.depot_count = 3 # Yeni tur için bakılan en yakın depolu drone sayısı
+        self.removal_range = (0.01, 0.04) # Bir iterasyonda çıkarılan teslimat oranı
+        self.max_removal = 10 # Bir iterasyonda çıkarılan en fazla teslimat
+        self.bank_sample = 3 # Her onarımda denenen teslim edilmemiş teslimat sayısı
+        self.segment = 50 # Operatör ağırlıklarının güncellendiği iterasyon aralığı
+        self.reaction = 0.2 # Ağırlık güncellemesinde yeni puanın payı
+        self.scores = (33, 9, 13) # Yeni en iyi, mevcuttan iyi, kötü ama kabul edildi
+
+        # Her teslimatın içinde kaldığı bölgeler ve en yakın komşuları bir kez hesaplanır
+        self.zones = no_fly_zones
+        self.zones_of = {delivery.id: [zone for zone in no_fly_zones if zone.point_in_polygon(delivery.pos)]
+                         for delivery in deliveries}
+        self.index = {delivery.id: i for i, delivery in enumerate(deliveries)}
+        self.positions = np.array([d.pos for d in deliveries], dtype=float).reshape(-1, 2)
+        self.deadlines = np.array([d.time_window[1] for d in deliveries], dtype=float)
+        self.weights = np.array([d.weight for d in deliveries], dtype=float)
+        self.neighbours = self.nearest_neighbours()
+        self.neighbour_ids = [{deliveries[j].id for j in row} for row in self.neighbours]
+        depots = np.array([drone.start_pos for drone in drones], dtype=float).reshape(-1, 2)
+        depot_distance = ((self.positions[:, None, :] - depots[None, :, :]) ** 2).sum(axis=2)
+        self.near_drones = [[drones[j].id for j in row[:self.depot_count]]
+                            for row in np.argsort(depot_distance, axis=1, kind='stable')]
+
+        self.destroy_operators = [self.random_removal, self.worst_removal, self.shaw_removal]
+        if no_fly_zones:
+            self.destroy_operators.append(self.zone_removal)
+        self.repair_operators = [self.greedy_repair, self.regret2_repair, self.regret3_repair]
+        self.iterations = 0 # Son aramadaki iterasyon sayısı
+        self.accepted = 0 # Kabul edilen hamle sayısı
+        self.improvements = 0 # Yeni en iyi çözüm sayısı
+
+    def nearest_neighbours(self, block_size: int = 512) -> np.ndarray:
+        """Her teslimatın en yakın neighbour_count teslimatının sırası (satır blokları halinde)"""
+        count = len(self.deliveries)
+        k = min(self.neighbour_count, count - 1)
+        if k <= 0:
+            return np.zeros((count, 0), dtype=int)
+        rows = []
+        for start in range(0, count, block_size):
+            block = slice(start, min(start + block_size, count))
+            distance = ((self.positions[block, None, :] - self.positions[None, :, :]) ** 2).sum(axis=2)
+            distance[np.arange(distance.shape[0]), np.arange(block.start, block.stop)] = np.inf
+            top = np.argpartition(distance, k - 1, axis=1)[:, :k]
+            rows.append(np.take_along_axis(top, np.argsort(np.take_along_axis(distance, top, axis=1), axis=1), axis=1))
+        return np.concatenate(rows)
+
+    # --- Değerlendirme ---
+
+    def zone_clear_time(self, stops: List[DeliveryPoint], start: float) -> float:
+        """Duraklardan biri aktif no-fly zone içindeyse bölgeler kapanana kadar bekle"""
+        while True:
+            blocking = [zone.active_time[1] for delivery in stops for zone in self.zones_of[delivery.id]
+                        if zone.active_time[0] <= start < zone.active_time[1]]
+            if not blocking:
+                return start
+            start = max(blocking)
+
+    def schedule(self, drone: Drone, trips: List[TripSequence], previous: Optional[DroneSchedule] = None,
+                 unchanged: int = 0) -> DroneSchedule:
+        """Turları sırayla uçur: gerekirse şarj et, bölge kapanmasını bekle, varışları ve maliyeti hesapla
+
+        previous verilirse ilk `unchanged` turun zaman çizelgesi değişmediği için oradan kopyalanır;
+        simülasyon ilk değişen turdan devam eder.
+        """
+        schedule = DroneSchedule(drone, trips)
+        speed = drone.speed * 60
+        now, battery = 0, drone.max_battery
+        if previous is not None and unchanged > 0:
+            cut = previous.offsets[unchanged] if unchanged < len(previous.trips) else len(previous.slack)
+            for name in ('ready', 'battery_before', 'starts', 'charged', 'arrivals', 'offsets',
+                         'trip_lateness', 'trip_violations'):
+                setattr(schedule, name, getattr(previous, name)[:unchanged])
+            schedule.slack, schedule.late = previous.slack[:cut], previous.late[:cut]
+            schedule.index_of = {delivery_id: place for delivery_id, place in previous.index_of.items()
+                                 if place[0] < unchanged}
+            if unchanged < len(previous.trips):
+                now, battery = previous.ready[unchanged], previous.battery_before[unchanged]
+            else:
+                now, battery = previous.end_time, previous.battery
+        else:
+            unchanged = 0
+        slack, late = schedule.slack, schedule.late
+
+        for trip_index in range(unchanged, len(trips)):
+            trip = trips[trip_index]
+            schedule.ready.append(now)
+            schedule.battery_before.append(battery)
+            charged = battery < drone.max_battery * self.battery_threshold or battery < trip.energy
+            if charged:
+                now += self.charge_time
+                battery = drone.max_battery
+            now = self.zone_clear_time(trip.stops, now)
+            arrivals = trip.arrival_times(now)
+            schedule.starts.append(now)
+            schedule.charged.append(charged)
+            schedule.arrivals.append(arrivals)
+            schedule.offsets.append(len(slack))
+            lateness, violations = 0.0, 0
+            for position, (delivery, arrival) in enumerate(zip(trip.stops, arrivals)):
+                schedule.index_of[delivery.id] = (trip_index, position)
+                limit = delivery.time_window[1] + self.late_tolerance
+                if arrival > limit or now >= self.time_horizon:
+                    violations += 1 # Zaten ihlal: gecikmesi artsa da ceza değişmez
+                    slack.append(math.inf)
+                    late.append(0)
+                else:
+                    slack.append(min(limit - arrival, self.time_horizon - now - 1e-9))
+                    late.append(1 if arrival > delivery.time_window[1] else 0)
+                    lateness += max(0.0, arrival - delivery.time_window[1])
+            schedule.trip_lateness.append(lateness)
+            schedule.trip_violations.append(violations)
+            battery -= trip.energy
+            now += int(trip.distance / speed + trip.service_time * len(trip)) # execute_trip ile aynı süre
+
+        schedule.end_time = now
+        schedule.battery = battery
+        schedule.energy = sum(trip.energy for trip in trips)
+        schedule.lateness = sum(schedule.trip_lateness)
+        schedule.violations = sum(schedule.trip_violations)
+        suffix_slack = schedule.suffix_slack = [math.inf] * (len(slack) + 1)
+        suffix_late = schedule.suffix_late = [0] * (len(slack) + 1)
+        for i in range(len(slack) - 1, -1, -1):
+            suffix_slack[i] = slack[i] if slack[i] < suffix_slack[i + 1] else suffix_slack[i + 1]
+            suffix_late[i] = late[i] + suffix_late[i + 1]
+        schedule.cost = (schedule.energy + self.late_penalty * schedule.lateness +
+                         self.completion_penalty * schedule.end_time + self.unserved_penalty * schedule.violations)
+        return schedule
+
+    # --- Çözüm durumu: drone -> zaman çizelgesi, teslimat -> drone, bekleyenler ---
+
+    def make_state(self, schedules: Dict[int, DroneSchedule], bank: List[DeliveryPoint]) -> Dict:
+        location = {delivery_id: drone_id for drone_id, schedule in schedules.items()
+                    for delivery_id in schedule.index_of}
+        state = {'schedules': schedules, 'location': location, 'bank': bank}
+        state['cost'] = sum(s.cost for s in schedules.values()) + self.unserved_penalty * len(bank)
+        return state
+
+    def copy_state(self, state: Dict) -> Dict:
+        """Zaman çizelgeleri değiştirilmediği için sığ kopya yeterlidir"""
+        return {'schedules': dict(state['schedules']), 'location': dict(state['location']),
+                'bank': list(state['bank']), 'cost': state['cost']}
+
+    def replace(self, state: Dict, drone_id: int, trips: List[TripSequence], unchanged: int):
+        """Drone'un turlarını değiştir; sadece bu drone, ilk değişen turundan itibaren yeniden değerlendirilir"""
+        old = state['schedules'][drone_id]
+        new = self.schedule(old.drone, [trip for trip in trips if len(trip)], old, unchanged)
+        state['schedules'][drone_id] = new
+        state['cost'] += new.cost - old.cost
+        for delivery_id in new.index_of:
+            state['location'][delivery_id] = drone_id
+
+    # --- Ekleme maliyetleri ---
+
+    def insertion_option(self, schedule: DroneSchedule, trip_index: int, delivery: DeliveryPoint) -> Optional[Option]:
+        """Teslimatın tura en ucuz eklenmesi: enerji farkı + tahmini gecikme cezası (konum başına O(1))
+
+        Eklemenin sonraki durakları ittiği süre, sonek gevşekliğinden büyükse ekleme reddedilir; sonraki
+        turlardaki şarj kararlarının değişmesi tahmine katılmaz, kesin maliyeti schedule() hesaplar.
+        """
+        drone, trip = schedule.drone, schedule.trips[trip_index]
+        if len(trip) >= self.max_stops or trip.total_weight + delivery.weight > drone.max_weight:
+            return None
+        speed = drone.speed * 60
+        start, arrivals = schedule.starts[trip_index], schedule.arrivals[trip_index]
+        offset = schedule.offsets[trip_index]
+        deadline = delivery.time_window[1]
+        best = None
+        for position in range(len(trip) + 1):
+            energy_delta = trip.insertion_cost(delivery, position)
+            if trip.energy + energy_delta > drone.max_battery:
+                continue
+            a, b = trip.positions[position], trip.positions[position + 1]
+            to_u = math.dist(a, delivery.pos)
+            departure = start if position == 0 else arrivals[position - 1] + trip.service_time
+            arrival = departure + to_u / speed
+            if arrival > deadline + self.late_tolerance:
+                continue
+            shift = (to_u + math.dist(delivery.pos, b) - trip.leg_distance[position]) / speed + trip.service_time
+            if shift > schedule.suffix_slack[offset + position]:
+                continue
+            cost = energy_delta + self.late_penalty * (max(0.0, arrival - deadline) +
+                                                        shift * schedule.suffix_late[offset + position])
+            if best is None or cost < best[0]:
+                best = (cost, drone.id, trip_index, position)
+        return best
+
+    def new_trip_option(self, schedule: DroneSchedule, delivery: DeliveryPoint) -> Optional[Option]:
+        """Teslimat için drone'un son turundan sonra yeni bir tur açma maliyeti"""
+        drone = schedule.drone
+        if delivery.weight > drone.max_weight:
+            return None
+        distance = math.dist(drone.start_pos, delivery.pos)
+        energy = (drone.calculate_energy_consumption(distance, delivery.weight) +
+                  drone.calculate_energy_consumption(distance, 0))
+        if energy > drone.max_battery:
+            return None
+        start = schedule.end_time
+        if schedule.battery < drone.max_battery * self.battery_threshold or schedule.battery < energy:
+            start += self.charge_time
+        start = self.zone_clear_time([delivery], start)
+        arrival = start + distance / (drone.speed * 60)
+        if start >= self.time_horizon or arrival > delivery.time_window[1] + self.late_tolerance:
+            return None
+        return (energy + self.late_penalty * max(0.0, arrival - delivery.time_window[1]), drone.id, None, 0)
+
+    def candidate_drones(self, state: Dict, delivery: DeliveryPoint) -> set:
+        """Ekleme için bakılan drone'lar: komşu teslimatları taşıyanlar ve deposu en yakın olanlar"""
+        index = self.index[delivery.id]
+        drones = set(self.near_drones[index])
+        for neighbour_id in self.neighbour_ids[index]:
+            if neighbour_id in state['location']:
+                drones.add(state['location'][neighbour_id])
+        return drones
+
+    def drone_options(self, state: Dict, delivery: DeliveryPoint, drone_id: int) -> List[Option]:
+        """Teslimatın bu drone'daki ekleme seçenekleri: komşularının bulunduğu turlar ve yeni tur"""
+        schedule = state['schedules'][drone_id]
+        trip_indices = set()
+        for neighbour in self.neighbours[self.index[delivery.id]]:
+            neighbour_id = self.deliveries[neighbour].id
+            if state['location'].get(neighbour_id) == drone_id:
+                trip_indices.add(schedule.index_of[neighbour_id][0])
+        options = [self.insertion_option(schedule, trip_index, delivery) for trip_index in trip_indices]
+        options.append(self.new_trip_option(schedule, delivery))
+        return [option for option in options if option is not None]
+
+    def insert(self, state: Dict, delivery: DeliveryPoint, option: Option):
+        """Seçeneği uygula: tur kopyalanır, teslimat eklenir, drone yeniden değerlendirilir"""
+        _, drone_id, trip_index, position = option
+        schedule = state['schedules'][drone_id]
+        trips = list(schedule.trips)
+        if trip_index is None:
+            trip_index = len(trips)
+            trips.append(TripSequence(schedule.drone, [delivery]))
+        else:
+            trip = TripSequence(schedule.drone, trips[trip_index].stops)
+            trip.insert(delivery, position)
+            trips[trip_index] = trip
+        self.replace(state, drone_id, trips, trip_index)
+
+    def remove(self, state: Dict, delivery_ids: List[int]) -> List[DeliveryPoint]:
+        """Teslimatları turlarından çıkar; boş kalan turlar silinir"""
+        by_drone: Dict[int, List[int]] = {}
+        for delivery_id in delivery_ids:
+            by_drone.setdefault(state['location'].pop(delivery_id), []).append(delivery_id)
+        for drone_id, removed in by_drone.items():
+            schedule = state['schedules'][drone_id]
+            removed = set(removed)
+            touched = {schedule.index_of[delivery_id][0] for delivery_id in removed}
+            trips = [TripSequence(schedule.drone, [d for d in trip.stops if d.id not in removed])
+                     if trip_index in touched else trip for trip_index, trip in enumerate(schedule.trips)]
+            self.replace(state, drone_id, trips, min(touched))
+        return [self.by_id[delivery_id] for delivery_id in delivery_ids]
+
+    # --- Yıkım operatörleri ---
+
+    def removal_count(self, state: Dict) -> int:
+        served = len(state['location'])
+        low, high = self.removal_range
+        return max(1, min(self.max_removal, served, int(served * self.random.uniform(low, high))))
+
+    def random_removal(self, state: Dict, count: int) -> List[int]:
+        """Rastgele teslimatlar"""
+        return self.random.sample(list(state['location']), count)
+
+    def worst_removal(self, state: Dict, count: int) -> List[int]:
+        """Turuna en çok mesafe ve gecikme ekleyen teslimatlar (rastgeleleştirilmiş sırayla)"""
+        gains = []
+        for delivery_id, drone_id in state['location'].items():
+            schedule = state['schedules'][drone_id]
+            trip_index, position = schedule.index_of[delivery_id]
+            trip = schedule.trips[trip_index]
+            a, u, b = trip.positions[position], trip.positions[position + 1], trip.positions[position + 2]
+            arrival = schedule.arrivals[trip_index][position]
+            detour = math.dist(a, u) + math.dist(u, b) - math.dist(a, b)
+            lateness = max(0.0, arrival - self.by_id[delivery_id].time_window[1])
+            gains.append((detour * 10 + self.late_penalty * lateness, delivery_id))
+        gains.sort(reverse=True)
+        return self.randomized_pick([delivery_id for _, delivery_id in gains], count, power=3)
+
+    def shaw_removal(self, state: Dict, count: int) -> List[int]:
+        """Rastgele bir teslimata konum, bitiş zamanı ve ağırlık olarak en çok benzeyenler"""
+        served = np.array([self.index[delivery_id] for delivery_id in state['location']])
+        seed = served[self.random.randrange(len(served))]
+        distance = np.sqrt(((self.positions[served] - self.positions[seed]) ** 2).sum(axis=1))
+        relatedness = (distance / max(distance.max(), 1e-9) +
+                       np.abs(self.deadlines[served] - self.deadlines[seed]) / max(np.ptp(self.deadlines[served]), 1e-9) +
+                       np.abs(self.weights[served] - self.weights[seed]) / max(np.ptp(self.weights[served]), 1e-9))
+        ordered = [self.deliveries[i].id for i in served[np.argsort(relatedness, kind='stable')]]
+        return self.randomized_pick(ordered, count, power=6)
+
+    def zone_removal(self, state: Dict, count: int) -> List[int]:
+        """Rastgele bir no-fly zone'un merkezine en yakın teslimatlar (bölge açıldığında beklemeyi azaltmak için)"""
+        zone = self.random.choice(self.zones)
+        center = np.array(zone.coordinates, dtype=float).mean(axis=0)
+        served = np.array([self.index[delivery_id] for delivery_id in state['location']])
+        distance = ((self.positions[served] - center) ** 2).sum(axis=1)
+        return [self.deliveries[i].id for i in served[np.argsort(distance, kind='stable')[:count]]]
+
+    def randomized_pick(self, ordered: List[int], count: int, power: float) -> List[int]:
+        """Sıralı listeden öne yakın elemanları tercih ederek seç (y^power indeksi)"""
+        ordered = list(ordered)
+        picked = []
+        while ordered and len(picked) < count:
+            picked.append(ordered.pop(int(self.random.random() ** power * len(ordered))))
+        return picked
+
+    # --- Onarım operatörleri ---
+
+    def greedy_repair(self, state: Dict, pending: List[DeliveryPoint]):
+        """Her adımda en ucuz eklemeyi yap"""
+        self.regret_repair(state, pending, 1)
+
+    def regret2_repair(self, state: Dict, pending: List[DeliveryPoint]):
+        self.regret_repair(state, pending, 2)
+
+    def regret3_repair(self, state: Dict, pending: List[DeliveryPoint]):
+        self.regret_repair(state, pending, 3)
+
+    def regret_repair(self, state: Dict, pending: List[DeliveryPoint], k: int):
+        """Regret-k ekleme: en iyi k seçeneği arasındaki fark en büyük olan teslimat önce eklenir
+
+        Seçenekler aday drone başına saklanır; bir ekleme sonrası sadece değişen drone'un seçenekleri, o drone'a
+        bakan veya komşusu o drone'a eklenen teslimatlar için yeniden hesaplanır. Yeri bulunamayanlar bekleyenlere döner.
+        """
+        options = {delivery.id: {drone_id: self.drone_options(state, delivery, drone_id)
+                                 for drone_id in self.candidate_drones(state, delivery)} for delivery in pending}
+        pending = list(pending)
+        while pending:
+            best_key, best_delivery, best_option = None, None, None
+            for delivery in pending:
+                costs = sorted((option for drone_options in options[delivery.id].values() for option in drone_options),
+                               key=lambda option: option[0])
+                if not costs:
+                    continue
+                if k == 1:
+                    key = -costs[0][0]
+                else:
+                    key = sum((costs[i][0] if i < len(costs) else 1e12) - costs[0][0] for i in range(1, k))
+                if best_key is None or key > best_key:
+                    best_key, best_delivery, best_option = key, delivery, costs[0]
+            if best_delivery is None:
+                break
+            self.insert(state, best_delivery, best_option)
+            pending.remove(best_delivery)
+            drone_id = best_option[1]
+            for delivery in pending:
+                if drone_id in options[delivery.id] or \
+                   best_delivery.id in self.neighbour_ids[self.index[delivery.id]]:
+                    options[delivery.id][drone_id] = self.drone_options(state, delivery, drone_id)
+        state['bank'].extend(pending)
+        state['cost'] += self.unserved_penalty * len(pending)
+
+    # --- Arama ---
+
+    def roulette(self, weights: List[float]) -> int:
+        return self.random.choices(range(len(weights)), weights=weights)[0]
+
+    def run(self, drone_trips: Dict[int, List[List[DeliveryPoint]]], time_budget: float,
+            max_iterations: Optional[int] = None) -> Dict[int, DroneSchedule]:
+        """Verilen turları time_budget saniye (veya max_iterations) boyunca iyileştir; en iyi çizelgeleri döndür"""
+        schedules = {drone_id: self.schedule(drone, [TripSequence(drone, stops)
+                                                     for stops in drone_trips.get(drone_id, []) if stops])
+                     for drone_id, drone in self.drones.items()}
+        served = {delivery_id for schedule in schedules.values() for delivery_id in schedule.index_of}
+        current = self.make_state(schedules, [d for d in self.deliveries if d.id not in served])
+        best = self.copy_state(current)
+        self.initial_cost = current['cost']
+
+        destroy_weights = [1.0] * len(self.destroy_operators)
+        repair_weights = [1.0] * len(self.repair_operators)
+        destroy_scores, destroy_uses = [0.0] * len(destroy_weights), [0] * len(destroy_weights)
+        repair_scores, repair_uses = [0.0] * len(repair_weights), [0] * len(repair_weights)
+
+        # Başlangıç sıcaklığı: enerjinin %5'i kadar kötü bir çözüm 0.5 olasılıkla kabul edilir
+        energy = sum(s.energy for s in schedules.values())
+        start_temperature = max(1.0, 0.05 * energy / math.log(2))
+        self.iterations = self.accepted = self.improvements = 0
+        started = time.perf_counter()
+
+        while current['location'] or current['bank']:
+            elapsed = time.perf_counter() - started
+            if elapsed >= time_budget or (max_iterations is not None and self.iterations >= max_iterations):
+                break
+            temperature = start_temperature * 0.001 ** (elapsed / time_budget)
+            destroy, repair = self.roulette(destroy_weights), self.roulette(repair_weights)
+
+            candidate = self.copy_state(current)
+            removed = self.remove(candidate, self.destroy_operators[destroy](candidate, self.removal_count(candidate))) \
+                if candidate['location'] else []
+            # Teslim edilmemiş teslimatlardan bir örnek de yeniden eklenmeye çalışılır
+            sample = self.random.sample(candidate['bank'], min(self.bank_sample, len(candidate['bank'])))
+            for delivery in sample:
+                candidate['bank'].remove(delivery)
+            candidate['cost'] -= self.unserved_penalty * len(sample)
+            self.repair_operators[repair](candidate, removed + sample)
+
+            score = 0
+            if candidate['cost'] < best['cost'] - 1e-9:
+                best, score = self.copy_state(candidate), self.scores[0]
+                self.improvements += 1
+            elif candidate['cost'] < current['cost'] - 1e-9:
+                score = self.scores[1]
+            elif self.random.random() < math.exp(-(candidate['cost'] - current['cost']) / temperature):
+                score = self.scores[2]
+            if score:
+                current = candidate
+                self.accepted += 1
+
+            destroy_scores[destroy] += score
+            destroy_uses[destroy] += 1
+            repair_scores[repair] += score
+            repair_uses[repair] += 1
+            self.iterations += 1
+            if self.iterations % self.segment == 0:
+                for weights, scores, uses in ((destroy_weights, destroy_scores, destroy_uses),
+                                              (repair_weights, repair_scores, repair_uses)):
+                    for i in range(len(weights)):
+                        if uses[i]:
+                            weights[i] = max(0.05, (1 - self.reaction) * weights[i] +
+                                             self.reaction * scores[i] / uses[i])
+                        scores[i], uses[i] = 0.0, 0
+
+        self.best_cost = best['cost']
+        self.unserved = best['bank']
+        return best['schedules']
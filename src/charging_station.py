@@ -0,0 +1,54 @@
+"""
+Şarj İstasyonu - Depo başına sınırlı şarj cihazı ve bekleme kuyruğu
+Bu dosya, bir depodaki şarj cihazlarını paylaşılan bir kaynak olarak modeller. Boş cihaz varsa drone hemen şarja girer; tüm cihazlar doluysa geliş sırasıyla (FIFO) kuyruğa alınır ve bir şarj bittiğinde sıradaki drone cihazı devralır. İstasyon bekleme sürelerini, en uzun kuyruğu ve cihaz doluluğunu raporlar.
+"""
+from collections import deque # FIFO bekleme kuyruğu
+from typing import Deque, Dict, Optional, Tuple
+from .drone import Drone # Drone sınıfı
+
+class ChargingStation:
+    """Depodaki şarj cihazları; chargers None ise sınırsız"""
+
+    def __init__(self, depot: Tuple[float, float], chargers: Optional[int] = None):
+        self.depot = depot # İstasyonun bulunduğu depo konumu
+        self.chargers = chargers # Cihaz sayısı (None = sınırsız)
+        self.busy = 0 # Kullanımdaki cihaz sayısı
+        self.queue: Deque[Tuple[Drone, float, float]] = deque() # (drone, hedef batarya, kuyruğa giriş zamanı)
+        self.total_wait = 0.0 # Kuyrukta geçen toplam süre (dakika)
+        self.max_queue = 0 # Görülen en uzun kuyruk
+        self.charges = 0 # Başlatılan şarj sayısı
+        self.busy_time = 0.0 # Cihazların toplam dolu kaldığı süre (dakika)
+
+    def has_free_charger(self) -> bool:
+        return self.chargers is None or self.busy < self.chargers
+
+    def request(self, drone: Drone, target: float, current_time: float) -> bool:
+        """Cihaz iste: boşsa True (şarj hemen başlar), değilse drone kuyruğa girer ve False döner"""
+        if self.has_free_charger():
+            self.busy += 1
+            self.charges += 1
+            return True
+        self.queue.append((drone, target, current_time))
+        self.max_queue = max(self.max_queue, len(self.queue))
+        return False
+
+    def release(self, current_time: float) -> Optional[Tuple[Drone, float]]:
+        """Cihazı bırak; kuyrukta drone varsa cihaz ona geçer ve (drone, hedef batarya) döner"""
+        if self.queue:
+            drone, target, queued_at = self.queue.popleft()
+            self.total_wait += current_time - queued_at
+            self.charges += 1
+            return drone, target
+        self.busy -= 1
+        return None
+
+    def report(self, time_horizon: float) -> Dict:
+        """İstasyon istatistikleri"""
+        capacity = self.chargers * time_horizon if self.chargers else 0
+        return {
+            'chargers': self.chargers,
+            'charges': self.charges,
+            'total_wait': self.total_wait,
+            'max_queue': self.max_queue,
+            'utilization_rate': (self.busy_time / capacity) * 100 if capacity else 0
+        }
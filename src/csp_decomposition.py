@@ -0,0 +1,201 @@
+"""
+CSP Ayrıştırma - Büyük senaryoları drone üslerine göre bölgelere ayırıp paralel çözer
+Bu dosya, tek bir CSP örneğinin çözülemeyecek kadar büyüdüğü durumlarda teslimatları en yakın drone üssüne göre kümeler, her küme için bağımsız bir CSPSolver kurup süreç havuzunda çözer ve küme sınırında açıkta kalan teslimatları onarım adımıyla mevcut drone'lara yerleştirir.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor # Kümeleri ayrı süreçlerde çözmek için
+from typing import List, Dict, Set, Tuple, Optional
+from .drone import Drone # Drone sınıfı
+from .delivery_point import DeliveryPoint # Teslimat noktası sınıfı
+from .no_fly_zone import NoFlyZone # Uçuşa yasak bölge sınıfı
+from .graph_builder import DeliveryGraph # Küme başına graf kurmak için
+from .csp_solver import CSPSolver # Küme başına çözücü
+
+def solve_cluster(drones: List[Drone], deliveries: List[DeliveryPoint],
+                  no_fly_zones: List[NoFlyZone], mode: str, lazy_domains: bool = False,
+                  max_set_size: int = 3, time_limit: Optional[float] = None) -> Tuple[Dict[int, Set[int]], Dict]:
+    """Tek bir kümeyi çöz (süreç havuzunda çalıştırılabilmesi için modül seviyesinde)"""
+    graph = DeliveryGraph(drones, deliveries, no_fly_zones) # Sadece küme düğümleri
+    solver = CSPSolver(drones, deliveries, no_fly_zones, graph, lazy_domains, max_set_size)
+
+    if mode == 'bnb':
+        solution = solver.solve_optimal(time_limit=time_limit)
+    elif mode == 'cbj':
+        solution = solver.solve_with_backjumping(time_limit=time_limit)
+    else:
+        solution = solver.solve_with_forward_checking(time_limit=time_limit)
+
+    # Çözüm bulunamazsa kümedeki drone'lar boş kalır, teslimatlar onarıma bırakılır
+    solution = solution or {drone.id: set() for drone in drones}
+    return {d_id: set(s) for d_id, s in solution.items()}, dict(solver.search_stats)
+
+
+class DecomposedCSPSolver:
+    """Mekânsal ayrıştırma ile paralel CSP çözücü
+    
+    time_limit her kümeye ayrı uygulanır; toplam süre en fazla time_limit × ceil(küme sayısı / n_workers) olur.
+    """
+
+    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint],
+                 no_fly_zones: List[NoFlyZone], graph: DeliveryGraph,
+                 max_drones_per_cluster: int = 4, max_deliveries_per_cluster: int = 15,
+                 n_workers: Optional[int] = None, mode: str = 'bnb',
+                 lazy_domains: bool = False, max_set_size: int = 3,
+                 time_limit: Optional[float] = None):
+        self.drones = drones # Tüm drone'lar
+        self.deliveries = deliveries # Tüm teslimatlar
+        self.no_fly_zones = no_fly_zones # Uçuşa yasak bölgeler
+        self.graph = graph # Tam senaryo grafı
+        self.max_drones_per_cluster = max_drones_per_cluster # Küme başına drone sınırı
+        self.max_deliveries_per_cluster = max_deliveries_per_cluster # Küme başına CSP'ye giren teslimat
+        self.n_workers = n_workers or os.cpu_count() or 1 # Süreç havuzu boyutu
+        self.mode = mode # Küme çözücü modu: 'bnb', 'cbj' veya 'fc'
+        self.lazy_domains = lazy_domains # Küme çözücülerinde tembel domain üretimi
+        self.max_set_size = max_set_size # CSP domain'leri ile aynı: drone başına en fazla teslimat
+        self.time_limit = time_limit # Küme başına arama süresi: toplam süre sıralı çözümde küme sayısıyla çarpılır
+
+        self.clusters = [] # [(drone listesi, teslimat listesi)]
+        self.search_stats = {} # Kümelerden toplanan arama sayaçları
+        self.repaired_deliveries = [] # Onarım adımında yerleştirilen teslimatlar
+
+    def cluster_drones(self) -> List[List[Drone]]:
+        """Drone üslerini k-means ile gruplara ayır"""
+        k = max(1, math.ceil(len(self.drones) / self.max_drones_per_cluster))
+        positions = [drone.start_pos for drone in self.drones]
+
+        # Başlangıç merkezleri: en uzak nokta yöntemi (deterministik)
+        centers = [positions[0]]
+        while len(centers) < k:
+            farthest = max(positions, key=lambda p: min(self.graph.euclidean_distance(p, c) for c in centers))
+            centers.append(farthest)
+
+        groups = []
+        for _ in range(10): # Birkaç k-means iterasyonu yeterli
+            groups = [[] for _ in centers]
+            for drone in self.drones:
+                nearest = min(range(len(centers)),
+                              key=lambda i: self.graph.euclidean_distance(drone.start_pos, centers[i]))
+                groups[nearest].append(drone)
+
+            new_centers = [
+                (sum(d.start_pos[0] for d in group) / len(group), sum(d.start_pos[1] for d in group) / len(group))
+                if group else centers[i]
+                for i, group in enumerate(groups)
+            ]
+            if new_centers == centers:
+                break
+            centers = new_centers
+
+        # Kapasiteyi aşan grupları mekânsal olarak böl (aynı bölgedeki drone'lar komşu kümelere düşer)
+        clusters = []
+        for group in groups:
+            clusters.extend(self.split_group(group))
+        return [c for c in clusters if c]
+
+    def split_group(self, group: List[Drone]) -> List[List[Drone]]:
+        """Büyük grubu ana ekseni boyunca özyinelemeli ikiye bölerek boyut sınırına indir
+
+        Üsler grubun en çok yayıldığı doğrultuya (kovaryansın ana ekseni) izdüşürülüp sıralanır; parça
+        sayıları dengeli olacak şekilde ikiye kesilir, böylece her alt küme bitişik bir bölgeyi kapsar.
+        """
+        if len(group) <= self.max_drones_per_cluster:
+            return [group]
+
+        mean_x = sum(d.start_pos[0] for d in group) / len(group)
+        mean_y = sum(d.start_pos[1] for d in group) / len(group)
+        sxx = sum((d.start_pos[0] - mean_x) ** 2 for d in group)
+        syy = sum((d.start_pos[1] - mean_y) ** 2 for d in group)
+        sxy = sum((d.start_pos[0] - mean_x) * (d.start_pos[1] - mean_y) for d in group)
+        angle = 0.5 * math.atan2(2 * sxy, sxx - syy) # Ana eksenin açısı
+        axis = (math.cos(angle), math.sin(angle))
+        ordered = sorted(group, key=lambda d: (d.start_pos[0] * axis[0] + d.start_pos[1] * axis[1], d.id))
+
+        parts = math.ceil(len(group) / self.max_drones_per_cluster)
+        cut = math.ceil(len(group) * (parts // 2) / parts) # Sol yarıya parts // 2 parça düşer
+        return self.split_group(ordered[:cut]) + self.split_group(ordered[cut:])
+
+    def build_clusters(self) -> List[Tuple[List[Drone], List[DeliveryPoint]]]:
+        """Her teslimatı en yakın drone üssünün kümesine ata"""
+        drone_groups = self.cluster_drones()
+        cluster_of_drone = {drone.id: i for i, group in enumerate(drone_groups) for drone in group}
+        members = [[] for _ in drone_groups]
+
+        for delivery in self.deliveries:
+            nearest = min(self.drones, key=lambda d: self.graph.euclidean_distance(d.start_pos, delivery.pos))
+            members[cluster_of_drone[nearest.id]].append(delivery)
+
+        self.clusters = []
+        for group, cluster_deliveries in zip(drone_groups, members):
+            # Kümenin CSP'sine yüksek öncelikli teslimatlar girer, kalanlar onarıma bırakılır
+            cluster_deliveries.sort(key=lambda d: (d.priority, -d.weight), reverse=True)
+            self.clusters.append((group, cluster_deliveries[:self.max_deliveries_per_cluster]))
+
+        return self.clusters
+
+    def solve(self) -> Dict[int, Set[int]]:
+        """Kümeleri (paralel) çöz, birleştir ve sınır teslimatlarını onar"""
+        self.build_clusters()
+        jobs = [(group, cluster_deliveries, self.no_fly_zones, self.mode, self.lazy_domains,
+                 self.max_set_size, self.time_limit)
+                for group, cluster_deliveries in self.clusters]
+
+        if self.n_workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.n_workers, len(jobs))) as executor:
+                results = list(executor.map(solve_cluster, *zip(*jobs)))
+        else:
+            results = [solve_cluster(*job) for job in jobs]
+
+        # Kümeler ayrık teslimat kümeleri üzerinde çözüldüğü için birleştirme çakışmasızdır
+        solution = {drone.id: set() for drone in self.drones}
+        self.search_stats = {}
+        for cluster_solution, stats in results:
+            solution.update(cluster_solution)
+            for key, value in stats.items():
+                self.search_stats[key] = self.search_stats.get(key, 0) + value
+
+        return self.repair(solution)
+
+    def repair(self, solution: Dict[int, Set[int]]) -> Dict[int, Set[int]]:
+        """Hiçbir kümede atanmamış teslimatları kısıtları bozmadan drone'lara ekle"""
+        assigned = set().union(*solution.values()) if solution else set()
+        delivery_by_id = {d.id: d for d in self.deliveries}
+        unassigned = [d for d in self.deliveries if d.id not in assigned]
+        unassigned.sort(key=lambda d: (d.priority, -d.weight), reverse=True)
+        self.repaired_deliveries = []
+
+        for delivery in unassigned:
+            # Yakındaki drone'lar önce denenir (küme sınırındaki teslimatlar komşu kümeye geçebilir)
+            candidates = sorted(self.drones, key=lambda d: self.graph.euclidean_distance(d.start_pos, delivery.pos))
+            for drone in candidates:
+                current = solution[drone.id]
+                if len(current) >= self.max_set_size:
+                    continue
+
+                new_set = current | {delivery.id}
+                set_deliveries = [delivery_by_id[did] for did in new_set]
+                # CSPSolver'ın kısıt yardımcıları doğrudan çağrılır (aday başına çözücü kurulmaz)
+                if (CSPSolver.can_drone_handle_deliveries(drone, set_deliveries) and
+                        CSPSolver.avoids_no_fly_zones(drone, set_deliveries, self.no_fly_zones) and
+                        CSPSolver.meets_time_windows(drone, set_deliveries)):
+                    solution[drone.id] = new_set
+                    self.repaired_deliveries.append(delivery.id)
+                    break
+
+        return solution
+
+    def get_solution_quality(self, solution: Dict[int, Set[int]]) -> Dict:
+        """Tüm senaryo üzerinden çözüm kalitesi"""
+        covered = set().union(*solution.values()) if solution else set()
+        active_drones = sum(1 for s in solution.values() if s)
+
+        return {
+            'covered_deliveries': len(covered),
+            'total_deliveries': len(self.deliveries),
+            'coverage_rate': len(covered) / len(self.deliveries) if self.deliveries else 0.0,
+            'drone_utilization': active_drones / len(self.drones) if self.drones else 0.0,
+            'active_drones': active_drones,
+            'clusters': len(self.clusters),
+            'repaired_deliveries': len(self.repaired_deliveries),
+            'solution': solution
+        }
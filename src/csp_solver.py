@@ -2,15 +2,114 @@
 CSP (Constraint Satisfaction Problem) Çözücü - Dinamik kısıtlar için
 Bu dosya, proje kapsamında drone teslimat görevlerinin adil, dengeli ve kısıtlarla uyumlu biçimde dağıtılmasını sağlar.
 """
-from typing import List, Dict, Set, Tuple, Optional
+import time # B&B ilerleme kaydında geçen süreyi ölçmek için
+from itertools import islice # Tembel domain'de sıradaki değere erişmek için
+from math import comb # Domain büyüklüğü tahmini için
+from typing import List, Dict, Set, Tuple, Optional, Iterator, Callable
 from .drone import Drone # Drone sınıfını içeri aktar
 from .delivery_point import DeliveryPoint # Teslimat noktası sınıfını içeri aktar
 from .no_fly_zone import NoFlyZone # Uçuşa yasak bölge sınıfını içeri aktar
 from .graph_builder import DeliveryGraph # Harita/bağlantı grafiğini yöneten sınıf
 
+class LazyDomain:
+    """Bir drone'un teslimat setlerini ihtiyaç oldukça üreten ve önbelleğe alan domain
+    
+    Değerler büyükten küçüğe (aynı boyutta yüksek öncelikli setler önce) üretilir, boş set en sondadır.
+    excluding() ile oluşturulan görünümler aynı önbelleği paylaşır.
+    """
+    def __init__(self, solver: 'CSPSolver', drone: Drone, max_set_size: int,
+                 base: Optional['LazyDomain'] = None, excluded: frozenset = frozenset()):
+        self.solver = solver
+        self.drone = drone
+        self.max_set_size = max_set_size
+        self.base = base # Görünümse asıl domain
+        self.excluded = excluded # Görünümde yasaklanan teslimatlar
+        
+        if base is None:
+            # Tek başına taşınabilen teslimatlar: yüksek öncelik ve hafif olan önce
+            self.candidates = [d for d in solver.deliveries if solver.can_drone_handle_delivery(drone, d)]
+            self.candidates.sort(key=lambda d: (d.priority, -d.weight), reverse=True)
+            self.cache = [] # Şimdiye kadar üretilmiş değerler
+            self.generator = self._generate()
+            self.exhausted = False
+        else:
+            self.candidates = [d for d in base.candidates if d.id not in excluded]
+            
+    def _generate(self) -> Iterator[Set[int]]:
+        """Değerleri değer sezgiseli sırasıyla üret"""
+        for size in range(min(self.max_set_size, len(self.candidates)), 0, -1):
+            for combo in self._combinations(size, 0, [], 0.0):
+                if size > 1 and not self.solver.can_drone_handle_deliveries(self.drone, combo):
+                    continue
+                delivery_set = {d.id for d in combo}
+                # Drone'a özgü kısıtlar (no-fly, zaman, kapasite) üretim sırasında elenir
+                if self.solver.is_consistent({self.drone.id: delivery_set}):
+                    yield delivery_set
+        yield set() # Hiç teslimat yapmama seçeneği
+        
+    def _combinations(self, size: int, start: int, chosen: List[DeliveryPoint],
+                      weight: float) -> Iterator[List[DeliveryPoint]]:
+        """itertools.combinations sırasıyla, kapasiteyi aşan dalları budayarak kombinasyon üret"""
+        if len(chosen) == size:
+            yield list(chosen)
+            return
+        for i in range(start, len(self.candidates) - (size - len(chosen)) + 1):
+            delivery = self.candidates[i]
+            if weight + delivery.weight > self.drone.max_weight:
+                continue # Bu teslimatı içeren tüm üst kümeler de kapasiteyi aşar
+            chosen.append(delivery)
+            yield from self._combinations(size, i + 1, chosen, weight + delivery.weight)
+            chosen.pop()
+            
+    def _base_values(self) -> Iterator[Set[int]]:
+        """Önbellekteki değerleri ver, bitince üreticiden devam et"""
+        index = 0
+        while True:
+            if index < len(self.cache):
+                yield self.cache[index]
+                index += 1
+                continue
+            if self.exhausted:
+                return
+            try:
+                self.cache.append(next(self.generator))
+            except StopIteration:
+                self.exhausted = True
+                
+    def __iter__(self) -> Iterator[Set[int]]:
+        if self.base is None:
+            return self._base_values()
+        return (s for s in self.base._base_values() if self.excluded.isdisjoint(s))
+        
+    def __getitem__(self, index: int) -> Set[int]:
+        if self.base is None and index < len(self.cache):
+            return self.cache[index] # Önbellekten doğrudan erişim
+        value = next(islice(iter(self), index, None), None)
+        if value is None:
+            raise IndexError(index)
+        return value
+        
+    def __bool__(self) -> bool:
+        return True # Boş set her zaman domain'dedir
+        
+    def excluding(self, deliveries: Set[int]) -> 'LazyDomain':
+        """Verilen teslimatlarla çakışan değerleri atlayan görünüm"""
+        base = self.base or self
+        return LazyDomain(self.solver, self.drone, self.max_set_size, base,
+                          frozenset(self.excluded | set(deliveries)))
+        
+    def estimate_size(self) -> int:
+        """Değerleri üretmeden domain büyüklüğü için ucuz üst tahmin"""
+        if self.base is None and self.exhausted:
+            return len(self.cache)
+        n = len(self.candidates)
+        return sum(comb(n, k) for k in range(1, self.max_set_size + 1)) + 1
+
+
 class CSPSolver:
     def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint], 
-                 no_fly_zones: List[NoFlyZone], graph: DeliveryGraph):
+                 no_fly_zones: List[NoFlyZone], graph: DeliveryGraph,
+                 lazy_domains: bool = False, max_set_size: int = 3):
         self.drones = drones # Kullanılabilir drone listesi
         self.deliveries = deliveries # Tüm teslimat noktaları listesi
         self.no_fly_zones = no_fly_zones # Uçuşa yasak bölgeler
@@ -20,6 +119,29 @@ class CSPSolver:
         self.variables = {}  # drone_id -> [delivery_ids]  Değişkenler: drone_id -> atanacak teslimatlar
         self.domains = {}    # drone_id -> possible_delivery_sets Domain'ler: drone_id -> olası teslimat setleri
         self.constraints = [] # Uygulanacak tüm kısıtlar listesi
+        self.delivery_by_id = {d.id: d for d in deliveries} # id -> teslimat hızlı erişimi
+        self.max_set_size = max_set_size # Drone başına en fazla teslimat sayısı
+        # 3'ten büyük setlerde tam listeleme bellekte tutulamaz: domain'ler tembel üretilir
+        self.lazy_domains = lazy_domains or max_set_size > 3
+        
+        # Branch-and-bound (optimizasyon modu) durumu
+        self.best_assignment = None # Şimdiye kadarki en iyi (incumbent) atama
+        self.best_coverage = -1 # En iyi atamanın kapsadığı teslimat sayısı
+        self.global_bound = 0 # Aramanın ulaşabileceği kapsama üst sınırı
+        self.search_stats = {} # Düğüm / backjump / nogood sayaçları
+        self.nogoods = set() # Tutarsız olduğu kanıtlanmış kısmi atamalar (hash'li)
+        self.nogoods_by_item = {} # (drone_id, teslimat seti) -> o öğeyi içeren nogood'lar
+        self.progress_log = [] # Zaman içinde incumbent / üst sınır / boşluk kaydı
+        self.stopped = False # B&B erken durdu mu (hedef boşluk veya bütçe)
+        self.best_partial = None # fc / cbj: bütçe dolarsa döndürülecek en çok kapsayan (kısmi) atama
+        self.best_partial_coverage = -1
+        self.allow_idle = True # cbj: drone'lar boş set alabilir mi
+        
+        # Arama bütçesi (set_budget ile başlatılır)
+        self.search_start = time.time()
+        self.deadline = None # Süre sınırı (time.time() cinsinden mutlak zaman)
+        self.node_limit = None # Düğüm sınırı
+        self.budget_hit = False # Arama bütçe nedeniyle kesildi mi
         
         self.setup_csp() # CSP problemini başlat
         
@@ -28,7 +150,10 @@ class CSPSolver:
         # Değişkenler: Her drone için olası teslimat setleri
         for drone in self.drones:
             self.variables[drone.id] = [] # Başlangıçta boş değişken
-            self.domains[drone.id] = self.get_possible_deliveries(drone) # Olası teslimat setleri
+            if self.lazy_domains:
+                self.domains[drone.id] = LazyDomain(self, drone, self.max_set_size) # Arama sırasında üretilir
+            else:
+                self.domains[drone.id] = self.get_possible_deliveries(drone) # Olası teslimat setleri
             
         # Kısıtları tanımla
         self.setup_constraints()
@@ -76,8 +201,9 @@ class CSPSolver:
         
         return energy_needed <= drone.battery #Batarya yeterli mi?
         
-    def can_drone_handle_deliveries(self, drone: Drone, deliveries: List[DeliveryPoint]) -> bool:
-        """Drone birden fazla teslimatı yapabilir mi?"""
+    @staticmethod
+    def can_drone_handle_deliveries(drone: Drone, deliveries: List[DeliveryPoint]) -> bool:
+        """Drone birden fazla teslimatı yapabilir mi? (kapasite + enerji; çözücü kurmadan çağrılabilir)"""
         total_weight = sum(d.weight for d in deliveries) # Toplam ağırlık
         if total_weight > drone.max_weight: # Ağırlık sınırı
             return False
@@ -104,6 +230,31 @@ class CSPSolver:
         
         return total_energy <= drone.battery # Enerji sınırı
         
+    @staticmethod
+    def avoids_no_fly_zones(drone: Drone, deliveries: List[DeliveryPoint], no_fly_zones: List[NoFlyZone],
+                            current_time: float = 0) -> bool:
+        """Üsten teslimatlara giden düz hatlar aktif bir no-fly zone'u kesmiyor mu?"""
+        for delivery in deliveries:
+            for zone in no_fly_zones:
+                if zone.is_active(current_time) and zone.line_intersects_polygon(drone.start_pos, delivery.pos):
+                    return False
+        return True
+        
+    @staticmethod
+    def meets_time_windows(drone: Drone, deliveries: List[DeliveryPoint]) -> bool:
+        """Öncelik sırasıyla uçulduğunda her teslimat kendi zaman penceresine yetişiyor mu?"""
+        if len(deliveries) <= 1:
+            return True # Tekli teslimatta zaman kontrolü yapılmaz
+            
+        current_time = 0
+        current_pos = drone.start_pos
+        for delivery in sorted(deliveries, key=lambda x: x.priority, reverse=True):
+            current_time += drone.get_distance(current_pos, delivery.pos) / drone.speed
+            if not (delivery.time_window[0] <= current_time <= delivery.time_window[1]):
+                return False
+            current_pos = delivery.pos
+        return True
+        
     def setup_constraints(self):
         """Kısıtları tanımla"""
         # Kısıt 1: Her teslimat sadece bir drone tarafından yapılabilir
@@ -135,15 +286,9 @@ class CSPSolver:
         
         for drone_id, delivery_set in assignment.items():
             drone = next(d for d in self.drones if d.id == drone_id)
-            
-            for delivery_id in delivery_set:
-                delivery = next(d for d in self.deliveries if d.id == delivery_id)
-                
-                # Drone'dan teslimat noktasına rota
-                for zone in self.no_fly_zones:
-                    if (zone.is_active(current_time) and 
-                        zone.line_intersects_polygon(drone.start_pos, delivery.pos)):
-                        return False
+            deliveries = [self.delivery_by_id[did] for did in delivery_set]
+            if not self.avoids_no_fly_zones(drone, deliveries, self.no_fly_zones, current_time):
+                return False
                         
         return True
         #Kısıt 3: Zaman penceresi 
@@ -151,26 +296,9 @@ class CSPSolver:
         """Zaman penceresi kısıt kontrolü"""
         for drone_id, delivery_set in assignment.items():
             drone = next(d for d in self.drones if d.id == drone_id)
-            
-            if len(delivery_set) > 1:
-                # Çoklu teslimat için basit zaman kontrolü
-                deliveries = [next(d for d in self.deliveries if d.id == did) for did in delivery_set]
-                
-                current_time = 0
-                current_pos = drone.start_pos
-                
-                # Öncelik sırasına göre sırala
-                sorted_deliveries = sorted(deliveries, key=lambda x: x.priority, reverse=True)
-                
-                for delivery in sorted_deliveries:
-                    travel_time = drone.get_distance(current_pos, delivery.pos) / drone.speed
-                    current_time += travel_time
-                    
-                    # Zaman penceresi kontrolü
-                    if not (delivery.time_window[0] <= current_time <= delivery.time_window[1]):
-                        return False
-                        
-                    current_pos = delivery.pos
+            deliveries = [self.delivery_by_id[did] for did in delivery_set]
+            if not self.meets_time_windows(drone, deliveries):
+                return False
                     
         return True
         #Kısıt 4: Kapasite
@@ -181,7 +309,7 @@ class CSPSolver:
             
             total_weight = 0
             for delivery_id in delivery_set:
-                delivery = next(d for d in self.deliveries if d.id == delivery_id)
+                delivery = self.delivery_by_id[delivery_id]
                 total_weight += delivery.weight
                 
             if total_weight > drone.max_weight:
@@ -233,6 +361,11 @@ class CSPSolver:
             
         # Kalan drone'lar için domain'leri güncelle
         for drone_id in [d.id for d in self.drones if d.id not in assignment]:
+            if isinstance(self.domains[drone_id], LazyDomain):
+                # Tembel domain listelenmez, çakışan değerleri atlayan görünüm kullanılır
+                self.domains[drone_id] = self.domains[drone_id].excluding(assigned_deliveries)
+                continue
+                
             new_domain = []
             
             for delivery_set in self.domains[drone_id]:
@@ -247,27 +380,43 @@ class CSPSolver:
             
         return True
         
-    def solve_with_forward_checking(self) -> Optional[Dict[int, Set[int]]]:
-        """Forward checking ile geliştirilmiş CSP çözümü"""
+    def solve_with_forward_checking(self, time_limit: Optional[float] = None,
+                                    node_limit: Optional[int] = None) -> Optional[Dict[int, Set[int]]]:
+        """Forward checking ile geliştirilmiş CSP çözümü
+
+        Bütçe dolarsa o ana kadar görülen en çok kapsayan atama döndürülür (atanmamış drone'lar boş set).
+        """
+        self.reset_search_stats()
+        self.set_budget(time_limit, node_limit)
         assignment = {}
-        return self.backtrack_with_fc(assignment)
+        solution = self.backtrack_with_fc(assignment)
+        if solution is None and self.budget_hit:
+            return self.best_partial_solution()
+        return solution
         
     def backtrack_with_fc(self, assignment: Dict[int, Set[int]]) -> Optional[Dict[int, Set[int]]]:
         """Forward checking ile backtracking"""
         if len(assignment) == len(self.drones):
             return assignment
             
+        self.search_stats['nodes_visited'] += 1
+        if self.budget_exhausted():
+            return None
+            
         # Sonraki değişkeni seç (MRV heuristic)
         unassigned_drones = [d.id for d in self.drones if d.id not in assignment]
-        drone_id = min(unassigned_drones, key=lambda d: len(self.domains[d]))
+        drone_id = min(unassigned_drones, key=lambda d: self.domain_size(self.domains[d]))
         
-        # Domain'i kopyala (değişiklikler için)
-        original_domains = {d_id: list(domain) for d_id, domain in self.domains.items()}
+        # Domain'i kopyala (değişiklikler için); tembel domain görünümleri değişmez, kopyalanmaz
+        original_domains = {d_id: domain if isinstance(domain, LazyDomain) else list(domain)
+                            for d_id, domain in self.domains.items()}
+        current_domain = self.domains[drone_id]
         
-        for delivery_set in list(self.domains[drone_id]):
+        for delivery_set in (current_domain if isinstance(current_domain, LazyDomain) else list(current_domain)):
             assignment[drone_id] = delivery_set
             
             if self.is_consistent(assignment):
+                self.note_partial(assignment)
                 if self.forward_checking(assignment):
                     result = self.backtrack_with_fc(assignment)
                     if result is not None:
@@ -277,8 +426,298 @@ class CSPSolver:
             del assignment[drone_id]
             self.domains = original_domains
             
+            if self.budget_hit:
+                break
+            
         return None
         
+    def reset_search_stats(self):
+        """Arama sayaçlarını ve en iyi kısmi atamayı sıfırla"""
+        self.search_stats = {'nodes_visited': 0, 'backjumps': 0, 'nogood_hits': 0, 'nogoods_stored': 0}
+        self.best_partial = None
+        self.best_partial_coverage = -1
+        
+    def note_partial(self, assignment: Dict[int, Set[int]]):
+        """Tutarlı (kısmi) atama şimdiye kadarkinden fazla teslimat kapsıyorsa sakla"""
+        coverage = sum(len(delivery_set) for delivery_set in assignment.values())
+        if coverage > self.best_partial_coverage:
+            self.best_partial_coverage = coverage
+            self.best_partial = {d_id: set(delivery_set) for d_id, delivery_set in assignment.items()}
+            
+    def best_partial_solution(self) -> Dict[int, Set[int]]:
+        """En iyi kısmi atama; atanmamış drone'lar boş set alır (boş set her drone için geçerlidir)"""
+        best = self.best_partial or {}
+        return {drone.id: set(best.get(drone.id, set())) for drone in self.drones}
+        
+    def solve_with_backjumping(self, time_limit: Optional[float] = None, node_limit: Optional[int] = None,
+                               allow_idle: bool = True) -> Optional[Dict[int, Set[int]]]:
+        """Conflict-directed backjumping + nogood öğrenme ile CSP çözümü
+
+        Boş set her drone için geçerli olduğundan allow_idle True iken arama hiç başarısız olmaz; backjump ve
+        nogood sadece allow_idle False (her drone en az bir teslimat almalı) iken devreye girer. Bu modda
+        çözüm yoksa None döner.
+
+        Bütçe dolarsa o ana kadar görülen en çok kapsayan atama döndürülür (atanmamış drone'lar boş set).
+        """
+        self.ordered_domains = {d.id: self.order_domain_values(d.id) for d in self.drones}
+        self.drone_order = [d.id for d in self.drones]
+        self.allow_idle = allow_idle
+        self.nogoods = set()
+        self.nogoods_by_item = {}
+        self.reset_search_stats()
+        self.set_budget(time_limit, node_limit)
+        
+        assignment = {}
+        solution, _ = self.backjump(assignment, 0)
+        if solution is None and self.budget_hit:
+            return self.best_partial_solution()
+        return solution
+        
+    def backjump(self, assignment: Dict[int, Set[int]], depth: int) -> Tuple[Optional[Dict[int, Set[int]]], Set[int]]:
+        """CBJ adımı: (çözüm, çakışma kümesi) döndürür"""
+        if depth == len(self.drone_order):
+            return {d_id: set(s) for d_id, s in assignment.items()}, set()
+            
+        drone_id = self.drone_order[depth]
+        conflict_set = set() # Bu değişkenin başarısızlığından sorumlu önceki drone'lar
+        
+        for delivery_set in self.ordered_domains[drone_id]:
+            if not delivery_set and not self.allow_idle:
+                continue # Boşta kalma yasak: tekli kısıt, çakışma kümesine drone eklemez
+            self.search_stats['nodes_visited'] += 1
+            if self.budget_exhausted():
+                return None, set() # Bütçe doldu: nogood kaydetmeden çık
+            
+            # Daha önce öğrenilmiş bir nogood bu kısmi atamayı kapsıyor mu?
+            nogood = self.find_nogood(assignment, drone_id, delivery_set)
+            if nogood is not None:
+                self.search_stats['nogood_hits'] += 1
+                conflict_set.update(d_id for d_id, _ in nogood if d_id != drone_id)
+                continue
+                
+            # Benzersiz teslimat kısıtını ihlal eden önceki drone'lar
+            culprits = [d_id for d_id, assigned in assignment.items() if not assigned.isdisjoint(delivery_set)]
+            if culprits:
+                conflict_set.update(culprits)
+                continue
+                
+            assignment[drone_id] = delivery_set
+            self.note_partial(assignment)
+            result, child_conflicts = self.backjump(assignment, depth + 1)
+            del assignment[drone_id]
+            
+            if result is not None:
+                return result, set()
+            if self.budget_hit:
+                return None, set()
+                
+            if drone_id not in child_conflicts:
+                # Bu drone başarısızlıkla ilgili değil: doğrudan sorumlu drone'a atla
+                self.search_stats['backjumps'] += 1
+                return None, child_conflicts
+                
+            conflict_set.update(child_conflicts - {drone_id})
+            
+        # Domain tükendi: çakışma kümesindeki atamalar birlikte tutarsızdır
+        self.record_nogood(frozenset((d_id, frozenset(assignment[d_id])) for d_id in conflict_set))
+        return None, conflict_set
+        
+    def record_nogood(self, nogood: frozenset):
+        """Nogood'u kaydet ve içerdiği her öğe üzerinden indeksle"""
+        if nogood in self.nogoods:
+            return
+        self.nogoods.add(nogood)
+        self.search_stats['nogoods_stored'] += 1
+        for item in nogood:
+            self.nogoods_by_item.setdefault(item, []).append(nogood)
+            
+    def find_nogood(self, assignment: Dict[int, Set[int]], drone_id: int, 
+                    delivery_set: Set[int]) -> Optional[frozenset]:
+        """Yeni değerle oluşacak kısmi atamayı kapsayan nogood varsa döndür"""
+        for nogood in self.nogoods_by_item.get((drone_id, frozenset(delivery_set)), ()):
+            if all(d_id == drone_id or (d_id in assignment and frozenset(assignment[d_id]) == value)
+                   for d_id, value in nogood):
+                return nogood
+        return None
+        
+    def domain_size(self, domain) -> int:
+        """MRV için domain büyüklüğü (tembel domain'lerde ucuz tahmin)"""
+        if isinstance(domain, LazyDomain):
+            return domain.estimate_size()
+        return len(domain)
+        
+    def order_domain_values(self, drone_id: int) -> List[Set[int]]:
+        """Tekli kısıtları sağlayan değerleri büyüklük ve önceliğe göre sırala"""
+        if isinstance(self.domains[drone_id], LazyDomain):
+            return self.domains[drone_id] # Zaten bu sırayla ve filtrelenmiş olarak üretiliyor
+            
+        drone = next(d for d in self.drones if d.id == drone_id)
+        seen = set() # Sıralı üçlülerden gelen tekrarları ayıkla
+        values = []
+        
+        for delivery_set in self.domains[drone_id]:
+            key = frozenset(delivery_set)
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            # Sadece bu drone'u ilgilendiren kısıtlar (no-fly, zaman, kapasite) bir kez kontrol edilir
+            if self.is_consistent({drone.id: delivery_set}):
+                values.append(delivery_set)
+                
+        # Büyük ve yüksek öncelikli setler önce denenir
+        values.sort(key=lambda s: (len(s), sum(self.delivery_by_id[did].priority for did in s)),
+                    reverse=True)
+        return values
+        
+    def coverage_upper_bound(self, assignment: Dict[int, Set[int]], used: Set[int]) -> int:
+        """Atanan teslimatlar + kalan her drone'un hâlâ alabileceği en büyük set"""
+        bound = len(used)
+        
+        for drone_id, values in self.ordered_domains.items():
+            if drone_id in assignment:
+                continue
+            # Değerler büyükten küçüğe sıralı: çakışmayan ilk set en büyüğüdür
+            for delivery_set in values:
+                if used.isdisjoint(delivery_set):
+                    bound += len(delivery_set)
+                    break
+                    
+        return min(bound, len(self.deliveries))
+        
+    def solve_optimal(self, target_gap: float = 0.0, time_limit: Optional[float] = None,
+                      node_limit: Optional[int] = None,
+                      on_solution: Optional[Callable[[Dict], None]] = None) -> Optional[Dict[int, Set[int]]]:
+        """Branch-and-bound ile en yüksek kapsamalı çözümü bul
+        
+        target_gap: (üst sınır - incumbent) / üst sınır bu değere inince arama erken durur
+        time_limit / node_limit: bütçe dolunca o ana kadarki en iyi çözüm döndürülür
+        on_solution: her iyileşen çözümde iter_solutions() kaydıyla çağrılır
+        """
+        for record in self.iter_solutions(target_gap, time_limit, node_limit):
+            if on_solution is not None:
+                on_solution(record)
+        return self.best_assignment
+        
+    def iter_solutions(self, target_gap: float = 0.0, time_limit: Optional[float] = None,
+                       node_limit: Optional[int] = None) -> Iterator[Dict]:
+        """Anytime B&B: her iyileşen atamayı kalite metrikleriyle birlikte üret"""
+        self.ordered_domains = {d.id: self.order_domain_values(d.id) for d in self.drones}
+        # Statik MRV: en az seçeneği olan drone önce dallanır
+        self.drone_order = sorted(self.ordered_domains, key=lambda d: self.domain_size(self.ordered_domains[d]))
+        
+        self.best_assignment = None
+        self.best_coverage = -1
+        self.reset_search_stats()
+        self.progress_log = []
+        self.target_gap = target_gap
+        self.stopped = False
+        self.set_budget(time_limit, node_limit)
+        self.global_bound = self.coverage_upper_bound({}, set())
+        
+        for solution in self.branch_and_bound({}, set(), 0):
+            yield {
+                'solution': solution,
+                'quality': self.get_solution_quality(solution),
+                'elapsed': time.time() - self.search_start,
+                'nodes': self.search_stats['nodes_visited'],
+                'bound': self.global_bound,
+                'gap': self.gap()
+            }
+            
+        if not self.stopped:
+            self.global_bound = max(self.best_coverage, 0) # Ağaç tamamen tarandı: optimal
+        self.log_progress() # Son durum kaydı
+        
+    def branch_and_bound(self, assignment: Dict[int, Set[int]], used: Set[int],
+                         depth: int) -> Iterator[Dict[int, Set[int]]]:
+        """Derinlik öncelikli B&B; her yeni incumbent'ı üretir, durma kararı self.stopped'dadır"""
+        self.search_stats['nodes_visited'] += 1
+        if self.budget_exhausted():
+            self.stopped = True
+            return
+            
+        if depth == len(self.drone_order): # Tüm drone'lar atandı
+            if len(used) > self.best_coverage:
+                self.best_coverage = len(used)
+                self.best_assignment = {d_id: set(s) for d_id, s in assignment.items()}
+                self.log_progress()
+                self.stopped = self.gap() <= self.target_gap
+                yield self.best_assignment
+            return
+            
+        # Bu daldan incumbent'ı geçmek mümkün değilse buda
+        if self.coverage_upper_bound(assignment, used) <= self.best_coverage:
+            return
+            
+        drone_id = self.drone_order[depth]
+        values = self.ordered_domains[drone_id]
+        # Kökte diğer drone'ların en büyük setlerinin toplamı (kalan dallar için güvenli sınır)
+        rest_bound = sum(len(self.ordered_domains[d][0]) for d in self.drone_order[1:]
+                         if self.ordered_domains[d]) if depth == 0 else 0
+        
+        for index, delivery_set in enumerate(values):
+            if not used.isdisjoint(delivery_set): # Benzersiz teslimat kısıtı
+                continue
+                
+            assignment[drone_id] = delivery_set
+            yield from self.branch_and_bound(assignment, used | delivery_set, depth + 1)
+            del assignment[drone_id]
+            
+            if self.stopped:
+                return
+                
+            if depth == 0 and self.has_value(values, index + 1):
+                # Kök seviyesinde kalan dalların sınırı küçülür (değerler büyükten küçüğe)
+                new_bound = max(self.best_coverage,
+                                min(self.global_bound, len(values[index + 1]) + rest_bound))
+                if new_bound < self.global_bound:
+                    self.global_bound = new_bound
+                    self.log_progress()
+                if self.gap() <= self.target_gap:
+                    self.stopped = True
+                    return
+                    
+    def set_budget(self, time_limit: Optional[float] = None, node_limit: Optional[int] = None):
+        """Arama için süre (saniye) ve düğüm bütçesini başlat"""
+        self.search_start = time.time()
+        self.deadline = self.search_start + time_limit if time_limit is not None else None
+        self.node_limit = node_limit
+        self.budget_hit = False # Arama bütçe nedeniyle mi kesildi?
+        
+    def budget_exhausted(self) -> bool:
+        """Süre veya düğüm bütçesi doldu mu?"""
+        if self.budget_hit:
+            return True
+        if ((self.node_limit is not None and self.search_stats['nodes_visited'] > self.node_limit) or
+                (self.deadline is not None and time.time() >= self.deadline)):
+            self.budget_hit = True
+        return self.budget_hit
+        
+    def has_value(self, values, index: int) -> bool:
+        """Domain'de verilen sıradaki değer var mı (tembel domain'i gerektiği kadar üretir)"""
+        try:
+            values[index]
+            return True
+        except IndexError:
+            return False
+            
+    def gap(self) -> float:
+        """Incumbent ile üst sınır arasındaki göreli boşluk"""
+        if self.global_bound <= 0:
+            return 0.0
+        return max(0.0, (self.global_bound - max(self.best_coverage, 0)) / self.global_bound)
+        
+    def log_progress(self):
+        """Incumbent, üst sınır ve boşluğu zaman damgasıyla kaydet"""
+        self.progress_log.append({
+            'elapsed': time.time() - self.search_start,
+            'nodes': self.search_stats['nodes_visited'],
+            'incumbent': max(self.best_coverage, 0),
+            'bound': self.global_bound,
+            'gap': self.gap()
+        })
+        
     def get_solution_quality(self, solution: Dict[int, Set[int]]) -> Dict:
         """Çözüm kalitesi metriklerini hesapla"""
         if not solution:
@@ -0,0 +1,76 @@
+"""
+Teslimat Havuzu - Çoklu tur planlaması için indeksli bekleyen teslimat kümesi
+Bu dosya, bekleyen teslimatları öncelik heap'inde (yüksek öncelik, hafif paket, erken bitiş zamanı önde) tutar. Teslim edilen paketler kimlikle O(1) silinir (heap girişleri tembel olarak atlanır); bitiş zamanı indeksi sayesinde geç kalma toleransını aşmış teslimatlar taramadan çıkarılır. Böylece her tur tüm listeyi yeniden sıralamak yerine sadece taranan k aday için O(k log n) iş yapar.
+"""
+import heapq # Öncelik, ağırlık ve bitiş zamanı heap'leri
+from typing import Dict, Iterable, Iterator, List, Optional
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+
+class DeliveryPool:
+    """Öncelik heap'li, tembel silmeli teslimat havuzu"""
+
+    def __init__(self, deliveries: Iterable[DeliveryPoint] = ()):
+        self.pending: Dict[int, DeliveryPoint] = {} # kimlik -> bekleyen teslimat
+        self.expired: List[DeliveryPoint] = [] # Zaman penceresi kaçırılan teslimatlar
+        self.order = 0 # Eşit anahtarlarda ekleme sırası korunur
+        self.priority_heap = [] # (-öncelik, ağırlık, bitiş, sıra, kimlik)
+        self.weight_heap = [] # (ağırlık, kimlik): en hafif bekleyen paket
+        self.deadline_heap = [] # (bitiş, kimlik): zaman penceresi indeksi
+        for delivery in deliveries:
+            self.add(delivery)
+
+    def add(self, delivery: DeliveryPoint):
+        """Teslimatı havuza ekle"""
+        self.pending[delivery.id] = delivery
+        heapq.heappush(self.priority_heap, (-delivery.priority, delivery.weight, delivery.time_window[1],
+                                            self.order, delivery.id))
+        heapq.heappush(self.weight_heap, (delivery.weight, delivery.id))
+        heapq.heappush(self.deadline_heap, (delivery.time_window[1], delivery.id))
+        self.order += 1
+
+    def remove(self, delivery_id: int) -> Optional[DeliveryPoint]:
+        """Teslimatı kimlikle çıkar (heap girişleri tembel olarak atlanır)"""
+        return self.pending.pop(delivery_id, None)
+
+    def expire(self, latest_deadline: float) -> List[DeliveryPoint]:
+        """Bitiş zamanı latest_deadline'dan önce olan teslimatları havuzdan çıkar"""
+        expired = []
+        while self.deadline_heap and self.deadline_heap[0][0] < latest_deadline:
+            _, delivery_id = heapq.heappop(self.deadline_heap)
+            delivery = self.pending.pop(delivery_id, None)
+            if delivery is not None:
+                expired.append(delivery)
+        self.expired.extend(expired)
+        return expired
+
+    def lightest_weight(self) -> float:
+        """Bekleyen en hafif paketin ağırlığı (havuz boşsa sonsuz)"""
+        while self.weight_heap and self.weight_heap[0][1] not in self.pending:
+            heapq.heappop(self.weight_heap) # Silinmiş giriş
+        return self.weight_heap[0][0] if self.weight_heap else float('inf')
+
+    def candidates(self) -> Iterator[DeliveryPoint]:
+        """Bekleyen teslimatları öncelik sırasıyla ver
+
+        Taranan girişler üretici kapatıldığında heap'e geri konur; bu yüzden
+        `contextlib.closing(pool.candidates())` ile kullanılmalıdır.
+        """
+        scanned = []
+        try:
+            while self.priority_heap:
+                entry = heapq.heappop(self.priority_heap)
+                delivery = self.pending.get(entry[-1])
+                if delivery is None:
+                    continue # Tembel silme: teslim edilmiş veya süresi geçmiş
+                scanned.append(entry)
+                yield delivery
+        finally:
+            for entry in scanned:
+                if entry[-1] in self.pending:
+                    heapq.heappush(self.priority_heap, entry)
+
+    def __contains__(self, delivery_id: int) -> bool:
+        return delivery_id in self.pending
+
+    def __len__(self) -> int:
+        return len(self.pending)
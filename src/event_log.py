@@ -0,0 +1,109 @@
+"""
+Olay Günlüğü - Planlayıcılar için seviyeli, yapılandırılmış olay çıkışı
+Bu dosya, planlayıcıların ve genetik algoritmanın ekrana yazdırdığı mesajları seviyeli (debug, info, warning) olaylara dönüştürür. Her modül bir kanal alır; kanalın `debug_enabled` gibi bayrakları yapılandırma değiştiğinde önceden hesaplanır, böylece kapalı bir olayın maliyeti tek bir bool kontrolüdür ve mesaj hiç biçimlendirilmez. Olaylar isteğe bağlı olarak JSONL dosyasına (her satır bir olay) yazılır.
+"""
+import json # JSONL iz dosyası
+import time # Olay zaman damgası
+from typing import Dict, Iterable, Optional
+
+DEBUG, INFO, WARNING = 10, 20, 30 # Olay seviyeleri
+LEVEL_NAMES = {DEBUG: 'debug', INFO: 'info', WARNING: 'warning'}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()} # 'debug' -> 10
+
+class EventChannel:
+    """Tek bir modülün olay kanalı; seviye bayrakları yapılandırmada önceden hesaplanır"""
+
+    def __init__(self, log: 'EventLog', module: str):
+        self.log = log # Olayların yazıldığı günlük
+        self.module = module # Modül adı (örneğin 'multitrip', 'ga')
+        self.debug_enabled = self.info_enabled = self.warning_enabled = False
+        self.refresh()
+
+    def refresh(self):
+        """Seviye bayraklarını günlüğün güncel yapılandırmasından yeniden hesapla"""
+        threshold = self.log.threshold(self.module)
+        self.debug_enabled = DEBUG >= threshold
+        self.info_enabled = INFO >= threshold
+        self.warning_enabled = WARNING >= threshold
+
+    def debug(self, event: str, message: Optional[str] = None, **fields):
+        """Ayrıntılı olay (aday paketler, tek tek teslimatlar)"""
+        if self.debug_enabled:
+            self.log.write(self.module, DEBUG, event, message, fields)
+
+    def info(self, event: str, message: Optional[str] = None, **fields):
+        """Genel ilerleme olayı"""
+        if self.info_enabled:
+            self.log.write(self.module, INFO, event, message, fields)
+
+    def warning(self, event: str, message: Optional[str] = None, **fields):
+        """Uyarı olayı"""
+        if self.warning_enabled:
+            self.log.write(self.module, WARNING, event, message, fields)
+
+
+class EventLog:
+    """Konsol ve JSONL dosyasına yazan, modül bazında açılıp kapanabilen olay günlüğü"""
+
+    def __init__(self):
+        self.console_level = INFO # Konsola yazılan en düşük seviye
+        self.trace_level = INFO # İz dosyasına yazılan en düşük seviye
+        self.trace = None # Açık JSONL dosyası
+        self.disabled_modules = set() # Tamamen susturulan modüller
+        self.channels: Dict[str, EventChannel] = {} # modül -> kanal
+        self.start = time.perf_counter() # Zaman damgalarının başlangıcı
+
+    def channel(self, module: str) -> EventChannel:
+        """Modülün kanalını döndür (yoksa oluştur)"""
+        if module not in self.channels:
+            self.channels[module] = EventChannel(self, module)
+        return self.channels[module]
+
+    def threshold(self, module: str) -> float:
+        """Modül için herhangi bir çıktıya yazılacak en düşük seviye (kapalıysa sonsuz)"""
+        if module in self.disabled_modules:
+            return float('inf')
+        if self.trace is not None:
+            return min(self.console_level, self.trace_level)
+        return self.console_level
+
+    def configure(self, level: Optional[str] = None, quiet: Optional[bool] = None,
+                  trace_file: Optional[str] = None, disabled_modules: Optional[Iterable[str]] = None):
+        """Seviyeleri, konsol sessizliğini, iz dosyasını ve kapalı modülleri ayarla
+
+        level her iki çıktı için en düşük seviyedir; quiet konsolu sadece uyarılara indirir.
+        """
+        if level is not None:
+            self.console_level = self.trace_level = LEVELS[level]
+        if quiet:
+            self.console_level = max(self.console_level, WARNING)
+        if trace_file is not None:
+            self.close()
+            self.trace = open(trace_file, 'w', encoding='utf-8')
+        if disabled_modules is not None:
+            self.disabled_modules = set(disabled_modules)
+        for channel in self.channels.values():
+            channel.refresh()
+
+    def write(self, module: str, level: int, event: str, message: Optional[str], fields: Dict):
+        """Olayı seviyesi yeten çıktılara yaz"""
+        if level >= self.console_level:
+            print(message if message is not None else f"[{module}] {event} {fields}")
+        if self.trace is not None and level >= self.trace_level:
+            record = {'elapsed': round(time.perf_counter() - self.start, 6), 'module': module,
+                      'level': LEVEL_NAMES[level], 'event': event}
+            record.update(fields)
+            if message is not None:
+                record['message'] = message.strip()
+            self.trace.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    def close(self):
+        """İz dosyasını kapat"""
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
+            for channel in self.channels.values():
+                channel.refresh()
+
+
+event_log = EventLog() # Süreç genelinde paylaşılan günlük
@@ -0,0 +1,44 @@
+"""
+Olay Zamanlayıcı - Ayrık olay simülasyonu için öncelik kuyruğu
+Bu dosya, çoklu tur planlamasında kullanılan olay kuyruğunu sağlar. Olaylar (drone'un boşa çıkması, şarjın bitmesi, no-fly zone'un aktifleşmesi/kapanması, çevrimiçi modda yeni siparişlerin gelmesi) zamanlarına göre bir heap'te tutulur; her drone kendi saatine sahip olduğundan turlar zamanda çakışabilir ve filo paralel çalışır.
+"""
+import heapq # Olay kuyruğu
+import itertools # Eşit zamanlı olaylarda ekleme sırası
+from typing import Any, Tuple
+
+class EventScheduler:
+    """Zamana göre sıralı olay kuyruğu"""
+
+    # Olay türleri
+    ZONE_ACTIVATION = 'zone_activation' # No-fly zone aktifleşti
+    ZONE_DEACTIVATION = 'zone_deactivation' # No-fly zone kapandı
+    CHARGE_COMPLETE = 'charge_complete' # Drone şarjı bitti
+    DRONE_AVAILABLE = 'drone_available' # Drone yeni tura hazır
+    ORDER_RELEASE = 'order_release' # Yeni siparişler geldi (çevrimiçi mod)
+
+    # Aynı anda gerçekleşen olaylarda önce bölge durumu ve sipariş havuzu güncellenir, sonra drone'lar planlanır
+    KIND_ORDER = {ZONE_ACTIVATION: 0, ZONE_DEACTIVATION: 0, ORDER_RELEASE: 0, CHARGE_COMPLETE: 1, DRONE_AVAILABLE: 2}
+
+    def __init__(self):
+        self.queue = [] # (zaman, tür sırası, ekleme sırası, tür, konu)
+        self.counter = itertools.count() # Kararlı sıralama için
+        self.now = 0 # Son işlenen olayın zamanı
+        self.processed = 0 # İşlenen olay sayısı
+
+    def schedule(self, event_time: float, kind: str, subject: Any):
+        """Olayı kuyruğa ekle"""
+        heapq.heappush(self.queue, (event_time, self.KIND_ORDER[kind], next(self.counter), kind, subject))
+
+    def pop(self) -> Tuple[float, str, Any]:
+        """En erken olayı çıkar ve simülasyon saatini ilerlet"""
+        event_time, _, _, kind, subject = heapq.heappop(self.queue)
+        self.now = event_time
+        self.processed += 1
+        return event_time, kind, subject
+
+    def peek_time(self) -> float:
+        """Sıradaki olayın zamanı (kuyruk boşsa sonsuz)"""
+        return self.queue[0][0] if self.queue else float('inf')
+
+    def __len__(self) -> int:
+        return len(self.queue)
@@ -4,74 +4,210 @@ Bu dosya, teslimatları drone’lara en verimli şekilde paylaştırmak için ge
 """
 import random # Rastgele seçimler için
 import math
+import heapq # Steady-state: en kötü bireyi bulmak için
+from copy import copy as shallow_copy # Kopyala-yaz birey kopyası için
+from collections import OrderedDict, Counter # LRU fitness önbelleği, çeşitlilik sayımı
+from concurrent.futures import ProcessPoolExecutor # Paralel fitness hesabı için
 from typing import List, Dict, Tuple, Optional
 from .drone import Drone # Drone sınıfı
 from .delivery_point import DeliveryPoint  # Teslimat sınıfı
 from .no_fly_zone import NoFlyZone # No-fly zone sınıfı
 from .graph_builder import DeliveryGraph # Mesafe grafı
 from .astar import AStarPathfinder # A* rota bulucu (GA sonrası rota çıkarırken kullanılır)
+from .scenario_index import ScenarioIndex # Kimlikten özelliğe sabit zamanlı erişim
+from .route_optimizer import RouteOptimizer # Memetik mod: 2-opt / Or-opt rota sıralama
+from .event_log import event_log # Seviyeli olay günlüğü
+
+log = event_log.channel('ga') # GA ilerleme olayları
+
+class FitnessCache:
+    """Sınırlı boyutlu LRU önbellek (kromozom veya alt rota anahtarı -> değer)"""
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size # Bu sayı aşılınca en eski kullanılan kayıt atılır
+        self.entries = OrderedDict()
+        self.hits = 0 # İsabet sayısı
+        self.misses = 0 # Iska sayısı
+        
+    def get(self, key):
+        """Kayıt varsa döndür ve en yeni kullanılan yap, yoksa None"""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+        
+    def put(self, key, value):
+        """Kaydı ekle, boyut aşılırsa en eski kaydı at"""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            
+    def hit_rate(self) -> float:
+        """İsabet oranı (0-1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
 
 class Individual:
     """GA için birey (kromozom) sınıfı"""
-    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint]):
+    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint],
+                 index: Optional[ScenarioIndex] = None, ordered: bool = False):
         self.drones = drones
         self.deliveries = deliveries
-        self.chromosome = {}  # drone_id -> [delivery_ids]
+        self.index = index or ScenarioIndex(drones, deliveries) # GA tüm bireylere aynı indeksi verir
+        self.ordered = ordered # True: drone listesi sırası ziyaret sırasıdır (memetik mod)
+        self.optimized = False # Rotalar yerel aramadan geçti ve o zamandan beri değişmedi
+        self.chromosome = {}  # drone_id -> (delivery_ids) - değişmez tuple, kopyalar arasında paylaşılır
         self.fitness = 0.0 # Fitness değeri
         self.is_valid = True # Fizibilite bayrağı
+        self.dirty = True # Kromozom değişti, fitness yeniden hesaplanmalı
+        
+        # Artımlı fitness: drone başına (enerji, ihlal, teslimat sayısı) katkıları ve toplamları
+        self.drone_metrics = {} # drone_id -> (enerji, ihlal, teslimat sayısı)
+        self.dirty_drones = set() # Listesi değişen, katkısı yeniden hesaplanacak drone'lar
+        self.total_energy = 0.0
+        self.rule_violations = 0
+        self.delivered_count = 0
         
         # Her drone için boş teslimat listesi hazırla
         for drone in drones:
-            self.chromosome[drone.id] = []
+            self.chromosome[drone.id] = ()
             
     def randomize(self):
         """Rastgele geçerli kromozom oluştur"""
-        available_deliveries = list(range(1, len(self.deliveries) + 1))
+        available_deliveries = list(self.index.delivery_ids)
         random.shuffle(available_deliveries) # Teslimatları karıştır
+        loads = [0.0] * len(self.drones) # Drone başına anlık yük (yeniden toplanmaz)
+        drone_ids, capacities = self.index.drone_ids, self.index.capacities
+        routes = [list(self.chromosome[drone_id]) for drone_id in drone_ids]
         
         for delivery_id in available_deliveries:
-            delivery = next(d for d in self.deliveries if d.id == delivery_id)
+            weight = self.index.weight(delivery_id)
             
              # Teslimatı taşıyabilecek drone'ları bul
-            capable_drones = []
-            for drone in self.drones:
-                current_weight = sum(next(d for d in self.deliveries if d.id == did).weight 
-                                   for did in self.chromosome[drone.id])
-                
-                if current_weight + delivery.weight <= drone.max_weight:
-                    capable_drones.append(drone.id)
+            capable_drones = [j for j in range(len(drone_ids)) if loads[j] + weight <= capacities[j]]
             # Uygun drone varsa rastgele ata    
             if capable_drones:
-                chosen_drone = random.choice(capable_drones)
-                self.chromosome[chosen_drone].append(delivery_id)
+                chosen = random.choice(capable_drones)
+                routes[chosen].append(delivery_id)
+                loads[chosen] += weight
+                
+        for drone_id, route in zip(drone_ids, routes):
+            self.set_route(drone_id, route)
                 
-    def calculate_fitness(self, graph: DeliveryGraph, no_fly_zones: List[NoFlyZone]) -> float:
+    def mark_dirty(self, *drone_ids: int):
+        """Listesi değişen drone'ları işaretle (sadece onların katkısı yeniden hesaplanır)"""
+        self.dirty_drones.update(drone_ids)
+        self.dirty = True
+        self.optimized = False
+        
+    def set_chromosome(self, chromosome: Dict[int, List[int]]):
+        """Kromozomu tamamen değiştir (önbelleklenmiş tüm drone katkıları geçersiz olur)"""
+        self.chromosome = {drone_id: tuple(route) for drone_id, route in chromosome.items()}
+        self.mark_dirty(*chromosome)
+        
+    # Kopyala-yaz: drone listeleri paylaşılan tuple'lardır, değiştirilen drone yeni tuple alır
+    def set_route(self, drone_id: int, deliveries):
+        """Drone'un teslimat listesini değiştir (diğer kopyaların gördüğü tuple'a dokunulmaz)"""
+        self.chromosome[drone_id] = tuple(deliveries)
+        self.mark_dirty(drone_id)
+        
+    def add_delivery(self, drone_id: int, delivery_id: int):
+        """Teslimatı drone listesinin sonuna ekle"""
+        self.set_route(drone_id, self.chromosome[drone_id] + (delivery_id,))
+        
+    def remove_delivery(self, drone_id: int, delivery_id: int):
+        """Teslimatı drone listesinden çıkar"""
+        route = list(self.chromosome[drone_id])
+        route.remove(delivery_id)
+        self.set_route(drone_id, route)
+        
+    def assignment_array(self) -> List[int]:
+        """Teslimat sırasına göre atanan drone kimliği (atanmamışsa -1)"""
+        assignment = [-1] * len(self.index.delivery_ids)
+        for drone_id, delivery_list in self.chromosome.items():
+            for delivery_id in delivery_list:
+                assignment[self.index.delivery_position[delivery_id]] = drone_id
+        return assignment
+        
+    def visit_sequence(self, delivery_list: List[int]) -> Tuple[int, ...]:
+        """Drone'un teslimatları ziyaret sırası (öncelik sırası, eşitlikte liste sırası; sıralı modda liste sırası)"""
+        if self.ordered:
+            return tuple(delivery_list)
+        return self.index.sort_by_priority(delivery_list)
+        
+    def canonical_key(self) -> Tuple:
+        """Fitness'ı belirleyen kanonik anahtar: drone başına ziyaret dizileri
+        
+        Liste sırası farklı ama aynı sırayla ziyaret edilen kromozomlar aynı anahtarı üretir.
+        """
+        return tuple((drone_id, self.visit_sequence(delivery_list))
+                     for drone_id, delivery_list in sorted(self.chromosome.items()) if delivery_list)
+        
+    def calculate_fitness(self, graph: DeliveryGraph, no_fly_zones: List[NoFlyZone],
+                          route_cache: Optional[FitnessCache] = None) -> float:
         """
         Fitness fonksiyonu - PDF'deki formüle göre:
         fitness = (teslim_edilen_sayısı × 500) - (enerji_tüketimi × 0.1) - (kural_ihlali × 1000)
-        """
-        delivered_count = 0
-        total_energy = 0.0
-        rule_violations = 0
         
+        route_cache verilirse drone başına (enerji, ihlal) sonuçları ziyaret dizisine göre önbelleklenir.
+        Sadece işaretli (veya henüz hesaplanmamış) drone'ların katkısı yeniden hesaplanır; toplamlar
+        drone katkılarından toplanır (drone sırasıyla, böylece tam hesapla birebir aynı sonuç).
+        """
         for drone_id, delivery_list in self.chromosome.items():
+            if drone_id in self.drone_metrics and drone_id not in self.dirty_drones:
+                continue # Katkısı değişmedi
+                
             if not delivery_list:
-                continue
+                metrics = (0.0, 0, 0)
+            else:
+                drone = self.index.drone_by_id[drone_id]
                 
-            drone = next(d for d in self.drones if d.id == drone_id)
-            
-            # Teslimat sayısı
-            delivered_count += len(delivery_list) # Teslimat sayısı artır
-            
-            # Drone’a ait enerji & ihlal hesapla
-            energy, violations = self._calculate_drone_metrics(drone, delivery_list, graph, no_fly_zones)
-            total_energy += energy
-            rule_violations += violations
+                # Drone’a ait enerji & ihlal hesapla (aynı alt rota daha önce hesaplandıysa önbellekten)
+                if route_cache is not None:
+                    route_key = (drone_id, self.visit_sequence(delivery_list))
+                    route_metrics = route_cache.get(route_key)
+                    if route_metrics is None:
+                        route_metrics = self._calculate_drone_metrics(drone, delivery_list, graph, no_fly_zones)
+                        route_cache.put(route_key, route_metrics)
+                    energy, violations = route_metrics
+                else:
+                    energy, violations = self._calculate_drone_metrics(drone, delivery_list, graph, no_fly_zones)
+                metrics = (energy, violations, len(delivery_list))
+            self.drone_metrics[drone_id] = metrics
             
+        self.dirty_drones.clear()
+        
+        # Toplamlar: drone başına önbelleklenmiş katkıların toplamı (O(drone sayısı))
+        self.total_energy = 0.0
+        self.rule_violations = 0
+        self.delivered_count = 0
+        for drone_id in self.chromosome:
+            energy, violations, count = self.drone_metrics[drone_id]
+            self.total_energy += energy
+            self.rule_violations += violations
+            self.delivered_count += count
+        
         # PDF'deki fitness formülü
-        self.fitness = (delivered_count * 500) - (total_energy * 0.1) - (rule_violations * 1000)
+        self.fitness = (self.delivered_count * 500) - (self.total_energy * 0.1) - (self.rule_violations * 1000)
+        self.dirty = False
         return self.fitness
         
+    def evaluation_record(self) -> Tuple:
+        """Fitness önbelleğine yazılan sonuç: fitness, toplamlar ve drone başına katkılar"""
+        return (self.fitness, self.total_energy, self.rule_violations, self.delivered_count,
+                dict(self.drone_metrics))
+        
+    def restore_evaluation(self, record: Tuple):
+        """Önbellekten veya işçiden gelen sonucu uygula; metrikler yerel hesaplamayla aynı olur"""
+        self.fitness, self.total_energy, self.rule_violations, self.delivered_count, metrics = record
+        self.drone_metrics = dict(metrics) # Birey sonradan artımlı güncellerse önbellek bozulmasın
+        self.dirty_drones.clear()
+        self.dirty = False
+        
     def _calculate_drone_metrics(self, drone: Drone, delivery_list: List[int], 
                                 graph: DeliveryGraph, no_fly_zones: List[NoFlyZone]) -> Tuple[float, int]:
         """Drone için enerji tüketimi ve kural ihlallerini hesapla"""
@@ -82,8 +218,8 @@ class Individual:
         current_time = 0
         
         # Teslimatları öncelik sırasına göre sırala
-        deliveries = [next(d for d in self.deliveries if d.id == did) for did in delivery_list] 
-        deliveries.sort(key=lambda x: x.priority, reverse=True)
+        delivery_by_id = self.index.delivery_by_id
+        deliveries = [delivery_by_id[did] for did in self.visit_sequence(delivery_list)]
         
         for delivery in deliveries:
             # Mesafe ve enerji hesapla
@@ -122,12 +258,8 @@ class Individual:
     def is_feasible(self) -> bool:
         """Kapasite aşılıyor mu kontrol et"""
         for drone_id, delivery_list in self.chromosome.items():
-            drone = next(d for d in self.drones if d.id == drone_id)
-            
             # Kapasite kontrolü
-            total_weight = sum(next(d for d in self.deliveries if d.id == did).weight 
-                             for did in delivery_list)
-            if total_weight > drone.max_weight:
+            if self.index.total_weight(delivery_list) > self.index.capacity(drone_id):
                 return False
                 
         return True
@@ -135,34 +267,59 @@ class Individual:
     def repair(self):
         """Kapasite aşımını düzelterek kromozomu onar"""
         for drone_id, delivery_list in self.chromosome.items():
-            drone = next(d for d in self.drones if d.id == drone_id)
+            capacity = self.index.capacity(drone_id)
             
             # Kapasite aşımını düzelt
             total_weight = 0
             valid_deliveries = []
             
             for delivery_id in delivery_list:
-                delivery = next(d for d in self.deliveries if d.id == delivery_id)
-                if total_weight + delivery.weight <= drone.max_weight:
+                weight = self.index.weight(delivery_id)
+                if total_weight + weight <= capacity:
                     valid_deliveries.append(delivery_id)
-                    total_weight += delivery.weight
+                    total_weight += weight
                     
-            self.chromosome[drone_id] = valid_deliveries
+            if len(valid_deliveries) != len(delivery_list):
+                self.set_route(drone_id, valid_deliveries) # Teslimat çıkarıldı
             
     def copy(self):
-        """Kromozomun kopyasını oluştur"""
-        new_individual = Individual(self.drones, self.deliveries)
-        new_individual.chromosome = {k: v.copy() for k, v in self.chromosome.items()}
-        new_individual.fitness = self.fitness
-        new_individual.is_valid = self.is_valid
+        """Kromozomun kopyasını oluştur (kopyala-yaz: drone tuple'ları paylaşılır)"""
+        new_individual = shallow_copy(self) # fitness, bayraklar ve toplamlar aynen alınır (__init__ çalışmaz)
+        new_individual.chromosome = dict(self.chromosome) # Sadece drone -> tuple eşlemesi kopyalanır
+        new_individual.drone_metrics = self.drone_metrics.copy()
+        new_individual.dirty_drones = self.dirty_drones.copy()
         return new_individual
 
 
+# Süreç havuzundaki her işçide bir kez kurulan senaryo (drone'lar, teslimatlar, bölgeler, graf, alt rota önbelleği)
+worker_scenario = None
+
+def init_fitness_worker(drones: List[Drone], deliveries: List[DeliveryPoint],
+                        no_fly_zones: List[NoFlyZone], graph: DeliveryGraph, cache_size: int):
+    """İşçi süreci başlatıcısı: senaryo her işçiye sadece bir kez gönderilir"""
+    global worker_scenario
+    worker_scenario = (drones, deliveries, no_fly_zones, graph, FitnessCache(cache_size),
+                       ScenarioIndex(drones, deliveries))
+
+def evaluate_chromosome_batch(keys: List[Tuple]) -> List[Tuple]:
+    """Kanonik kromozom anahtarlarından oluşan bir grubun değerlendirme kayıtlarını hesapla (işçide)"""
+    drones, deliveries, no_fly_zones, graph, route_cache, index = worker_scenario
+    results = []
+    for key in keys:
+        individual = Individual(drones, deliveries, index, ordered=True) # Anahtar zaten ziyaret sırası
+        for drone_id, sequence in key:
+            individual.chromosome[drone_id] = tuple(sequence)
+        individual.calculate_fitness(graph, no_fly_zones, route_cache)
+        results.append(individual.evaluation_record())
+    return results
+
+
 class GeneticAlgorithm:
     """Genetic Algorithm ana sınıfı"""
     
     def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint], 
-                 no_fly_zones: List[NoFlyZone], graph: DeliveryGraph):
+                 no_fly_zones: List[NoFlyZone], graph: DeliveryGraph, cache_size: int = 10000,
+                 n_workers: int = 1):
         self.drones = drones
         self.deliveries = deliveries
         self.no_fly_zones = no_fly_zones
@@ -178,17 +335,151 @@ class GeneticAlgorithm:
         self.population = []
         self.best_individual = None
         self.fitness_history = []
+        self.index = ScenarioIndex(drones, deliveries) # Tüm bireylerin paylaştığı indeks
+        
+        # Önbellekler: tüm kromozom -> değerlendirme kaydı (fitness + metrikler) ve drone başına alt rota
+        self.fitness_cache = FitnessCache(cache_size)
+        self.route_cache = FitnessCache(cache_size)
+        self.evaluations = 0 # Gerçekten hesaplanan fitness sayısı
+        self.skipped_evaluations = 0 # Değişmediği için atlanan bireyler
+        self.cache_history = [] # Nesil başına (kümülatif) kromozom önbelleği isabet oranı
+        
+        self.n_workers = n_workers # 1'den büyükse fitness süreç havuzunda hesaplanır
+        self.verbose = True # Nesil ilerleme raporlarını yazdır
+        self.crossover_operator = 'drone' # 'drone' (drone listesi takası), 'ox' veya 'pmx' (dev tur)
+        self.replacement = 'generational' # 'generational' veya 'steady_state' (yerinde değiştirme)
+        
+        # Memetik mod: drone listeleri sıralı rotadır ve 2-opt / Or-opt ile iyileştirilir
+        self.memetic = False
+        self.local_search_rate = 0.2 # Yerel aramadan geçen yavru oranı (elitler her zaman)
+        self.local_search_budget = 30 # Drone rotası başına maliyet değerlendirme sınırı
+        self.route_optimizer = None # İlk kullanımda kurulur
+        
+        # Uyarlamalı kontrol (None/False: kapalı)
+        self.stagnation_limit = None # Bu kadar nesil iyileşme olmazsa erken dur
+        self.restart_after = None # Bu kadar nesil iyileşme olmazsa elitler dışındaki popülasyonu yenile
+        self.adaptive_rates = False # Mutasyon/çaprazlama oranlarını popülasyon çeşitliliğine göre ayarla
+        self.diversity_target = 0.3 # Bu çeşitliliğin altında mutasyon artırılır
+        self.max_mutation_rate = 0.5 # Uyarlamalı mutasyonun üst sınırı
+        self.diversity_history = [] # Nesil başına ortalama Hamming çeşitliliği (uyarlamalı modda)
+        self.restarts = 0 # Yapılan yeniden başlatma sayısı
+        self.stopped_generation = None # Erken durulan nesil
+        self.executor = None # evolve süresince açık kalan süreç havuzu
+        
+    def evaluate_individual(self, individual: Individual) -> float:
+        """Bireyin fitness'ını hesapla; değişmemiş bireyler ve bilinen kromozomlar yeniden hesaplanmaz"""
+        if not individual.dirty:
+            self.skipped_evaluations += 1
+            return individual.fitness
+            
+        key = individual.canonical_key()
+        record = self.fitness_cache.get(key)
+        if record is None:
+            individual.calculate_fitness(self.graph, self.no_fly_zones, self.route_cache)
+            self.fitness_cache.put(key, individual.evaluation_record())
+            self.evaluations += 1
+        else:
+            individual.restore_evaluation(record) # Enerji / ihlal / teslimat metrikleri de güncellenir
+        return individual.fitness
+        
+    def evaluate_population(self):
+        """Popülasyonda sadece değişen bireyleri değerlendir"""
+        if self.executor is None:
+            for individual in self.population:
+                self.evaluate_individual(individual)
+            return
+            
+        # Önbellekte olmayan kromozomlar tekilleştirilip işçilere gruplar halinde gönderilir
+        pending = {} # kanonik anahtar -> bu kromozoma sahip bireyler
+        for individual in self.population:
+            if not individual.dirty:
+                self.skipped_evaluations += 1
+                continue
+                
+            key = individual.canonical_key()
+            if key in pending:
+                self.fitness_cache.hits += 1 # Aynı nesilde tekrar eden kromozom
+                pending[key].append(individual)
+                continue
+                
+            record = self.fitness_cache.get(key)
+            if record is not None:
+                individual.restore_evaluation(record)
+            else:
+                pending[key] = [individual]
+                
+        keys = list(pending)
+        batch_size = max(1, math.ceil(len(keys) / self.n_workers))
+        batches = [keys[i:i + batch_size] for i in range(0, len(keys), batch_size)]
+        
+        for batch, values in zip(batches, self.executor.map(evaluate_chromosome_batch, batches)):
+            for key, record in zip(batch, values):
+                self.fitness_cache.put(key, record)
+                self.evaluations += 1
+                for individual in pending[key]:
+                    individual.restore_evaluation(record)
+            
+    def get_cache_stats(self) -> Dict:
+        """Fitness önbelleği istatistikleri"""
+        return {
+            'evaluations': self.evaluations,
+            'skipped_evaluations': self.skipped_evaluations,
+            'fitness_cache_hits': self.fitness_cache.hits,
+            'fitness_cache_misses': self.fitness_cache.misses,
+            'fitness_cache_hit_rate': self.fitness_cache.hit_rate(),
+            'route_cache_hits': self.route_cache.hits,
+            'route_cache_misses': self.route_cache.misses,
+            'route_cache_hit_rate': self.route_cache.hit_rate()
+        }
+        
+    def random_individual(self) -> Individual:
+        """Rastgele, kapasiteye uygun yeni birey"""
+        individual = Individual(self.drones, self.deliveries, self.index, ordered=self.memetic)
+        individual.randomize()
+        individual.repair()
+        if self.memetic:
+            self.local_search(individual)
+        return individual
         
     def initialize_population(self):
         """Başlangıç popülasyonunu oluştur"""
-        self.population = []
+        self.population = [self.random_individual() for _ in range(self.population_size)]
+        self.evaluate_population()
+        
+    def population_diversity(self) -> float:
+        """Ortalama Hamming çeşitliliği (0-1): birey çiftlerinin farklı atanan teslimat oranı
+        
+        Her teslimat sütunu için değer sayımlarından farklı çift sayısı O(popülasyon × teslimat)
+        sürede hesaplanır.
+        """
+        size = len(self.population)
+        if size < 2 or not self.deliveries:
+            return 0.0
+            
+        assignments = [individual.assignment_array() for individual in self.population]
+        differing = 0
+        for column in zip(*assignments):
+            counts = Counter(column)
+            differing += (size * size - sum(c * c for c in counts.values())) // 2
+        return differing / (len(self.deliveries) * size * (size - 1) / 2)
+        
+    def adapt_rates(self):
+        """Çeşitlilik düştükçe mutasyonu artır, çaprazlamayı azalt (başlangıç oranlarına göre)"""
+        diversity = self.population_diversity()
+        self.diversity_history.append(diversity)
         
-        for _ in range(self.population_size):
-            individual = Individual(self.drones, self.deliveries)
-            individual.randomize()
-            individual.repair()
-            individual.calculate_fitness(self.graph, self.no_fly_zones)
-            self.population.append(individual)
+        base_mutation, base_crossover = self.base_rates
+        ratio = min(1.0, diversity / self.diversity_target) if self.diversity_target > 0 else 1.0
+        self.mutation_rate = base_mutation + (max(self.max_mutation_rate, base_mutation) - base_mutation) * (1 - ratio)
+        self.crossover_rate = base_crossover * (0.5 + 0.5 * ratio)
+        
+    def restart(self):
+        """Elitler dışındaki popülasyonu rastgele bireylerle yenile"""
+        self.evaluate_population() # Yeni neslin fitness'ları elit seçimi için gerekli
+        elite = sorted(self.population, key=lambda x: x.fitness, reverse=True)[:self.elite_size]
+        fresh = [self.random_individual() for _ in range(self.population_size - len(elite))]
+        self.population = elite + fresh
+        self.restarts += 1
             
     def selection(self, tournament_size: int = 3) -> Individual:
         """Tournament selection ile ebeveyn seç"""
@@ -201,38 +492,133 @@ class GeneticAlgorithm:
         child2 = parent2.copy()
         
         if random.random() < self.crossover_rate:
+            if self.crossover_operator in ('ox', 'pmx'):
+                # Sıra tabanlı çaprazlama: dev tur permütasyonları üzerinde
+                tour1, tour2 = self.to_giant_tour(parent1), self.to_giant_tour(parent2)
+                operator = self._order_crossover if self.crossover_operator == 'ox' else self._pmx_crossover
+                self.from_giant_tour(child1, operator(tour1, tour2))
+                self.from_giant_tour(child2, operator(tour2, tour1))
+                return child1, child2
+                
             # Drone bazlı çaprazlama
             crossover_point = random.randint(1, len(self.drones) - 1)
             drone_ids = [drone.id for drone in self.drones]
             
+            # Çocuğun taşıması gereken teslimatlar: kendi ebeveyninde atanmış olanlar
+            expected1 = [did for delivery_list in child1.chromosome.values() for did in delivery_list]
+            expected2 = [did for delivery_list in child2.chromosome.values() for did in delivery_list]
+            
             for i in range(crossover_point):
                 drone_id = drone_ids[i]
                 # Teslimatları değiştir
                 child1.chromosome[drone_id], child2.chromosome[drone_id] = \
-                    child2.chromosome[drone_id].copy(), child1.chromosome[drone_id].copy()
+                    child2.chromosome[drone_id], child1.chromosome[drone_id]
+                child1.mark_dirty(drone_id)
+                child2.mark_dirty(drone_id)
                     
-            # Çakışan teslimatları temizle
-            self._resolve_conflicts(child1)
-            self._resolve_conflicts(child2)
+            # Çakışan teslimatları temizle, düşenleri yeniden ata
+            self._resolve_conflicts(child1, expected1)
+            self._resolve_conflicts(child2, expected2)
             
         return child1, child2
         
-    def _resolve_conflicts(self, individual: Individual):
-        """Çakışan teslimatları çöz"""
-        all_deliveries = []
-        for delivery_list in individual.chromosome.values():
-            all_deliveries.extend(delivery_list)
-            
-        # Tekrarlananları bul
-        unique_deliveries = list(set(all_deliveries))
-        duplicates = [d for d in all_deliveries if all_deliveries.count(d) > 1]
-        
-        # Tekrarları temizle
-        for drone_id in individual.chromosome:
-            individual.chromosome[drone_id] = [d for d in individual.chromosome[drone_id] 
-                                             if d not in duplicates or 
-                                             individual.chromosome[drone_id].index(d) == 0]
-                                             
+    def _resolve_conflicts(self, individual: Individual, expected: Optional[List[int]] = None):
+        """Çakışan teslimatları O(n) çöz
+        
+        Her teslimat ilk görüldüğü drone'da kalır (teslimat sırasıyla indekslenen seen dizisi).
+        expected listesindeki ama artık hiçbir drone'da olmayan teslimatlar, kapasitesi yeten
+        en az yüklü drone'a atanır.
+        """
+        index = individual.index
+        seen = [False] * len(index.delivery_ids)
+        loads = {} # drone_id -> toplam yük
+        
+        for drone_id, delivery_list in individual.chromosome.items():
+            kept = []
+            load = 0.0
+            for delivery_id in delivery_list:
+                i = index.delivery_position[delivery_id]
+                if not seen[i]:
+                    seen[i] = True
+                    kept.append(delivery_id)
+                    load += index.weights[i]
+            if len(kept) != len(delivery_list):
+                individual.set_route(drone_id, kept)
+            loads[drone_id] = load
+            
+        # Düşen teslimatları en az yüklü uygun drone'a yerleştir
+        for delivery_id in expected or []:
+            i = index.delivery_position[delivery_id]
+            if seen[i]:
+                continue
+            weight = index.weights[i]
+            capable = [d_id for d_id in loads if loads[d_id] + weight <= index.capacity(d_id)]
+            if capable:
+                target = min(capable, key=lambda d_id: loads[d_id])
+                individual.add_delivery(target, delivery_id)
+                loads[target] += weight
+            seen[i] = True
+            
+    def to_giant_tour(self, individual: Individual) -> List[int]:
+        """Kromozomu dev tur permütasyonuna çevir
+        
+        Drone listeleri sırayla yazılır, her drone'dan sonra bir ayraç (-1, -2, ...) gelir;
+        son ayraçtan sonraki teslimatlar atanmamıştır. Her eleman tam bir kez bulunur.
+        """
+        tour = []
+        assigned = set()
+        for j, drone_id in enumerate(self.index.drone_ids):
+            tour.extend(individual.chromosome[drone_id])
+            assigned.update(individual.chromosome[drone_id])
+            tour.append(-(j + 1)) # Ayraç
+        tour.extend(did for did in self.index.delivery_ids if did not in assigned)
+        return tour
+        
+    def from_giant_tour(self, individual: Individual, tour: List[int]):
+        """Dev turu kromozoma çevir (ayraçlar drone'lar arasındaki sınırlardır)"""
+        drone_ids = self.index.drone_ids
+        chromosome = {drone_id: [] for drone_id in drone_ids}
+        segment = 0
+        for element in tour:
+            if element < 0:
+                segment += 1 # Etiketinden bağımsız: sıradaki ayraç sıradaki drone'a geçer
+            elif segment < len(drone_ids):
+                chromosome[drone_ids[segment]].append(element)
+        individual.set_chromosome(chromosome)
+        
+    def _order_crossover(self, tour1: List[int], tour2: List[int]) -> List[int]:
+        """OX: tour1'in bir kesiti korunur, kalan elemanlar tour2'deki sırayla doldurulur"""
+        size = len(tour1)
+        start, end = sorted(random.sample(range(size + 1), 2))
+        child = [None] * size
+        child[start:end] = tour1[start:end]
+        kept = set(tour1[start:end])
+        
+        # tour2 kesitin sonundan başlayarak dolaşılır
+        fill = [tour2[(end + k) % size] for k in range(size)]
+        fill = [element for element in fill if element not in kept]
+        for k, position in enumerate(list(range(end, size)) + list(range(0, start))):
+            child[position] = fill[k]
+        return child
+        
+    def _pmx_crossover(self, tour1: List[int], tour2: List[int]) -> List[int]:
+        """PMX: tour1'in kesiti kopyalanır, çakışan elemanlar kesit eşlemesiyle yer değiştirir"""
+        size = len(tour1)
+        start, end = sorted(random.sample(range(size + 1), 2))
+        child = tour2.copy()
+        position = {element: k for k, element in enumerate(child)} # O(1) konum arama
+        
+        for k in range(start, end):
+            element = tour1[k]
+            if child[k] == element:
+                continue
+            # element'i k'ye getir, k'deki elemanı element'in eski yerine taşı
+            other_position = position[element]
+            child[k], child[other_position] = element, child[k]
+            position[child[other_position]] = other_position
+            position[element] = k
+        return child
+        
     def mutate(self, individual: Individual):
         """Mutasyon operatörü"""
         if random.random() < self.mutation_rate:
@@ -261,10 +647,10 @@ class GeneticAlgorithm:
                 delivery2 = random.choice(individual.chromosome[drone2])
                 
                 # Değiştir
-                individual.chromosome[drone1].remove(delivery1)
-                individual.chromosome[drone2].remove(delivery2)
-                individual.chromosome[drone1].append(delivery2)
-                individual.chromosome[drone2].append(delivery1)
+                individual.remove_delivery(drone1, delivery1)
+                individual.remove_delivery(drone2, delivery2)
+                individual.add_delivery(drone1, delivery2)
+                individual.add_delivery(drone2, delivery1)
                 
     def _move_mutation(self, individual: Individual):
         """Bir teslimatı başka drone'a taşı"""
@@ -277,8 +663,8 @@ class GeneticAlgorithm:
             
             if individual.chromosome[source_drone]:
                 delivery = random.choice(individual.chromosome[source_drone])
-                individual.chromosome[source_drone].remove(delivery)
-                individual.chromosome[target_drone].append(delivery)
+                individual.remove_delivery(source_drone, delivery)
+                individual.add_delivery(target_drone, delivery)
                 
     def _add_mutation(self, individual: Individual):
         """Atanmamış teslimat ekle"""
@@ -291,7 +677,7 @@ class GeneticAlgorithm:
         if unassigned:
             delivery_id = random.choice(unassigned)
             drone_id = random.choice([d.id for d in self.drones])
-            individual.chromosome[drone_id].append(delivery_id)
+            individual.add_delivery(drone_id, delivery_id)
             
     def _remove_mutation(self, individual: Individual):
         """Rastgele teslimat kaldır"""
@@ -301,60 +687,187 @@ class GeneticAlgorithm:
             drone_id = random.choice(drone_ids)
             if individual.chromosome[drone_id]:
                 delivery = random.choice(individual.chromosome[drone_id])
-                individual.chromosome[drone_id].remove(delivery)
+                individual.remove_delivery(drone_id, delivery)
+                
+    def local_search(self, individual: Individual):
+        """Her drone'un rotasını 2-opt / Or-opt ile iyileştir (memetik mod)
+        
+        Hamleler mesafe farkıyla taranır; kabul için drone'un gerçek fitness katkısı
+        (yüke bağlı enerji ve kural ihlalleri) da iyileşmelidir.
+        """
+        if self.route_optimizer is None:
+            positions = {d.id: d.pos for d in self.deliveries}
+            positions.update({('depot', drone.id): drone.start_pos for drone in self.drones})
+            self.route_optimizer = RouteOptimizer(positions)
+            
+        for drone_id, delivery_list in individual.chromosome.items():
+            if len(delivery_list) < 2:
+                continue
+            drone = self.index.drone_by_id[drone_id]
+            
+            def cost(route, drone=drone):
+                energy, violations = individual._calculate_drone_metrics(drone, route, self.graph,
+                                                                         self.no_fly_zones)
+                return energy * 0.1 + violations * 1000 # Fitness'taki katkının eksi işaretlisi
+                
+            improved = self.route_optimizer.improve(delivery_list, ('depot', drone_id), cost,
+                                                    self.local_search_budget)
+            if tuple(improved) != tuple(delivery_list):
+                individual.set_route(drone_id, improved)
                 
+        individual.optimized = True
+        
+    def next_generation(self):
+        """Elitler + seçim, çaprazlama ve mutasyonla yeni nesli oluştur"""
+        new_population = []
+        
+        # Elite seçimi (değişmeden kopyalanır, fitness'ları yeniden hesaplanmaz)
+        elite = sorted(self.population, key=lambda x: x.fitness, reverse=True)[:self.elite_size]
+        new_population.extend([ind.copy() for ind in elite])
+        if self.memetic:
+            for individual in new_population:
+                if not individual.optimized:
+                    self.local_search(individual)
+        
+        # Geri kalan popülasyonu üret
+        while len(new_population) < self.population_size:
+            new_population.extend(self.breed())
+            
+        # Popülasyon boyutunu ayarla
+        self.population = new_population[:self.population_size]
+        
+    def breed(self) -> Tuple[Individual, Individual]:
+        """Seçim, çaprazlama, mutasyon (ve memetik modda yerel arama) ile iki yavru üret"""
+        parent1 = self.selection()
+        parent2 = self.selection()
+        
+        child1, child2 = self.crossover(parent1, parent2)
+        
+        self.mutate(child1)
+        self.mutate(child2)
+        
+        if self.memetic:
+            for child in (child1, child2):
+                if random.random() < self.local_search_rate:
+                    self.local_search(child)
+                    
+        return child1, child2
+        
+    def steady_state_generation(self):
+        """Steady-state: yavrular hemen değerlendirilip daha iyiyse en kötü bireyin yerine yazılır
+        
+        Popülasyon listesi yeniden kurulmaz; nesil başına elit olmayan birey sayısı kadar yavru üretilir.
+        En kötü birey (fitness, indeks) min-heap'i ile O(log n) bulunur.
+        """
+        worst = [(individual.fitness, i) for i, individual in enumerate(self.population)]
+        heapq.heapify(worst)
+        produced = 0
+        
+        while produced < self.population_size - self.elite_size:
+            for child in self.breed():
+                self.evaluate_individual(child)
+                worst_fitness, i = worst[0]
+                if child.fitness > worst_fitness:
+                    self.population[i] = child
+                    heapq.heapreplace(worst, (child.fitness, i))
+                produced += 1
+        
     def evolve(self) -> Individual:
         """GA'yı çalıştır ve en iyi çözümü döndür"""
-        print("Genetic Algorithm başlatılıyor...")
+        log.info('ga_started', "Genetic Algorithm başlatılıyor...",
+                 population=self.population_size, generations=self.generations)
         
-        # Başlangıç popülasyonu
-        self.initialize_population()
+        if self.n_workers > 1:
+            # Senaryo her işçiye başlatıcıyla bir kez gönderilir, sonra sadece kromozomlar taşınır
+            with ProcessPoolExecutor(max_workers=self.n_workers, initializer=init_fitness_worker,
+                                     initargs=(self.drones, self.deliveries, self.no_fly_zones,
+                                               self.graph, self.route_cache.max_size)) as executor:
+                self.executor = executor
+                try:
+                    self.run_generations()
+                finally:
+                    self.executor = None
+        else:
+            self.run_generations()
+            
+        if log.info_enabled:
+            log.info('ga_complete', f"GA tamamlandı. En iyi fitness: {self.best_individual.fitness:.2f}\n"
+                     f"Fitness hesaplama: {self.evaluations}, atlanan: {self.skipped_evaluations}, "
+                     f"önbellek isabeti: %{self.fitness_cache.hit_rate()*100:.1f}",
+                     best_fitness=self.best_individual.fitness, evaluations=self.evaluations,
+                     skipped=self.skipped_evaluations, cache_hit_rate=self.fitness_cache.hit_rate())
+        return self.best_individual
         
+    def run_generations(self):
+        """Başlangıç popülasyonunu kur ve nesilleri çalıştır"""
+        progress = self.begin_run()
         for generation in range(self.generations):
-            # Fitness değerlendirmesi
-            for individual in self.population:
-                individual.calculate_fitness(self.graph, self.no_fly_zones)
-                
-            # En iyi bireyi bul
-            current_best = max(self.population, key=lambda x: x.fitness)
-            if self.best_individual is None or current_best.fitness > self.best_individual.fitness:
-                self.best_individual = current_best.copy()
+            if not self.run_generation(generation, progress):
+                break
                 
-            self.fitness_history.append(current_best.fitness)
+        if self.adaptive_rates:
+            self.mutation_rate, self.crossover_rate = self.base_rates
             
-            # İlerleme raporu
-            if generation % 10 == 0:
-                avg_fitness = sum(ind.fitness for ind in self.population) / len(self.population)
-                print(f"Nesil {generation}: En iyi fitness = {current_best.fitness:.2f}, "
-                      f"Ortalama = {avg_fitness:.2f}")
-                
-            # Yeni nesil oluştur
-            new_population = []
+    def begin_run(self) -> Dict:
+        """Başlangıç popülasyonunu kur; run_generation'ın kullandığı durgunluk takibi durumunu döndür"""
+        self.initialize_population()
+        self.base_rates = (self.mutation_rate, self.crossover_rate) # Uyarlamanın referansı
+        self.stopped_generation = None
+        return {'best_fitness': None, 'last_improvement': 0, 'last_restart': 0}
+        
+    def run_generation(self, generation: int, progress: Dict) -> bool:
+        """Tek nesil: oran uyarlama, adım, durgunluk takibi ve yeniden başlatma; erken durulursa False
+        
+        run_generations ve ada modelindeki her ada aynı nesil döngüsünü bu metotla çalıştırır.
+        """
+        if self.adaptive_rates:
+            self.adapt_rates()
             
-            # Elite seçimi
-            elite = sorted(self.population, key=lambda x: x.fitness, reverse=True)[:self.elite_size]
-            new_population.extend([ind.copy() for ind in elite])
+        self.step(generation)
+        
+        # Durgunluk takibi: en iyi fitness son ne zaman iyileşti
+        if progress['best_fitness'] is None or self.fitness_history[-1] > progress['best_fitness'] + 1e-9:
+            progress['best_fitness'] = self.fitness_history[-1]
+            progress['last_improvement'] = generation
+        stagnant = generation - max(progress['last_improvement'], progress['last_restart'])
+        
+        if self.stagnation_limit and generation - progress['last_improvement'] >= self.stagnation_limit:
+            self.stopped_generation = generation
+            if self.verbose and log.info_enabled:
+                log.info('ga_stopped', f"Nesil {generation}: {self.stagnation_limit} nesildir iyileşme yok, erken durduruldu",
+                         generation=generation)
+            return False
             
-            # Geri kalan popülasyonu üret
-            while len(new_population) < self.population_size:
-                parent1 = self.selection()
-                parent2 = self.selection()
-                
-                child1, child2 = self.crossover(parent1, parent2)
-                
-                self.mutate(child1)
-                self.mutate(child2)
-                
-                child1.calculate_fitness(self.graph, self.no_fly_zones)
-                child2.calculate_fitness(self.graph, self.no_fly_zones)
-                
-                new_population.extend([child1, child2])
-                
-            # Popülasyon boyutunu ayarla
-            self.population = new_population[:self.population_size]
+        if self.restart_after and stagnant >= self.restart_after:
+            self.restart()
+            progress['last_restart'] = generation
+        return True
+        
+    def step(self, generation: int):
+        """Tek nesil: değerlendir, en iyiyi kaydet ve yeni nesli oluştur"""
+        # Fitness değerlendirmesi (sadece değişen bireyler)
+        self.evaluate_population()
             
-        print(f"GA tamamlandı. En iyi fitness: {self.best_individual.fitness:.2f}")
-        return self.best_individual
+        # En iyi bireyi bul
+        current_best = max(self.population, key=lambda x: x.fitness)
+        if self.best_individual is None or current_best.fitness > self.best_individual.fitness:
+            self.best_individual = current_best.copy()
+            
+        self.fitness_history.append(current_best.fitness)
+        self.cache_history.append(self.fitness_cache.hit_rate())
+        
+        # İlerleme raporu
+        if self.verbose and generation % 10 == 0 and log.info_enabled:
+            avg_fitness = sum(ind.fitness for ind in self.population) / len(self.population)
+            log.info('ga_generation', f"Nesil {generation}: En iyi fitness = {current_best.fitness:.2f}, "
+                     f"Ortalama = {avg_fitness:.2f}",
+                     generation=generation, best_fitness=current_best.fitness, average_fitness=avg_fitness)
+            
+        # Yeni nesil oluştur
+        if self.replacement == 'steady_state':
+            self.steady_state_generation()
+        else:
+            self.next_generation()
         
     def get_solution_routes(self, individual: Individual) -> Dict[int, List[str]]:
         """Çözümden drone rotalarını çıkar"""
@@ -364,9 +877,8 @@ class GeneticAlgorithm:
             if delivery_list:
                 route = [f"drone_{drone_id}"]
                 
-                # Teslimatları öncelik sırasına göre sırala
-                deliveries = [next(d for d in self.deliveries if d.id == did) for did in delivery_list]
-                deliveries.sort(key=lambda x: x.priority, reverse=True)
+                # Teslimatları ziyaret sırasına göre sırala (öncelik; memetik modda rota sırası)
+                deliveries = [self.index.delivery_by_id[did] for did in individual.visit_sequence(delivery_list)]
                 
                 for delivery in deliveries:
                     route.append(f"delivery_{delivery.id}")
@@ -387,13 +899,13 @@ class GeneticAlgorithm:
         total_weight = 0.0
         
         for drone_id, delivery_list in individual.chromosome.items():
-            drone = next(d for d in self.drones if d.id == drone_id)
+            drone = self.index.drone_by_id[drone_id]
             print(f"\nDrone {drone_id} (Kapasite: {drone.max_weight}kg, Batarya: {drone.battery}mAh):")
             
             if delivery_list:
                 drone_weight = 0
                 for delivery_id in delivery_list:
-                    delivery = next(d for d in self.deliveries if d.id == delivery_id)
+                    delivery = self.index.delivery_by_id[delivery_id]
                     drone_weight += delivery.weight
                     total_weight += delivery.weight
                     print(f"  - Teslimat {delivery_id}: Pos{delivery.pos}, "
@@ -0,0 +1,142 @@
+"""
+Zaman Pencereli Ekleme Tur Kurucu - Solomon I1 tarzı tur oluşturma
+Bu dosya, boşa çıkan drone için turu bir tohum teslimatla (en erken bitiş zamanı veya depoya en uzak) başlatır ve her adımda depoya uzaklığı ile ek mesafesi arasındaki farkı (c2 = λ·d(depo, u) - c1) en büyük olan teslimatı, ek mesafesi (c1) en küçük olan uygun konuma ekler. Her durak için en erken varış (ileri geçiş) ve en geç varış (geri geçiş) sınırları önceden hesaplanır; bir eklemenin sonraki durakları ne kadar ileri ittiği (push-forward) tek karşılaştırmayla kontrol edilir. Tüm adaylar ve konumlar NumPy ile birlikte değerlendirilir.
+"""
+import numpy as np # Vektörel ekleme değerlendirmesi
+from typing import Callable, List, Tuple
+from .drone import Drone # Drone sınıfı
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+from .delivery_pool import DeliveryPool # Bekleyen teslimat havuzu
+from .trip_sequence import TripSequence # Tur enerjisi ve varış zamanları
+
+class InsertionTripBuilder:
+    """Zaman penceresi kısıtlı en ucuz ekleme (Solomon I1) ile tur kurucu"""
+
+    def __init__(self, deliveries: List[DeliveryPoint], late_tolerance: int = 120, max_stops: int = 8,
+                 seed: str = 'deadline', depot_weight: float = 1.0):
+        self.deliveries = list(deliveries) # Dizilerle aynı sırada; çevrimiçi modda add() ile büyür
+        self.late_tolerance = late_tolerance # Zamanında yetişemeyen teslimatlara tanınan gecikme
+        self.max_stops = max_stops # Tur başına en fazla teslimat
+        self.seed = seed # Tohum seçimi: 'deadline' (en erken bitiş) veya 'farthest' (depoya en uzak)
+        self.depot_weight = depot_weight # c2'deki λ: depodan uzak teslimatları öne alma ağırlığı
+        self.energy_limited = False # Son turda aday sadece mevcut batarya yüzünden mi elendi
+
+        # Teslimat özellikleri bir kez diziye alınır; alive bekleyen teslimatların indeksleridir
+        self.ids = np.array([d.id for d in deliveries], dtype=int)
+        self.positions = np.array([d.pos for d in deliveries], dtype=float).reshape(-1, 2)
+        self.weights = np.array([d.weight for d in deliveries], dtype=float)
+        self.deadlines = np.array([d.time_window[1] for d in deliveries], dtype=float)
+        self.alive = np.arange(len(deliveries))
+
+    def add(self, deliveries: List[DeliveryPoint]):
+        """Sonradan gelen teslimatları ekle; diziler bekleyen teslimatlara sıkıştırılır (O(açık sipariş))"""
+        keep = self.alive
+        self.deliveries = [self.deliveries[i] for i in keep] + list(deliveries)
+        self.ids = np.concatenate([self.ids[keep], np.array([d.id for d in deliveries], dtype=int)])
+        self.positions = np.concatenate([self.positions[keep],
+                                         np.array([d.pos for d in deliveries], dtype=float).reshape(-1, 2)])
+        self.weights = np.concatenate([self.weights[keep], np.array([d.weight for d in deliveries], dtype=float)])
+        self.deadlines = np.concatenate([self.deadlines[keep],
+                                         np.array([d.time_window[1] for d in deliveries], dtype=float)])
+        self.alive = np.arange(len(self.deliveries))
+
+    def latest_arrivals(self, trip: TripSequence, targets: List[float]) -> List[float]:
+        """Her durağın, sonraki hiçbir durağı hedefinden geç bırakmadan ulaşılabileceği en geç varış (geri geçiş)"""
+        speed = trip.drone.speed * 60
+        latest = [0.0] * len(trip)
+        bound = float('inf')
+        for i in range(len(trip) - 1, -1, -1):
+            if i + 1 < len(trip):
+                bound -= trip.service_time + trip.leg_distance[i + 1] / speed
+            bound = min(targets[i], bound)
+            latest[i] = bound
+        return latest
+
+    def build(self, drone: Drone, pool: DeliveryPool, start_time: float,
+              blocked: Callable[[Tuple[float, float]], bool] = lambda pos: False) -> List[DeliveryPoint]:
+        """start_time'da depodan kalkan drone için zaman pencereli tur kur
+
+        Hedef varış, teslimat doğrudan uçuşla hâlâ zamanında yapılabiliyorsa pencere bitişi, değilse
+        bitiş + late_tolerance'tır. blocked(pos) True dönen teslimatlar (aktif no-fly zone) bu tura alınmaz.
+        """
+        self.energy_limited = False
+        if len(self.alive):
+            self.alive = self.alive[np.fromiter((self.ids[i] in pool for i in self.alive), dtype=bool,
+                                                count=len(self.alive))]
+        candidates = self.alive[self.weights[self.alive] <= drone.max_weight]
+        if not len(candidates):
+            return []
+
+        depot = np.array(drone.start_pos, dtype=float)
+        speed = drone.speed * 60 # metre / dakika
+        positions = self.positions[candidates]
+        weights = self.weights[candidates]
+        depot_distance = np.sqrt(((positions - depot) ** 2).sum(axis=1))
+        deadlines = self.deadlines[candidates]
+        on_time = start_time + depot_distance / speed <= deadlines # Doğrudan uçuşla zamanında yetişilebilir
+        targets = np.where(on_time, deadlines, deadlines + self.late_tolerance)
+
+        trip = TripSequence(drone)
+        target_of = {} # teslimat kimliği -> hedef varış
+        excluded = np.zeros(len(candidates), dtype=bool) # Bu turda kullanılmış veya bölgede kalan adaylar
+        energy = drone.calculate_energy_consumption # Dizilerle de çalışır (doğrusal model)
+
+        while len(trip) < self.max_stops:
+            # Her ekleme konumu p için: önceki düğüm, sonraki düğüm, kalkış zamanı ve sonraki durağın en geç varışı
+            k = len(trip)
+            nodes = np.array(trip.positions, dtype=float)
+            arrivals = trip.arrival_times(start_time)
+            departure = np.array([start_time] + [arrival + trip.service_time for arrival in arrivals])
+            next_latest = np.array(self.latest_arrivals(trip, [target_of[d.id] for d in trip.stops]) + [np.inf])
+            leg = np.array(trip.leg_distance)
+            load = np.array(trip.leg_load)
+            carried = np.array(trip.prefix_distance[:-1])
+
+            to_u = np.sqrt(((positions[:, None, :] - nodes[None, :-1, :]) ** 2).sum(axis=2)) # (n, k+1)
+            from_u = np.sqrt(((positions[:, None, :] - nodes[None, 1:, :]) ** 2).sum(axis=2))
+            arrival_u = departure[None, :] + to_u / speed
+            pushed = arrival_u + trip.service_time + from_u / speed # Sonraki durağın yeni varışı
+            feasible = (arrival_u <= targets[:, None]) & (pushed <= next_latest[None, :]) # Push-forward kontrolü
+            feasible &= ~excluded[:, None] & (trip.total_weight + weights <= drone.max_weight)[:, None]
+
+            # TripSequence.insertion_cost'un vektörel hâli
+            w = weights[:, None]
+            delta = (energy(carried, w) - energy(carried, 0) + energy(to_u, load + w) +
+                     energy(from_u, load) - energy(leg, load))
+            fits_battery = trip.energy + delta <= drone.battery
+            if k == 0:
+                self.energy_limited = bool((feasible & ~fits_battery & (trip.energy + delta <= drone.max_battery)).any())
+            feasible &= fits_battery
+
+            added = np.where(feasible, to_u + from_u - leg, np.inf) # c1: ek mesafe
+            position = added.argmin(axis=1)
+            c1 = added[np.arange(len(candidates)), position]
+            usable = np.isfinite(c1)
+            if not usable.any():
+                break
+
+            if k == 0:
+                # Tohum: hâlâ zamanında yetişilebilenler önce, sonra en erken bitiş (veya depoya en uzak)
+                score = (-deadlines if self.seed == 'deadline' else depot_distance) + on_time * 1e6
+            else:
+                score = self.depot_weight * depot_distance - c1 # c2
+            score = np.where(usable, score, -np.inf)
+
+            for index in np.argsort(-score, kind='stable'):
+                if not np.isfinite(score[index]):
+                    index = None
+                    break
+                delivery = self.deliveries[candidates[index]]
+                excluded[index] = True
+                if not blocked(delivery.pos):
+                    break
+            else:
+                index = None
+            if index is None:
+                break
+            trip.insert(delivery, int(position[index]))
+            target_of[delivery.id] = float(targets[index])
+
+        if trip.stops:
+            self.energy_limited = False
+        return trip.stops
@@ -0,0 +1,145 @@
+"""
+Ada Modeli Genetik Algoritma - Birden fazla popülasyonu ayrı süreçlerde evrimleştirir
+Bu dosya, GeneticAlgorithm'i her biri kendi sürecinde çalışan bağımsız adalara (popülasyonlara) böler; adalar halka şeklinde kuyruklarla bağlanır ve her k nesilde en iyi bireylerini bir sonraki adaya göç ettirir. Böylece tek popülasyonun erken yakınsaması önlenir ve tüm çekirdekler kullanılır.
+"""
+import random # Ada tohumları için
+import multiprocessing # Ada süreçleri ve göç kuyrukları
+from typing import List, Dict, Optional
+from .drone import Drone # Drone sınıfı
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+from .no_fly_zone import NoFlyZone # No-fly zone sınıfı
+from .graph_builder import DeliveryGraph # Mesafe grafı
+from .genetic_algorithm import GeneticAlgorithm, Individual, log # Her ada bir GA örneği; 'ga' olay kanalı
+
+def run_island(island_id: int, drones: List[Drone], deliveries: List[DeliveryPoint],
+               no_fly_zones: List[NoFlyZone], graph: DeliveryGraph, params: Dict, seed: int,
+               inbox, outbox, results, migration_interval: int, migration_size: int):
+    """Tek bir adayı çalıştır (ayrı süreçte); göçmenler sadece kromozom olarak taşınır"""
+    random.seed(seed)
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    for name, value in params.items():
+        setattr(ga, name, value) # population_size, generations, mutation_rate, ...
+    ga.verbose = False # Adalar ilerlemeyi ana sürece sonuç olarak bildirir
+
+    progress = ga.begin_run()
+    for generation in range(ga.generations):
+        ga.run_generation(generation, progress) # Erken durdurma parametresi adalara geçirilmez
+
+        # Son nesil hariç her migration_interval nesilde halkadaki sonraki adaya göç
+        if (generation + 1) % migration_interval == 0 and generation + 1 < ga.generations:
+            ga.evaluate_population()
+            ranked = sorted(ga.population, key=lambda x: x.fitness, reverse=True)
+            outbox.put([dict(ind.chromosome) for ind in ranked[:migration_size]])
+
+            # Gelen göçmenler en kötü bireylerin yerini alır
+            immigrants = inbox.get()
+            for worst, chromosome in zip(reversed(ranked), immigrants):
+                worst.set_chromosome(chromosome)
+
+    results.put((island_id, ga.fitness_history, ga.best_individual.chromosome,
+                 ga.best_individual.fitness, ga.get_cache_stats(), ga.diversity_history, ga.restarts))
+
+
+class IslandGeneticAlgorithm(GeneticAlgorithm):
+    """Halka topolojisinde periyodik göçle ada modeli GA"""
+
+    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint],
+                 no_fly_zones: List[NoFlyZone], graph: DeliveryGraph, n_islands: int = 4,
+                 migration_interval: int = 10, migration_size: int = 2, seed: Optional[int] = None):
+        super().__init__(drones, deliveries, no_fly_zones, graph)
+        self.n_islands = n_islands # Ada (süreç) sayısı
+        self.migration_interval = migration_interval # Kaç nesilde bir göç
+        self.migration_size = migration_size # Her göçte gönderilen en iyi birey sayısı
+        self.seed = seed # Verilirse ada i'nin tohumu seed + i
+
+        self.island_histories = {} # ada -> nesil başına en iyi fitness
+        self.island_best = {} # ada -> en iyi fitness
+        self.island_stats = {} # ada -> fitness önbelleği sayaçları
+        self.island_diversity = {} # ada -> nesil başına çeşitlilik (uyarlamalı modda)
+
+    def evolve(self) -> Individual:
+        """Adaları paralel çalıştır ve tüm adaların en iyi çözümünü döndür"""
+        log.info('ga_started', f"Genetic Algorithm (ada modeli, {self.n_islands} ada) başlatılıyor...",
+                 islands=self.n_islands, population=self.population_size, generations=self.generations)
+
+        params = {
+            'population_size': self.population_size, # Ada başına popülasyon
+            'generations': self.generations,
+            'mutation_rate': self.mutation_rate,
+            'crossover_rate': self.crossover_rate,
+            'elite_size': self.elite_size,
+            'crossover_operator': self.crossover_operator,
+            'replacement': self.replacement,
+            'memetic': self.memetic,
+            'local_search_rate': self.local_search_rate,
+            'local_search_budget': self.local_search_budget,
+            # Erken durdurma adalarda kullanılmaz: göç için tüm adalar aynı nesil sayısını çalıştırır
+            'adaptive_rates': self.adaptive_rates,
+            'diversity_target': self.diversity_target,
+            'max_mutation_rate': self.max_mutation_rate,
+            'restart_after': self.restart_after
+        }
+        base_seed = self.seed if self.seed is not None else random.randrange(2 ** 31)
+
+        # Ada i, kuyruk i'den alır ve kuyruk (i+1)'e gönderir: halka
+        queues = [multiprocessing.Queue() for _ in range(self.n_islands)]
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=run_island, args=(
+                i, self.drones, self.deliveries, self.no_fly_zones, self.graph, params, base_seed + i,
+                queues[i], queues[(i + 1) % self.n_islands], results,
+                self.migration_interval, self.migration_size))
+            for i in range(self.n_islands)
+        ]
+        for process in processes:
+            process.start()
+
+        # Sonuçlar join'den önce okunur (dolu kuyruk süreç çıkışını bekletir)
+        island_results = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+        best_chromosome, best_fitness = None, None
+        self.restarts = 0
+        for island_id, history, chromosome, fitness, stats, diversity, restarts in sorted(island_results,
+                                                                                         key=lambda r: r[0]):
+            self.island_histories[island_id] = history
+            self.island_best[island_id] = fitness
+            self.island_stats[island_id] = stats
+            self.island_diversity[island_id] = diversity
+            self.restarts += restarts
+            if best_fitness is None or fitness > best_fitness:
+                best_chromosome, best_fitness = chromosome, fitness
+
+            if log.info_enabled:
+                log.info('island_complete', f"Ada {island_id}: En iyi fitness = {fitness:.2f}",
+                         island=island_id, best_fitness=fitness)
+
+        # Birleşik geçmiş: her nesilde adaların en iyisi
+        self.fitness_history = [max(values) for values in zip(*self.island_histories.values())]
+        # Birleşik çeşitlilik: her nesilde adaların ortalaması
+        self.diversity_history = [sum(values) / len(values) for values in zip(*self.island_diversity.values())]
+
+        self.best_individual = Individual(self.drones, self.deliveries, self.index)
+        self.best_individual.chromosome = best_chromosome
+        self.best_individual.fitness = best_fitness
+        self.best_individual.dirty = False
+
+        if log.info_enabled:
+            log.info('ga_complete', f"GA tamamlandı. En iyi fitness: {self.best_individual.fitness:.2f}",
+                     best_fitness=self.best_individual.fitness)
+        return self.best_individual
+
+    def get_cache_stats(self) -> Dict:
+        """Tüm adaların fitness önbelleği sayaçlarının toplamı"""
+        totals = {}
+        for stats in self.island_stats.values():
+            for key, value in stats.items():
+                if not key.endswith('_rate'):
+                    totals[key] = totals.get(key, 0) + value
+
+        for cache in ('fitness_cache', 'route_cache'):
+            hits, misses = totals.get(f'{cache}_hits', 0), totals.get(f'{cache}_misses', 0)
+            totals[f'{cache}_hit_rate'] = hits / (hits + misses) if hits + misses else 0.0
+        totals.setdefault('evaluations', 0)
+        return totals
@@ -4,12 +4,24 @@ Bu dosya, drone tabanlı teslimat sisteminde çoklu tur planlamasını gerçekle
 """
 import math
 import time
-from typing import List, Dict, Tuple, Optional, Set
+from contextlib import closing # Aday üreticisini kapatıp taranan girişleri geri koymak için
+from typing import List, Dict, Tuple, Optional, Set, Union
 from .drone import Drone # Drone sınıfını içe aktar
 from .delivery_point import DeliveryPoint  # Teslimat noktası sınıfı
 from .no_fly_zone import NoFlyZone # Uçuşa yasak bölge sınıfı
 from .graph_builder import DeliveryGraph # Teslimat grafiğini yöneten sınıf
 from .astar import AStarPathfinder # A* algoritması sınıfı
+from .event_scheduler import EventScheduler # Ayrık olay kuyruğu
+from .delivery_pool import DeliveryPool # İndeksli bekleyen teslimat havuzu
+from .trip_sequence import TripSequence # Tur geometrisi ve artımlı enerji
+from .savings_builder import SavingsTripBuilder # Clarke-Wright tur kurucu
+from .insertion_builder import InsertionTripBuilder # Zaman pencereli ekleme (Solomon I1)
+from .alns_improver import ALNSImprover, DroneSchedule # Plan iyileştirme (ALNS)
+from .order_stream import OrderStream # Çevrimiçi sipariş akışı
+from .charging_station import ChargingStation # Depo başına şarj cihazları ve kuyruk
+from .event_log import event_log # Seviyeli olay günlüğü
+
+log = event_log.channel('multitrip') # Kapalı seviyeler tek bool kontrolüne iner
 
 class MultiTripPlanner:
     """Çoklu tur teslimat planlayıcısı"""
@@ -26,80 +38,203 @@ class MultiTripPlanner:
         self.time_horizon = 480  # Simülasyon süresi (8 saat, dakika cinsinden)
         self.charge_time_per_cycle = 30  # 30 dakika şarj
         self.battery_threshold = 0.3  # %30'da şarj et
+        self.idle_wait = 30  # Tur bulamayan drone'un yeniden deneme aralığı (dakika)
+        self.late_tolerance = 120  # Zaman penceresi bitişinden sonra kabul edilen gecikme (dakika)
+        self.route_optimization = True  # Uçuştan önce tur sırasını 2-opt / Or-opt ile iyileştir
+        self.route_budget = 100  # Tur başına sıralama maliyet değerlendirmesi sınırı
+        self.strategy = 'greedy'  # Tur kurma: 'greedy' (öncelik sırası), 'savings' (Clarke-Wright) veya 'insertion' (Solomon I1)
+        self.insertion_seed = 'deadline'  # 'insertion' tohumu: 'deadline' (en erken bitiş) veya 'farthest'
+        self.max_stops = 8  # Tur başına en fazla teslimat
+        self.alns_time_budget = 0.0  # Planlamadan sonra ALNS iyileştirme süresi (saniye, 0 = kapalı)
+        self.alns_seed = None  # ALNS rastgelelik tohumu
+        self.chargers_per_depot = None  # Depo başına şarj cihazı: None (sınırsız), sayı veya {depo: sayı}
+        self.partial_charging = False  # Tam şarj yerine sadece sıradaki turun ihtiyacı kadar şarj et
         
         # Sonuçlar
         self.completed_deliveries = [] # Başarılı teslimatlar
         self.drone_trips = {drone.id: [] for drone in drones} # Her drone için tur bilgisi
         self.drone_reports = {} # Drone'lara ait performans raporları
+        self.drone_clock = {drone.id: 0 for drone in drones} # Her drone'un bir sonraki boş anı
+        self.drone_busy_time = {drone.id: 0 for drone in drones} # Her drone'un uçuşta geçirdiği süre (dakika)
+        self.charge_counts = {drone.id: 0 for drone in drones} # Her drone'un şarj sayısı (kısmi şarjlar dahil)
+        self.active_zones = set() # Şu an aktif no-fly zone kimlikleri
+        self.events_processed = 0 # İşlenen olay sayısı
+        self.expired_deliveries = [] # Gecikme toleransı aşıldığı için bırakılan teslimatlar
+        self.energy_limited = False # Son tur seçiminde aday sadece batarya yüzünden mi elendi
+        self.prebuilt_trips = {} # 'savings' stratejisi: depo -> önceden kurulmuş turlar
+        self.trip_cursor = {} # depo -> ilk dağıtılmamış turun indeksi
+        self.insertion_builder = None # 'insertion' stratejisinin tur kurucusu
+        self.savings_builder = None # 'savings' stratejisinin tur kurucusu
+        self.dirty_depots = set() # Çevrimiçi modda yeni teslimat eklenmiş, yeniden sıralanacak depolar
+        self.event_latencies = [] # Olay başına planlama süresi (saniye)
+        self.on_time_count = 0 # Zaman penceresi bitişinden önce yapılan teslimatlar
+        self.charging_stations = {} # depo -> ChargingStation
+        self.charge_log = [] # Her şarj: drone, depo, başlangıç ve bitiş zamanı
         
-    def plan_multi_trip_delivery(self) -> Dict:
-        """Çoklu tur teslimat planlaması yap"""
-        print("🔄 Multi-trip planlama başlıyor...")
+    def plan_multi_trip_delivery(self, orders: Optional[OrderStream] = None) -> Dict:
+        """Çoklu tur teslimat planlaması yap (ayrık olay simülasyonu)
+
+        Her drone'un kendi saati vardır; bir drone turdayken diğerleri yeni tur planlar.
+        Olaylar: drone boşa çıktı, şarj bitti, no-fly zone aktifleşti / kapandı, sipariş geldi.
+
+        orders verilirse çevrimiçi (rolling horizon) modda çalışılır: self.deliveries gelen siparişlerle
+        dolar, her drone'a sadece sıradaki turu atanır ve kalan siparişler her olayda mevcut havuz ve tur
+        kurucular üzerinden artımlı olarak yeniden planlanır. ALNS iyileştirmesi bu modda uygulanmaz.
+
+        chargers_per_depot verilirse her depodaki şarj cihazları paylaşılan kaynaktır: cihazlar doluyken
+        şarja gelen drone kuyrukta bekler ve cihaz, biten şarjın CHARGE_COMPLETE olayında sıradakine geçer.
+        """
+        if orders is not None:
+            self.deliveries = []
+        log.info('planning_started', "🔄 Multi-trip planlama başlıyor...",
+                 drones=len(self.drones), deliveries=len(self.deliveries))
         start_time = time.time() # Başlangıç zamanı
         
-        # Drone'ları sıfırla
+        # Drone'ları ve önceki sonuçları sıfırla
         for drone in self.drones:
             drone.reset()
+        self.completed_deliveries = []
+        self.drone_trips = {drone.id: [] for drone in self.drones}
+        self.drone_clock = {drone.id: 0 for drone in self.drones}
+        self.drone_busy_time = {drone.id: 0 for drone in self.drones}
+        self.charge_counts = {drone.id: 0 for drone in self.drones}
+        self.active_zones = set()
+        self.on_time_count = 0
+        self.event_latencies = []
+        self.dirty_depots = set()
+        self.charge_log = []
+        self.charging_stations = {depot: ChargingStation(depot, self.charger_count(depot))
+                                  for depot in dict.fromkeys(drone.start_pos for drone in self.drones)}
             
-        remaining_deliveries = list(self.deliveries) # Teslim edilecek kalan paketler
-        current_time = 0 # Teslim edilecek kalan paketler
+        remaining_deliveries = DeliveryPool(self.deliveries) # Teslim edilecek kalan paketler
         total_trips = 0 # Yapılan toplam tur sayısı
-        stuck_counter = 0  # Sonsuz döngü koruması
+        stuck_counter = 0  # Art arda tur bulamayan drone sayısı (sonsuz döngü koruması)
+        waiting = set() # Tur bulamayıp bekleyen drone'lar
+        
+        if self.strategy == 'savings':
+            builder = self.savings_builder = SavingsTripBuilder(self.drones, self.deliveries, self.late_tolerance,
+                                                                self.max_stops)
+            self.prebuilt_trips = builder.build()
+            self.trip_cursor = {depot: 0 for depot in self.prebuilt_trips}
+            if self.deliveries:
+                log.info('savings_built', f"🧮 Tasarruf algoritması: {sum(len(t) for t in self.prebuilt_trips.values())} tur, "
+                         f"{builder.merges} birleştirme", merges=builder.merges)
+        elif self.strategy == 'insertion':
+            self.insertion_builder = InsertionTripBuilder(self.deliveries, self.late_tolerance, self.max_stops,
+                                                          seed=self.insertion_seed)
         
-        while remaining_deliveries and current_time < self.time_horizon:
-            print(f"⏰ Zaman: {current_time}dk, Kalan teslimat: {len(remaining_deliveries)}")
+        scheduler = EventScheduler()
+        for zone in self.no_fly_zones:
+            scheduler.schedule(zone.active_time[0], EventScheduler.ZONE_ACTIVATION, zone)
+            scheduler.schedule(zone.active_time[1], EventScheduler.ZONE_DEACTIVATION, zone)
+        for drone in self.drones:
+            scheduler.schedule(0, EventScheduler.DRONE_AVAILABLE, drone)
+        if orders:
+            scheduler.schedule(orders.peek_time(), EventScheduler.ORDER_RELEASE, orders)
+        
+        event_started = None
+        while (remaining_deliveries or orders) and len(scheduler):
+            if event_started is not None:
+                self.event_latencies.append(time.perf_counter() - event_started)
+            current_time, kind, subject = scheduler.pop()
+            event_started = time.perf_counter()
+            if current_time >= self.time_horizon:
+                break # Kuyruk sıralı: sonraki olaylar da ufkun dışında
+            
+            if kind == EventScheduler.ZONE_ACTIVATION:
+                self.active_zones.add(subject.id)
+                continue
+            if kind == EventScheduler.ZONE_DEACTIVATION:
+                self.active_zones.discard(subject.id)
+                self.wake_drones(waiting, current_time, scheduler) # Bölge kapandı: bekleyenler yeniden denesin
+                continue
+            if kind == EventScheduler.ORDER_RELEASE:
+                self.add_orders(orders.release(current_time), remaining_deliveries, current_time)
+                if orders:
+                    scheduler.schedule(orders.peek_time(), EventScheduler.ORDER_RELEASE, orders)
+                stuck_counter = 0
+                self.wake_drones(waiting, current_time, scheduler) # Yeni siparişler: bekleyenler yeniden denesin
+                continue
             
-            progress_made = False  # Bu döngüde ilerleme var mı?
+            drone = subject
+            if current_time != self.drone_clock[drone.id]:
+                continue # Yerine yenisi planlanmış eski uyandırma olayı
+            if kind == EventScheduler.CHARGE_COMPLETE:
+                # Cihaz boşaldı: kuyrukta bekleyen varsa şarjı hemen başlar
+                handoff = self.charging_stations[drone.start_pos].release(current_time)
+                if handoff is not None:
+                    self.start_charge(*handoff, current_time, scheduler)
+            waiting.discard(drone.id)
+            if log.debug_enabled:
+                log.debug('drone_available', f"⏰ Zaman: {current_time}dk, Drone {drone.id}, Kalan teslimat: {len(remaining_deliveries)}",
+                          time=current_time, drone=drone.id, remaining=len(remaining_deliveries))
             
-            # Her drone için tur planla
-            for drone in self.drones:
-                if current_time >= self.time_horizon:
-                    break
-                    
-                # Şarj gerekiyor mu kontrol et
-                if drone.needs_charging() or drone.battery < drone.max_battery * self.battery_threshold:
-                    charge_time = self.charge_drone(drone, current_time) # Şarj et
-                    current_time += charge_time
-                    continue
+            # Şarj gerekiyor mu kontrol et; eşik altındaki drone cihazlar doluyken önce kalan bataryasıyla tur dener
+            if (drone.needs_charging() or (drone.battery < drone.max_battery * self.battery_threshold and
+                                           self.charging_stations[drone.start_pos].has_free_charger())) and \
+                    self.schedule_charge(drone, current_time, scheduler, remaining_deliveries):
+                continue
+            
+            # Bu drone için optimal teslimatları bul
+            trip_deliveries = self.select_trip(drone, remaining_deliveries, current_time)
+            
+            if trip_deliveries:
+                # Ziyaret sırasını iyileştir, sonra teslimatları gerçekleştir (drone tur bitene kadar meşgul)
+                trip_deliveries = self.sequence_trip(drone, trip_deliveries, current_time)
+                trip_time = self.execute_trip(drone, trip_deliveries, current_time)
+                end_time = current_time + trip_time
+                total_trips += 1
+                stuck_counter = 0
                 
-                # Bu drone için optimal teslimatları bul
-                trip_deliveries = self.plan_single_trip(drone, remaining_deliveries, current_time)
+                # Tamamlanan teslimatları havuzdan çıkar (O(1))
+                for delivery in trip_deliveries:
+                    if remaining_deliveries.remove(delivery.id) is not None:
+                        self.completed_deliveries.append(delivery)
                 
-                if trip_deliveries:
-                    # Teslimatları gerçekleştir
-                    trip_time = self.execute_trip(drone, trip_deliveries, current_time)
-                    current_time += trip_time
-                    total_trips += 1
-                    progress_made = True
-                    
-                    # Tamamlanan teslimatları listeden çıkar
-                    for delivery in trip_deliveries:
-                        if delivery in remaining_deliveries:
-                            remaining_deliveries.remove(delivery)
-                            self.completed_deliveries.append(delivery)
-                    
-                    # Tur bilgilerini kaydet
-                    self.drone_trips[drone.id].append({
-                        'trip_number': len(self.drone_trips[drone.id]) + 1,
-                        'deliveries': [d.id for d in trip_deliveries],
-                        'start_time': current_time - trip_time,
-                        'end_time': current_time,
-                        'duration': trip_time,
-                        'total_weight': sum(d.weight for d in trip_deliveries)
-                    })
-            
-            # İlerleme yoksa ve kalan teslimat varsa, zamanı ilerlet
-            if not progress_made and remaining_deliveries:
+                # Tur bilgilerini kaydet
+                self.drone_trips[drone.id].append({
+                    'trip_number': len(self.drone_trips[drone.id]) + 1,
+                    'deliveries': [d.id for d in trip_deliveries],
+                    'start_time': current_time,
+                    'end_time': end_time,
+                    'duration': trip_time,
+                    'total_weight': sum(d.weight for d in trip_deliveries)
+                })
+                self.drone_busy_time[drone.id] += trip_time
+                self.drone_clock[drone.id] = end_time
+                scheduler.schedule(end_time, EventScheduler.DRONE_AVAILABLE, drone)
+            elif (self.energy_limited or drone.battery < drone.max_battery * self.battery_threshold) and \
+                    self.schedule_charge(drone, current_time, scheduler, remaining_deliveries):
+                # Aday var ama kalan bataryaya sığmıyor ya da batarya eşiğin altında: beklemek yerine şarj et
+                # (cihazlar doluysa şarj kuyruğuna girilir)
+                pass
+            elif not remaining_deliveries:
+                # Havuz boş (çevrimiçi mod): drone bir sonraki sipariş gelişine kadar bekler
+                waiting.add(drone.id)
+            else:
+                # İlerleme yok: drone idle_wait kadar bekleyip yeniden dener
                 stuck_counter += 1
-                print(f"⚠️ İlerleme yok, zaman 30dk ilerletiliyor... (Stuck: {stuck_counter})")
-                current_time += 30  # 30 dakika ilerlet
-                
-                # Çok uzun sıkıştıysa döngüyü kır
-                if stuck_counter >= 10:
-                    print("❌ 10 kez sıkıştı, simülasyon sonlandırılıyor")
+                if stuck_counter >= 10 * len(self.drones):
+                    log.warning('planning_stuck', "❌ 10 tur boyunca hiçbir drone ilerleme kaydedemedi, simülasyon sonlandırılıyor",
+                                time=current_time, remaining=len(remaining_deliveries))
                     break
+                waiting.add(drone.id)
+                self.drone_clock[drone.id] = current_time + self.idle_wait
+                scheduler.schedule(current_time + self.idle_wait, EventScheduler.DRONE_AVAILABLE, drone)
+        
+        if event_started is not None:
+            self.event_latencies.append(time.perf_counter() - event_started)
+        self.events_processed = scheduler.processed
+        self.expired_deliveries = remaining_deliveries.expired
+        
+        # ALNS turları sınırsız cihaz ve tam şarjla yeniden zamanlar; cihaz modeli veya çevrimiçi modda uygulanmaz
+        if self.alns_time_budget > 0 and self.completed_deliveries:
+            if orders is None and self.chargers_per_depot is None and not self.partial_charging:
+                self.improve_plan(self.alns_time_budget)
+                total_trips = sum(len(trips) for trips in self.drone_trips.values())
             else:
-                stuck_counter = 0  # İlerleme varsa counter'ı sıfırla
+                log.warning('alns_skipped', "⚠️ ALNS iyileştirmesi şarj istasyonu modeli veya çevrimiçi modda "
+                            "desteklenmiyor, atlandı")
                 
         execution_time = time.time() - start_time # Simülasyon süresi
         
@@ -109,49 +244,324 @@ class MultiTripPlanner:
          # Genel istatistikleri hesapla ve döndür
         delivery_count = len(self.completed_deliveries)
         delivery_rate = delivery_count / len(self.deliveries) if self.deliveries else 0
+        makespan = max((trip['end_time'] for trips in self.drone_trips.values() for trip in trips), default=0)
+        deliveries_per_hour = delivery_count / (makespan / 60) if makespan > 0 else 0 # Simüle saat başına teslimat
+        on_time_rate = self.on_time_count / delivery_count if delivery_count else 0 # Zamanında teslimat oranı
+        latencies = sorted(self.event_latencies)
+        event_latency_ms = { # Olay başına yeniden planlama süresi
+            'mean': sum(latencies) / len(latencies) * 1000 if latencies else 0,
+            'p95': latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0,
+            'max': latencies[-1] * 1000 if latencies else 0
+        }
+        charging = { # Şarj istasyonu kullanımı ve kuyruk beklemeleri
+            'stations': [dict(station.report(self.time_horizon), depot=depot)
+                         for depot, station in self.charging_stations.items()],
+            'total_wait': sum(station.total_wait for station in self.charging_stations.values()),
+            'max_queue': max((station.max_queue for station in self.charging_stations.values()), default=0),
+            'charge_time': sum(charge['end'] - charge['start'] for charge in self.charge_log)
+        }
         
-        print(f"✅ Multi-trip tamamlandı!")
-        print(f"   - Toplam teslimat: {delivery_count}/{len(self.deliveries)}")
-        print(f"   - Teslimat oranı: %{delivery_rate*100:.1f}")
-        print(f"   - Toplam tur sayısı: {total_trips}")
-        print(f"   - Çalışma süresi: {execution_time:.3f} saniye")
+        if log.info_enabled:
+            log.info('planning_complete',
+                     f"✅ Multi-trip tamamlandı!\n"
+                     f"   - Toplam teslimat: {delivery_count}/{len(self.deliveries)}\n"
+                     f"   - Teslimat oranı: %{delivery_rate*100:.1f} (zamanında: %{on_time_rate*100:.1f})\n"
+                     f"   - Toplam tur sayısı: {total_trips}\n"
+                     f"   - Bitiş zamanı: {makespan}dk ({deliveries_per_hour:.1f} teslimat/saat)\n"
+                     f"   - Çalışma süresi: {execution_time:.3f} saniye",
+                     delivered=delivery_count, on_time=self.on_time_count, trips=total_trips, makespan=makespan,
+                     execution_time=execution_time)
         
         return {
             'delivery_count': delivery_count,
             'delivery_rate': delivery_rate,
+            'on_time_count': self.on_time_count,
+            'on_time_rate': on_time_rate,
             'total_trips': total_trips,
+            'makespan': makespan,
+            'deliveries_per_hour': deliveries_per_hour,
             'completed_deliveries': self.completed_deliveries,
             'drone_trips': self.drone_trips,
             'drone_reports': self.drone_reports,
             'execution_time': execution_time,
+            'events_processed': self.events_processed,
+            'event_latency_ms': event_latency_ms,
+            'charging': charging,
+            'expired_count': len(self.expired_deliveries),
             'routes': self.get_solution_routes()
         }
     
-    def plan_single_trip(self, drone: Drone, available_deliveries: List[DeliveryPoint], 
+    def improve_plan(self, time_budget: float) -> bool:
+        """Mevcut drone turlarını ALNS ile iyileştir; daha iyi plan bulunursa turları yeniden uçur
+
+        Turlar boşluksuz (sadece şarj ve no-fly zone beklemesiyle) yeniden zamanlanır. Amaç enerji, gecikme,
+        drone bitiş zamanları ve teslim edilemeyen paketleri birlikte cezalandırır; plan sadece bu amaç düşer ve
+        bitiş zamanı (makespan) uzamazsa değiştirilir, böylece saatlik teslimat oranı kötüleşmez.
+        """
+        by_id = {delivery.id: delivery for delivery in self.deliveries}
+        improver = ALNSImprover(self.drones, self.deliveries, self.no_fly_zones, self.late_tolerance,
+                                self.max_stops, self.charge_time_per_cycle, self.battery_threshold,
+                                self.time_horizon, seed=self.alns_seed)
+        trips = {drone_id: [[by_id[delivery_id] for delivery_id in trip['deliveries']] for trip in drone_trips]
+                 for drone_id, drone_trips in self.drone_trips.items()}
+        schedules = improver.run(trips, time_budget)
+        makespan = max((trip['end_time'] for trips in self.drone_trips.values() for trip in trips), default=0)
+        new_makespan = max((schedule.end_time for schedule in schedules.values() if schedule.trips), default=0)
+        improved = improver.best_cost < improver.initial_cost and new_makespan <= makespan
+        log.info('alns_complete', f"🧬 ALNS: {improver.iterations} iterasyon, {improver.improvements} iyileşme, "
+                 f"maliyet {improver.initial_cost:.0f} -> {improver.best_cost:.0f}",
+                 iterations=improver.iterations, improvements=improver.improvements,
+                 initial_cost=improver.initial_cost, best_cost=improver.best_cost)
+        if improver.best_cost < improver.initial_cost and not improved:
+            log.info('alns_rejected', f"🧬 ALNS planı reddedildi: bitiş zamanı {makespan}dk -> {new_makespan}dk",
+                     makespan=makespan, new_makespan=new_makespan)
+        if improved:
+            self.apply_schedules(schedules)
+            self.expired_deliveries = improver.unserved
+        return improved
+    
+    def apply_schedules(self, schedules: Dict[int, DroneSchedule]):
+        """Verilen zaman çizelgelerini execute_trip ile yeniden uçurarak sonuçları baştan oluştur"""
+        for drone in self.drones:
+            drone.reset()
+        self.completed_deliveries = []
+        self.drone_trips = {drone.id: [] for drone in self.drones}
+        self.drone_busy_time = {drone.id: 0 for drone in self.drones}
+        self.charge_counts = {drone.id: 0 for drone in self.drones}
+        self.on_time_count = 0
+        for drone in self.drones:
+            schedule = schedules[drone.id]
+            for trip, start, charged in zip(schedule.trips, schedule.starts, schedule.charged):
+                if charged:
+                    self.charge_drone(drone, start - self.charge_time_per_cycle)
+                trip_time = self.execute_trip(drone, trip.stops, start)
+                self.completed_deliveries.extend(trip.stops)
+                self.drone_trips[drone.id].append({
+                    'trip_number': len(self.drone_trips[drone.id]) + 1,
+                    'deliveries': [d.id for d in trip.stops],
+                    'start_time': start,
+                    'end_time': start + trip_time,
+                    'duration': trip_time,
+                    'total_weight': trip.total_weight
+                })
+                self.drone_busy_time[drone.id] += trip_time
+            self.drone_clock[drone.id] = schedule.end_time
+    
+    def wake_drones(self, waiting: Set[int], current_time: int, scheduler: EventScheduler):
+        """Tur bulamayıp bekleyen drone'ları hemen yeniden planlamaya al"""
+        for drone in self.drones:
+            if drone.id in waiting:
+                self.drone_clock[drone.id] = current_time
+                scheduler.schedule(current_time, EventScheduler.DRONE_AVAILABLE, drone)
+        waiting.clear()
+    
+    def add_orders(self, batch: List[DeliveryPoint], pool: DeliveryPool, current_time: int):
+        """Gelen siparişleri havuza ve seçili stratejinin tur kurucusuna ekle (çevrimiçi mod)"""
+        self.deliveries.extend(batch)
+        for delivery in batch:
+            pool.add(delivery)
+        if self.strategy == 'savings':
+            for delivery in batch:
+                depot = self.savings_builder.insert(delivery, self.prebuilt_trips, self.trip_cursor, current_time)
+                if depot is not None:
+                    self.trip_cursor.setdefault(depot, 0)
+                    self.dirty_depots.add(depot)
+        elif self.strategy == 'insertion':
+            self.insertion_builder.add(batch)
+        if log.debug_enabled:
+            log.debug('orders_released', f"📥 Zaman: {current_time}dk, {len(batch)} yeni sipariş, açık: {len(pool)}",
+                      time=current_time, orders=[d.id for d in batch], open=len(pool))
+    
+    def charger_count(self, depot: Tuple[float, float]) -> Optional[int]:
+        """Depodaki şarj cihazı sayısı (None = sınırsız)"""
+        if isinstance(self.chargers_per_depot, dict):
+            return self.chargers_per_depot.get(depot)
+        return self.chargers_per_depot
+    
+    def schedule_charge(self, drone: Drone, current_time: int, scheduler: EventScheduler,
+                        pool: Optional[DeliveryPool] = None) -> bool:
+        """Drone için depodan şarj cihazı iste; cihaz boşsa şarj başlar, değilse drone kuyrukta bekler
+
+        Batarya zaten hedefteyse (ör. tam dolu) şarj planlanmaz ve False döner; drone başka iş aramalıdır.
+        """
+        target = self.charge_target(drone, pool, current_time)
+        if drone.battery >= target:
+            return False
+        if self.charging_stations[drone.start_pos].request(drone, target, current_time):
+            self.start_charge(drone, target, current_time, scheduler)
+            return True
+        self.drone_clock[drone.id] = None # Kuyrukta: cihaz devredilene kadar uyandırma olayı yok
+        if log.debug_enabled:
+            log.debug('charger_queued', f"🔌 Zaman: {current_time}dk, Drone {drone.id} şarj kuyruğunda "
+                      f"({len(self.charging_stations[drone.start_pos].queue)}. sırada)",
+                      time=current_time, drone=drone.id, depot=drone.start_pos)
+        return True
+    
+    def start_charge(self, drone: Drone, target: float, current_time: int, scheduler: EventScheduler):
+        """Cihazı alan drone'u şarj et ve şarj bitiş olayını planla"""
+        charge_time = self.charge_drone(drone, current_time, target) # Şarj et
+        self.charging_stations[drone.start_pos].busy_time += charge_time
+        self.charge_log.append({'drone': drone.id, 'depot': drone.start_pos,
+                                'start': current_time, 'end': current_time + charge_time})
+        self.drone_clock[drone.id] = current_time + charge_time
+        scheduler.schedule(current_time + charge_time, EventScheduler.CHARGE_COMPLETE, drone)
+    
+    def charge_target(self, drone: Drone, pool: Optional[DeliveryPool], current_time: int) -> float:
+        """Şarj sonunda ulaşılacak batarya: tam şarj veya kısmi şarjda sıradaki turun enerjisi (en az eşik)
+
+        Sıradaki tur, drone tam bataryayla şimdi planlansaydı seçilecek turdur; havuz ve kurulmuş turlar değişmez.
+        """
+        if not self.partial_charging:
+            return drone.max_battery
+        energy_needed = 0.0
+        if pool:
+            battery = drone.battery
+            drone.battery = drone.max_battery
+            try:
+                stops = self.select_trip(drone, pool, current_time, commit=False)
+            finally:
+                drone.battery = battery
+            energy_needed = TripSequence(drone, stops).energy if stops else 0.0
+        target = max(energy_needed, drone.max_battery * self.battery_threshold)
+        return min(drone.max_battery, target)
+    
+    def select_trip(self, drone: Drone, pool: DeliveryPool, current_time: int,
+                    commit: bool = True) -> List[DeliveryPoint]:
+        """Seçili stratejiye göre drone'un bir sonraki turunu belirle
+
+        Tur bulunamazsa energy_limited, en az bir adayın sadece batarya yetmediği için elendiğini gösterir.
+        commit False ise önceden kurulmuş tur dağıtılmış sayılmaz (kısmi şarj hedefi için ön bakış).
+        """
+        self.energy_limited = False
+        if self.strategy == 'savings':
+            return self.plan_savings_trip(drone, pool, current_time, commit)
+        if self.strategy == 'insertion':
+            pool.expire(current_time - self.late_tolerance)
+            trip = self.insertion_builder.build(drone, pool, current_time, self.in_active_zone)
+            self.energy_limited = self.insertion_builder.energy_limited
+            if log.debug_enabled:
+                log.debug('trip_selected', f"    📊 Ekleme turu: {len(trip)} paket, {sum(d.weight for d in trip):.1f}/{drone.max_weight:.1f}kg",
+                          time=current_time, drone=drone.id, deliveries=[d.id for d in trip],
+                          weight=sum(d.weight for d in trip))
+            return trip
+        return self.plan_single_trip(drone, pool, current_time)
+    
+    def plan_savings_trip(self, drone: Drone, pool: DeliveryPool, current_time: int,
+                          commit: bool = True) -> List[DeliveryPoint]:
+        """Drone'un deposundaki önceden kurulmuş turlardan, en geç kalkışı en erken olan uygun turu al
+
+        Teslim edilmiş veya süresi geçmiş duraklar çıkarılır; aktif no-fly zone içinde durağı olan tur
+        bekletilir. Tur drone'un kapasitesine ve mevcut bataryasına sığmalıdır.
+        """
+        pool.expire(current_time - self.late_tolerance)
+        # Önce kendi deposu; orada uygun tur kalmadıysa en yakın diğer depoların turları (yük dengeleme)
+        depots = sorted(self.prebuilt_trips, key=lambda depot: (depot != drone.start_pos,
+                                                                math.dist(depot, drone.start_pos)))
+        for depot in depots:
+            trips = self.prebuilt_trips[depot]
+            cursor = self.trip_cursor[depot]
+            while cursor < len(trips) and trips[cursor] is None:
+                cursor += 1 # Dağıtılmış turları atla
+            self.trip_cursor[depot] = cursor
+            if depot in self.dirty_depots:
+                # Yeni teslimat eklenen depoda dağıtılmamış turlar en geç kalkışa göre yeniden sıralanır
+                trips[cursor:] = sorted((trip for trip in trips[cursor:] if trip is not None),
+                                        key=self.savings_builder.latest_start)
+                self.dirty_depots.discard(depot)
+            
+            for index in range(cursor, len(trips)):
+                if trips[index] is None:
+                    continue
+                stops = [delivery for delivery in trips[index].stops if delivery.id in pool]
+                if not stops:
+                    trips[index] = None # Tüm durakları teslim edilmiş veya süresi geçmiş
+                    continue
+                if any(self.in_active_zone(delivery.pos) for delivery in stops):
+                    continue
+                trip = TripSequence(drone, stops) # Enerji drone'un kendi deposuna göre
+                if trip.total_weight > drone.max_weight:
+                    continue
+                if trip.energy > drone.battery:
+                    self.energy_limited = self.energy_limited or trip.energy <= drone.max_battery
+                    continue
+                if commit:
+                    trips[index] = None
+                if log.debug_enabled:
+                    log.debug('trip_selected', f"    📊 Tasarruf turu: {len(stops)} paket, {trip.total_weight:.1f}/{drone.max_weight:.1f}kg",
+                              time=current_time, drone=drone.id, deliveries=[d.id for d in stops],
+                              weight=trip.total_weight)
+                return trip.stops
+        return []
+    
+    def plan_single_trip(self, drone: Drone, available_deliveries: Union[DeliveryPool, List[DeliveryPoint]], 
                         current_time: int) -> List[DeliveryPoint]:
-        """Tek bir tur için optimal teslimatları seç - KAPASİTEYE KADAR ÇOKLU PAKET"""
-        if not available_deliveries:
+        """Tek bir tur için optimal teslimatları seç - KAPASİTEYE KADAR ÇOKLU PAKET
+
+        available_deliveries bir DeliveryPool ise adaylar heap'ten öncelik sırasıyla çekilir;
+        liste verilirse geçici bir havuz kurulur.
+        """
+        pool = available_deliveries if isinstance(available_deliveries, DeliveryPool) \
+            else DeliveryPool(available_deliveries)
+        
+        # Gecikme toleransını aşmış teslimatlar havuzdan çıkarılır (bitiş zamanı indeksi)
+        expired = pool.expire(current_time - self.late_tolerance)
+        if log.debug_enabled:
+            for delivery in expired:
+                log.debug('delivery_expired', f"    ❌ Paket {delivery.id} çok geç ({current_time}dk > {delivery.time_window[1] + self.late_tolerance}dk)",
+                          time=current_time, delivery=delivery.id)
+        if not pool:
             return [] # Teslimat yoksa boş liste döndür
             
         # Drone'un başlangıç konumuna dön ve ağırlığını sıfırla
         drone.current_pos = drone.start_pos
         drone.current_weight = 0
         
-        # Öncelik ve ağırlığa göre sıralama (öncelik yüksek ve hafif olanlar önde)
-        sorted_deliveries = sorted(available_deliveries, 
-                                 key=lambda x: (x.priority, -x.weight), 
-                                 reverse=True)
-        
         selected_deliveries = [] # Seçilen teslimatlar listesi
         total_weight = 0 # Toplam ağırlık
         
-        print(f"  🎯 Drone {drone.id} için paket seçimi (Kapasite: {drone.max_weight}kg):")
+        if log.debug_enabled:
+            log.debug('trip_selection', f"  🎯 Drone {drone.id} için paket seçimi (Kapasite: {drone.max_weight}kg):",
+                      time=current_time, drone=drone.id)
         
-         # Açgözlü yaklaşım: kapasite dolana kadar uygun paketleri ekle
-        for delivery in sorted_deliveries:
+        # Açgözlü yaklaşım: öncelik yüksek ve hafif olanlardan başlayarak kapasite dolana kadar ekle
+        with closing(pool.candidates()) as candidates:
+            selected_deliveries, total_weight = self._select_candidates(
+                drone, candidates, pool, current_time)
+        
+        if log.debug_enabled:
+            log.debug('trip_selected', f"    📊 Tur özeti: {len(selected_deliveries)} paket, {total_weight:.1f}/{drone.max_weight:.1f}kg (%{(total_weight/drone.max_weight)*100:.1f})",
+                      time=current_time, drone=drone.id, deliveries=[d.id for d in selected_deliveries],
+                      weight=total_weight)
+        
+        return selected_deliveries # Seçilen paketleri döndür
+    
+    def _select_candidates(self, drone: Drone, candidates, pool: DeliveryPool,
+                           current_time: int) -> Tuple[List[DeliveryPoint], float]:
+        """Öncelik sırasıyla gelen adaylardan kapasite ve enerji sınırına kadar seç
+
+        Her aday turun en ucuz konumuna eklenir; enerji, gerçek bacak mesafeleri ve yük profiliyle
+        hesaplandığı için execute_trip aynı sırayı uçtuğunda batarya tahmini birebir tutar.
+        """
+        trip = TripSequence(drone) # Seçilen teslimatlar (ziyaret sırasıyla)
+        total_weight = 0 # Toplam ağırlık
+        
+        for delivery in candidates:
+            # Kalan kapasiteye en hafif bekleyen paket bile sığmıyorsa taramayı bitir
+            if drone.max_weight - total_weight < pool.lightest_weight():
+                break
+            
             # Ağırlık kontrolü kapasiteyi aşıyorsa geç
             if total_weight + delivery.weight > drone.max_weight:
-                print(f"    ⚠️ Paket {delivery.id} ({delivery.weight:.1f}kg) çok ağır (kalan: {drone.max_weight - total_weight:.1f}kg)")
+                if log.debug_enabled:
+                    log.debug('candidate_too_heavy', f"    ⚠️ Paket {delivery.id} ({delivery.weight:.1f}kg) çok ağır (kalan: {drone.max_weight - total_weight:.1f}kg)",
+                              drone=drone.id, delivery=delivery.id)
+                continue
+            
+            # Aktif no-fly zone içindeki noktalara teslimat yapılamaz
+            if self.in_active_zone(delivery.pos):
+                if log.debug_enabled:
+                    log.debug('candidate_in_zone', f"    🚫 Paket {delivery.id} aktif no-fly zone içinde",
+                              drone=drone.id, delivery=delivery.id)
                 continue
             
             # Zaman penceresi kontrolü - DAHA ESNEK
@@ -163,35 +573,52 @@ class MultiTripPlanner:
             elif current_time > delivery.time_window[1]:
                 # Geç kaldık ama yine de kabul edelim
                 time_penalty = (current_time - delivery.time_window[1]) * 0.2
-                print(f"    ⏰ Paket {delivery.id} geç teslimat (penalty: {time_penalty:.1f})")
-            
-            # Çok geç değilse kabul et (2 saate kadar tolere et)
-            if current_time > delivery.time_window[1] + 120:  # 2 saat geç limit
-                print(f"    ❌ Paket {delivery.id} çok geç ({current_time}dk > {delivery.time_window[1] + 120}dk)")
-                continue
+                if log.debug_enabled:
+                    log.debug('candidate_late', f"    ⏰ Paket {delivery.id} geç teslimat (penalty: {time_penalty:.1f})",
+                              drone=drone.id, delivery=delivery.id, penalty=time_penalty)
                 
-            # YAKLAŞIK enerji kontrolü (basitleştirilmiş)
-            # Ortalama mesafe yaklaşımı kullan
-            avg_distance = 50  # Ortalama teslimat mesafesi
-            estimated_energy = drone.calculate_energy_consumption(
-                avg_distance * len(selected_deliveries) + 100, total_weight + delivery.weight
-            )
+            # Gerçek enerji kontrolü: en ucuz ekleme konumundaki ek tüketim
+            energy_delta, position = trip.cheapest_insertion(delivery)
             
-            if estimated_energy <= drone.battery * 0.7:  # %70 güvenlik marjı
-                selected_deliveries.append(delivery)
+            if trip.energy + energy_delta <= drone.battery:
+                trip.insert(delivery, position)
                 total_weight += delivery.weight
-                print(f"    ✅ Paket {delivery.id} seçildi: {delivery.weight:.1f}kg (Öncelik: {delivery.priority})")
+                if log.debug_enabled:
+                    log.debug('candidate_selected', f"    ✅ Paket {delivery.id} seçildi: {delivery.weight:.1f}kg (Öncelik: {delivery.priority}, "
+                              f"tur enerjisi: {trip.energy:.0f}/{drone.battery:.0f})",
+                              drone=drone.id, delivery=delivery.id, energy=trip.energy)
                 
                 # Maksimum paket sayısı sınırı (rota optimizasyonu için)
-                if len(selected_deliveries) >= 8:  # Maksimum 8 paket/tur
-                    print(f"    🔄 Maksimum paket sayısına ulaşıldı (8)")
+                if len(trip) >= self.max_stops:  # Maksimum 8 paket/tur
+                    if log.debug_enabled:
+                        log.debug('trip_full', f"    🔄 Maksimum paket sayısına ulaşıldı ({self.max_stops})", drone=drone.id)
                     break
             else:
-                print(f"    🔋 Paket {delivery.id} enerji yetersizliği")
+                # Sadece tam bataryayla sığacak aday şarjı anlamlı kılar
+                self.energy_limited = self.energy_limited or trip.energy + energy_delta <= drone.max_battery
+                if log.debug_enabled:
+                    log.debug('candidate_no_energy', f"    🔋 Paket {delivery.id} enerji yetersizliği",
+                              drone=drone.id, delivery=delivery.id)
         
-        print(f"    📊 Tur özeti: {len(selected_deliveries)} paket, {total_weight:.1f}/{drone.max_weight:.1f}kg (%{(total_weight/drone.max_weight)*100:.1f})")
+        return trip.stops, total_weight
+    
+    def sequence_trip(self, drone: Drone, trip_deliveries: List[DeliveryPoint],
+                      start_time: int) -> List[DeliveryPoint]:
+        """Tur sırasını en yakın komşu + 2-opt / Or-opt ile enerji ve gecikme cezasını düşürecek şekilde düzenle"""
+        if not self.route_optimization or len(trip_deliveries) < 2:
+            return trip_deliveries
         
-        return selected_deliveries # Seçilen paketleri döndür
+        trip = TripSequence(drone, trip_deliveries)
+        before = trip.distance
+        if trip.optimize(start_time, budget=self.route_budget) > 0:
+            if log.debug_enabled:
+                log.debug('trip_sequenced', f"    🧭 Drone {drone.id} tur sırası iyileştirildi: {before:.1f}m -> {trip.distance:.1f}m",
+                          drone=drone.id, before=before, after=trip.distance)
+        return trip.stops
+    
+    def in_active_zone(self, pos: Tuple[float, float]) -> bool:
+        """Nokta şu an aktif olan bir no-fly zone içinde mi"""
+        return any(zone.id in self.active_zones and zone.point_in_polygon(pos) for zone in self.no_fly_zones)
     
     def execute_trip(self, drone: Drone, trip_deliveries: List[DeliveryPoint], 
                     start_time: int) -> int:
@@ -206,7 +633,9 @@ class MultiTripPlanner:
         total_trip_weight = sum(d.weight for d in trip_deliveries)
         drone.current_weight = total_trip_weight # Drone taşıma yükü
         
-        print(f"  🚁 Drone {drone.id}: {len(trip_deliveries)} paket alındı ({total_trip_weight:.1f}kg)")
+        if log.debug_enabled:
+            log.debug('trip_started', f"  🚁 Drone {drone.id}: {len(trip_deliveries)} paket alındı ({total_trip_weight:.1f}kg)",
+                      time=start_time, drone=drone.id, weight=total_trip_weight)
         
         # Her teslimat noktasına git ve paketi bırak
         for i, delivery in enumerate(trip_deliveries):
@@ -220,6 +649,8 @@ class MultiTripPlanner:
             
             # Teslimat noktasına var
             drone.total_distance += distance # Toplam mesafeye ekle
+            if start_time + total_time + travel_time <= delivery.time_window[1]:
+                self.on_time_count += 1 # Pencere bitişinden önce varıldı
             total_time += travel_time + 2  # 2 dakika teslimat süresi
             current_pos = delivery.pos # Yeni konum
             
@@ -227,7 +658,9 @@ class MultiTripPlanner:
             drone.current_weight -= delivery.weight  # Paket bırakıldı
             drone.deliveries.append(delivery.id) # Kayıt tut
             
-            print(f"    📦 Teslimat {i+1}/{len(trip_deliveries)}: {delivery.weight:.1f}kg bırakıldı, kalan: {drone.current_weight:.1f}kg")
+            if log.debug_enabled:
+                log.debug('delivery_dropped', f"    📦 Teslimat {i+1}/{len(trip_deliveries)}: {delivery.weight:.1f}kg bırakıldı, kalan: {drone.current_weight:.1f}kg",
+                          time=start_time + total_time, drone=drone.id, delivery=delivery.id)
         
         # Üsse dön (artık boş)
         distance_to_base = drone.get_distance(current_pos, drone.start_pos)
@@ -240,12 +673,18 @@ class MultiTripPlanner:
         drone.total_distance += distance_to_base
         drone.current_pos = drone.start_pos
         
-        print(f"    🏠 Drone {drone.id} üsse döndü, toplam süre: {int(total_time)}dk")
+        if log.debug_enabled:
+            log.debug('trip_finished', f"    🏠 Drone {drone.id} üsse döndü, toplam süre: {int(total_time)}dk",
+                      time=start_time + int(total_time), drone=drone.id, battery=drone.battery)
         
         return int(total_time) # Turu tamamlamak için geçen süre
     
-    def charge_drone(self, drone: Drone, current_time: int) -> int:
-        """Drone'u şarj et"""
+    def charge_drone(self, drone: Drone, current_time: int, target: Optional[float] = None) -> int:
+        """Drone'u şarj et
+
+        target verilmezse sabit charge_time_per_cycle boyunca tam şarj edilir. Kısmi şarjda
+        tam şarj charge_time_per_cycle sürecek hızla sadece target'a kadar (tam dakikaya yuvarlanarak) şarj edilir.
+        """
         if drone.current_pos != drone.start_pos:
             # Üsse dön
             distance = drone.get_distance(drone.current_pos, drone.start_pos)
@@ -253,9 +692,17 @@ class MultiTripPlanner:
             drone.move_to(drone.start_pos)
             current_time += return_time
         
-        # Şarj et
-        drone.charge(self.charge_time_per_cycle) # Şarj et
-        return self.charge_time_per_cycle # Şarj süresini döndür
+        if target is None or not self.partial_charging:
+            drone.charge(self.charge_time_per_cycle) # Şarj et
+            self.charge_counts[drone.id] += 1
+            return self.charge_time_per_cycle # Şarj süresini döndür
+        
+        rate = drone.max_battery / self.charge_time_per_cycle # Dakikada şarj miktarı
+        charge_time = max(1, math.ceil((target - drone.battery) / rate))
+        drone.battery = min(drone.max_battery, drone.battery + charge_time * rate)
+        drone.charging_time += charge_time
+        self.charge_counts[drone.id] += 1
+        return charge_time
     
     def generate_drone_reports(self):
         """Her drone için detaylı rapor oluştur"""
@@ -269,9 +716,11 @@ class MultiTripPlanner:
                 'total_deliveries': total_deliveries,
                 'total_distance': drone.total_distance,
                 'total_time': drone.total_time,
-                'charging_cycles': drone.charging_time // self.charge_time_per_cycle,
+                'charging_cycles': self.charge_counts[drone.id], # Başlatılan şarj sayısı
+                'charging_time': drone.charging_time, # Şarjda geçen toplam süre (dakika)
                 'energy_efficiency': total_deliveries / (drone.max_battery - drone.battery + 1),
-                'utilization_rate': (drone.total_time / self.time_horizon) * 100 if self.time_horizon > 0 else 0,
+                'busy_time': self.drone_busy_time[drone.id],
+                'utilization_rate': (self.drone_busy_time[drone.id] / self.time_horizon) * 100 if self.time_horizon > 0 else 0,
                 'trips_detail': trips,
                 'final_battery': drone.battery,
                 'average_deliveries_per_trip': total_deliveries / len(trips) if trips else 0
@@ -336,3 +785,7 @@ class MultiTripPlanner:
             best_drone = max(self.drone_reports.keys(), 
                            key=lambda x: self.drone_reports[x]['total_deliveries'])
             print(f"   - En verimli drone: Drone {best_drone}")
+        for station in self.charging_stations.values():
+            if station.chargers is not None and station.charges:
+                print(f"   - Şarj istasyonu {station.depot}: {station.chargers} cihaz, {station.charges} şarj, "
+                      f"kuyrukta toplam {station.total_wait:.0f}dk (en uzun kuyruk: {station.max_queue})")
@@ -0,0 +1,64 @@
+"""
+Sipariş Akışı - Çevrimiçi (rolling horizon) planlama için zamanla gelen teslimatlar
+Bu dosya, serbest bırakılma zamanına (release time) göre sıralı gelen siparişleri tembel olarak okur. Kaynak bir JSONL dosyası (her satır bir sipariş) veya (zaman, DeliveryPoint) üreten herhangi bir üretici olabilir; bellekte sadece sıradaki sipariş tutulur. Çoklu tur planlayıcısı sıradaki serbest bırakılma zamanını olay zamanlayıcısına koyar ve o ana kadar gelen siparişleri havuza ekler.
+
+JSONL satırı: {"id": 1, "pos": [x, y], "weight": 1.5, "priority": 3, "time_window": [0, 60], "release_time": 0}
+"""
+import json # JSONL okuma / yazma
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+
+class OrderStream:
+    """Serbest bırakılma zamanına göre sıralı sipariş akışı"""
+
+    def __init__(self, orders: Iterable[Tuple[float, DeliveryPoint]]):
+        self.orders = iter(orders) # (serbest bırakılma zamanı, teslimat) üreticisi
+        self.released = 0 # Şimdiye kadar verilen sipariş sayısı
+        self.last_time = float('-inf') # Son verilen siparişin zamanı (sıra kontrolü)
+        self.next_order: Optional[Tuple[float, DeliveryPoint]] = next(self.orders, None)
+
+    @classmethod
+    def from_jsonl(cls, filename: str) -> 'OrderStream':
+        """JSONL dosyasından satır satır okuyan akış"""
+        return cls(cls.read_jsonl(filename))
+
+    @staticmethod
+    def read_jsonl(filename: str) -> Iterator[Tuple[float, DeliveryPoint]]:
+        """Her boş olmayan satırı (serbest bırakılma zamanı, DeliveryPoint) olarak ver"""
+        with open(filename, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                delivery = DeliveryPoint(record['id'], tuple(record['pos']), record['weight'],
+                                         record['priority'], tuple(record['time_window']))
+                yield record.get('release_time', 0), delivery
+
+    @staticmethod
+    def write_jsonl(filename: str, orders: Iterable[Tuple[float, DeliveryPoint]]):
+        """Siparişleri JSONL dosyasına yaz (serbest bırakılma zamanına göre sıralı olmalı)"""
+        with open(filename, 'w', encoding='utf-8') as file:
+            for release_time, delivery in orders:
+                file.write(json.dumps({'id': delivery.id, 'pos': list(delivery.pos), 'weight': delivery.weight,
+                                       'priority': delivery.priority, 'time_window': list(delivery.time_window),
+                                       'release_time': release_time}) + '\n')
+
+    def peek_time(self) -> float:
+        """Sıradaki siparişin serbest bırakılma zamanı (akış bittiyse sonsuz)"""
+        return self.next_order[0] if self.next_order is not None else float('inf')
+
+    def release(self, current_time: float) -> List[DeliveryPoint]:
+        """current_time'a kadar serbest bırakılan tüm siparişleri ver"""
+        batch = []
+        while self.next_order is not None and self.next_order[0] <= current_time:
+            release_time, delivery = self.next_order
+            if release_time < self.last_time:
+                raise ValueError(f"Sipariş {delivery.id} sıra dışı: {release_time} < {self.last_time}")
+            self.last_time = release_time
+            batch.append(delivery)
+            self.next_order = next(self.orders, None)
+        self.released += len(batch)
+        return batch
+
+    def __bool__(self) -> bool:
+        return self.next_order is not None
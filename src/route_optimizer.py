@@ -0,0 +1,135 @@
+"""
+Rota İyileştirici - 2-opt ve Or-opt yerel arama
+Bu dosya, bir depodan (drone üssü) başlayıp depoya dönen kapalı turların ziyaret sırasını iyileştirir. Düğümler arası mesafe matrisi bir kez hesaplanır, her düğüm için en yakın komşu listeleri tutulur ve aday hamleler mesafe farkı (delta) ile taranır. İsteğe bağlı bir maliyet fonksiyonu verilirse (örneğin yüke bağlı enerji ve kural ihlalleri) hamle yalnızca bu maliyeti de düşürüyorsa kabul edilir.
+"""
+import numpy as np # Mesafe matrisi ve komşu listeleri için
+from typing import Dict, Hashable, List, Tuple, Callable, Optional
+
+class RouteOptimizer:
+    """Komşu listeli 2-opt / Or-opt rota iyileştirici"""
+
+    def __init__(self, positions: Dict[Hashable, Tuple[float, float]], neighbour_count: int = 8):
+        self.keys = list(positions) # Düğüm anahtarları (teslimat kimlikleri, depo anahtarları)
+        self.node = {key: i for i, key in enumerate(self.keys)} # anahtar -> matris indeksi
+
+        coordinates = np.array([positions[key] for key in self.keys], dtype=float)
+        diff = coordinates[:, None, :] - coordinates[None, :, :]
+        matrix = np.sqrt((diff ** 2).sum(axis=2))
+        self.distance = matrix.tolist() # Python döngülerinde hızlı erişim için liste
+
+        # Her düğümün en yakın neighbour_count komşusu (kendisi hariç)
+        count = min(neighbour_count, len(self.keys) - 1)
+        order = np.argsort(matrix, axis=1, kind='stable')[:, 1:count + 1]
+        self.neighbours = [[self.keys[j] for j in row] for row in order.tolist()]
+
+        self.evaluations = 0 # Maliyet fonksiyonu çağrı sayısı
+        self.improvements = 0 # Kabul edilen hamle sayısı
+
+    def dist(self, a: Hashable, b: Hashable) -> float:
+        """İki düğüm arası mesafe"""
+        return self.distance[self.node[a]][self.node[b]]
+
+    def tour_length(self, route: List[Hashable], depot: Hashable) -> float:
+        """Depodan başlayıp depoya dönen turun uzunluğu"""
+        tour = [depot] + list(route) + [depot]
+        return sum(self.dist(tour[i], tour[i + 1]) for i in range(len(tour) - 1))
+
+    def improve(self, route: List[Hashable], depot: Hashable,
+                cost: Optional[Callable[[List[Hashable]], float]] = None, budget: int = 100) -> List[Hashable]:
+        """2-opt ve Or-opt'u iyileşme kalmayana veya bütçe bitene kadar dönüşümlü uygula
+
+        cost verilmezse tur uzunluğu kullanılır; budget maliyet değerlendirme sayısı sınırıdır.
+        """
+        route = list(route)
+        if len(route) < 2:
+            return route
+
+        cost = cost or (lambda r: self.tour_length(r, depot))
+        state = {'cost': cost(route), 'budget': budget}
+        self.evaluations += 1
+
+        while state['budget'] > 0:
+            improved = self._two_opt(route, depot, cost, state)
+            improved = self._or_opt(route, depot, cost, state) or improved
+            if not improved:
+                break
+        return route
+
+    def _accept(self, route: List[Hashable], candidate: List[Hashable], cost, state: Dict) -> bool:
+        """Mesafeyi düşüren aday, maliyeti de düşürüyorsa rotayı güncelle"""
+        state['budget'] -= 1
+        self.evaluations += 1
+        candidate_cost = cost(candidate)
+        if candidate_cost < state['cost'] - 1e-9:
+            route[:] = candidate
+            state['cost'] = candidate_cost
+            self.improvements += 1
+            return True
+        return False
+
+    def _two_opt(self, route: List[Hashable], depot: Hashable, cost, state: Dict) -> bool:
+        """2-opt: (a,b) ve (c,d) kenarlarını (a,c) ve (b,d) ile değiştir; c, a'nın komşusu"""
+        improved = False
+        i = 0
+        while i < len(route) and state['budget'] > 0:
+            tour = [depot] + route + [depot]
+            position = {key: k for k, key in enumerate(tour[1:-1], start=1)}
+            a, b = tour[i], tour[i + 1]
+            moved = False
+
+            for c in self.neighbours[self.node[a]]:
+                j = position.get(c)
+                if j is None or j <= i + 1:
+                    continue
+                d = tour[j + 1]
+                delta = self.dist(a, c) + self.dist(b, d) - self.dist(a, b) - self.dist(c, d)
+                if delta < -1e-9:
+                    # tour[i+1..j] ters çevrilir (rota indeksleri tur indeksinden bir eksik)
+                    candidate = route[:i] + route[i:j][::-1] + route[j:]
+                    if self._accept(route, candidate, cost, state):
+                        moved = improved = True
+                        break
+                    if state['budget'] <= 0:
+                        break
+            if not moved:
+                i += 1
+        return improved
+
+    def _or_opt(self, route: List[Hashable], depot: Hashable, cost, state: Dict) -> bool:
+        """Or-opt: 1-3 uzunluğundaki bir kesiti, ilk elemanının komşusunun arkasına taşı"""
+        improved = False
+        for length in (1, 2, 3):
+            i = 0
+            while i + length <= len(route) and state['budget'] > 0:
+                segment = route[i:i + length]
+                rest = route[:i] + route[i + length:]
+                prev = route[i - 1] if i > 0 else depot
+                nxt = route[i + length] if i + length < len(route) else depot
+                removal_gain = (self.dist(prev, segment[0]) + self.dist(segment[-1], nxt) -
+                                self.dist(prev, nxt))
+                moved = False
+
+                for c in self.neighbours[self.node[segment[0]]]:
+                    if c in segment:
+                        continue
+                    if c == depot:
+                        k = 0 # Depo: rotanın başına
+                    elif c in rest:
+                        k = rest.index(c) + 1 # c'nin arkasına
+                    else:
+                        continue
+                    if k == i:
+                        continue # Aynı yer
+                    p = rest[k - 1] if k > 0 else depot
+                    q = rest[k] if k < len(rest) else depot
+                    insert_cost = self.dist(p, segment[0]) + self.dist(segment[-1], q) - self.dist(p, q)
+                    if insert_cost - removal_gain < -1e-9:
+                        candidate = rest[:k] + segment + rest[k:]
+                        if self._accept(route, candidate, cost, state):
+                            moved = improved = True
+                            break
+                        if state['budget'] <= 0:
+                            break
+                if not moved:
+                    i += 1
+        return improved
@@ -0,0 +1,165 @@
+"""
+Tasarruf (Clarke-Wright) Tur Kurucu - Depo başına mekânsal olarak yakın teslimatları turlarda birleştirir
+Bu dosya, her teslimatı kendi turuyla başlatır ve s(i, j) = d(depo, i) + d(depo, j) - d(i, j) tasarrufu en büyük olan uç noktaları birleştirerek turları büyütür. Tasarruflar NumPy ile satır blokları halinde hesaplanır ve her teslimat için en iyi k komşuyla sınırlanır; birleştirme kapasite, durak sayısı, gerçek tur enerjisi ve zaman penceresi (geç kalma toleransı) kontrollerinden geçer. Sonuçta elde edilen turlar çoklu tur planlayıcısının olay zamanlayıcısı tarafından drone'lara dağıtılır.
+"""
+import math # Depo seçimi için mesafe
+import numpy as np # Vektörel tasarruf hesabı
+from typing import Dict, List, Optional, Tuple
+from .drone import Drone # Drone sınıfı
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+from .trip_sequence import TripSequence # Tur enerjisi ve varış zamanları
+
+class SavingsTripBuilder:
+    """Depo başına Clarke-Wright tasarruf algoritmasıyla tur kurucu"""
+
+    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint], late_tolerance: int = 120,
+                 max_stops: int = 8, neighbour_count: int = 50, block_size: int = 512):
+        self.drones = drones
+        self.deliveries = deliveries
+        self.late_tolerance = late_tolerance # Zaman penceresi bitişinden sonra kabul edilen gecikme
+        self.max_stops = max_stops # Tur başına en fazla teslimat
+        self.neighbour_count = neighbour_count # Her teslimat için değerlendirilen en yüksek tasarruflu komşu sayısı
+        self.block_size = block_size # Tasarruf matrisinin bir seferde hesaplanan satır sayısı
+
+        # Depo = drone başlangıç konumu; her depoda en büyük kapasiteli drone turların ölçüsüdür
+        self.depot_drones: Dict[Tuple[float, float], List[Drone]] = {}
+        for drone in drones:
+            self.depot_drones.setdefault(drone.start_pos, []).append(drone)
+        self.reference = {depot: max(group, key=lambda d: (d.max_weight, d.max_battery))
+                          for depot, group in self.depot_drones.items()}
+        self.merges = 0 # Kabul edilen birleştirme sayısı
+
+    def assign_depots(self) -> Dict[Tuple[float, float], List[DeliveryPoint]]:
+        """Her teslimatı, paketi taşıyabilen drone'u olan en yakın depoya ata"""
+        groups = {depot: [] for depot in self.depot_drones}
+        for delivery in self.deliveries:
+            depots = [depot for depot, drone in self.reference.items() if drone.max_weight >= delivery.weight]
+            if depots:
+                groups[min(depots, key=lambda depot: math.dist(depot, delivery.pos))].append(delivery)
+        return groups
+
+    def candidate_pairs(self, depot: Tuple[float, float], deliveries: List[DeliveryPoint]) -> List[Tuple[int, int]]:
+        """Pozitif tasarruflu (i, j) çiftleri, tasarrufa göre azalan sırada
+
+        Satırlar block_size'lık bloklarda hesaplanır; her satırdan en yüksek neighbour_count tasarruf alınır,
+        böylece bellek O(n * k) kalır.
+        """
+        count = len(deliveries)
+        if count < 2:
+            return []
+        positions = np.array([d.pos for d in deliveries], dtype=float)
+        depot_distance = np.sqrt(((positions - np.array(depot, dtype=float)) ** 2).sum(axis=1))
+        k = min(self.neighbour_count, count - 1)
+
+        rows, cols, values = [], [], []
+        for start in range(0, count, self.block_size):
+            block = slice(start, min(start + self.block_size, count))
+            diff = positions[block, None, :] - positions[None, :, :]
+            savings = depot_distance[block, None] + depot_distance[None, :] - np.sqrt((diff ** 2).sum(axis=2))
+            savings[np.arange(savings.shape[0]), np.arange(block.start, block.stop)] = -np.inf # i == j
+
+            top = np.argpartition(-savings, k - 1, axis=1)[:, :k]
+            top_values = np.take_along_axis(savings, top, axis=1)
+            block_rows = np.repeat(np.arange(block.start, block.stop), k)
+            rows.append(block_rows)
+            cols.append(top.ravel())
+            values.append(top_values.ravel())
+
+        rows, cols, values = np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+        positive = values > 0
+        low = np.minimum(rows, cols)[positive]
+        high = np.maximum(rows, cols)[positive]
+        # (i, j) ve (j, i) aynı çift: tekilleştir, sonra tasarrufa göre azalan sırala
+        _, unique = np.unique(low * count + high, return_index=True)
+        order = unique[np.argsort(-values[positive][unique], kind='stable')]
+        return list(zip(low[order].tolist(), high[order].tolist()))
+
+    def latest_start(self, trip: TripSequence) -> float:
+        """Hiçbir teslimatın geç kalma toleransını aşmadığı en geç kalkış zamanı"""
+        arrivals = trip.arrival_times(0)
+        return min(delivery.time_window[1] + self.late_tolerance - arrival
+                   for delivery, arrival in zip(trip.stops, arrivals))
+
+    def feasible(self, trip: TripSequence, drone: Drone, start_time: float = 0) -> bool:
+        """Kapasite, durak sayısı, tam bataryayla enerji ve zaman penceresi (start_time'da kalkışla) kontrolü"""
+        return (len(trip) <= self.max_stops and trip.total_weight <= drone.max_weight and
+                trip.energy <= drone.max_battery and self.latest_start(trip) >= start_time)
+
+    def build_depot(self, depot: Tuple[float, float], deliveries: List[DeliveryPoint]) -> List[TripSequence]:
+        """Tek depo için tasarruf birleştirmesi; her teslimat başta kendi turundadır"""
+        drone = self.reference[depot]
+        routes: Dict[int, List[int]] = {i: [i] for i in range(len(deliveries))} # tur kimliği -> teslimat sıraları
+        route_of = list(range(len(deliveries))) # teslimat sırası -> tur kimliği
+        weight = {i: deliveries[i].weight for i in range(len(deliveries))}
+
+        for i, j in self.candidate_pairs(depot, deliveries):
+            a, b = route_of[i], route_of[j]
+            if a == b or weight[a] + weight[b] > drone.max_weight or \
+               len(routes[a]) + len(routes[b]) > self.max_stops:
+                continue
+            first, second = routes[a], routes[b]
+            # i ve j kendi turlarının uçlarında olmalı; birleşik turda yan yana gelecek şekilde yönlendir
+            if first[-1] == i and second[0] == j:
+                merged = first + second
+            elif first[0] == i and second[-1] == j:
+                merged = second + first
+            elif first[-1] == i and second[-1] == j:
+                merged = first + second[::-1]
+            elif first[0] == i and second[0] == j:
+                merged = first[::-1] + second
+            else:
+                continue
+
+            # Yükten dolayı enerji yöne bağlıdır: iki yönden uygun ve ucuz olan seçilir
+            options = [TripSequence(drone, [deliveries[k] for k in order]) for order in (merged, merged[::-1])]
+            options = [trip for trip in options if self.feasible(trip, drone)]
+            if not options:
+                continue
+            best = min(options, key=lambda trip: trip.energy)
+            routes[a] = merged if best.stops[0] is deliveries[merged[0]] else merged[::-1]
+            weight[a] += weight.pop(b)
+            for k in routes.pop(b):
+                route_of[k] = a
+            self.merges += 1
+
+        return [TripSequence(drone, [deliveries[k] for k in route]) for route in routes.values()]
+
+    def insert(self, delivery: DeliveryPoint, trips: Dict[Tuple[float, float], List[Optional[TripSequence]]],
+               first: Dict[Tuple[float, float], int], start_time: float) -> Optional[Tuple[float, float]]:
+        """Sonradan gelen teslimatı deposunun henüz dağıtılmamış turlarına ekle (çevrimiçi mod)
+
+        En ucuz enerji farkıyla eklenebildiği uygun tur, tek başına turun enerjisinden ucuzsa o tura eklenir;
+        değilse tek duraklı yeni tur açılır. first[depot], dağıtılmamış ilk turun sırasıdır. Teslimatın
+        eklendiği depo döner (taşıyabilen drone yoksa None).
+        """
+        depots = [depot for depot, drone in self.reference.items() if drone.max_weight >= delivery.weight]
+        if not depots:
+            return None
+        depot = min(depots, key=lambda depot: math.dist(depot, delivery.pos))
+        drone = self.reference[depot]
+        depot_trips = trips.setdefault(depot, [])
+        single = TripSequence(drone, [delivery])
+        best_delta, best_index, best_trip = single.energy, None, None
+        for index in range(first.get(depot, 0), len(depot_trips)):
+            trip = depot_trips[index]
+            if trip is None or len(trip) >= self.max_stops or trip.total_weight + delivery.weight > drone.max_weight:
+                continue
+            delta, position = trip.cheapest_insertion(delivery)
+            if delta < best_delta:
+                candidate = TripSequence(drone, trip.stops)
+                candidate.insert(delivery, position)
+                if self.feasible(candidate, drone, start_time):
+                    best_delta, best_index, best_trip = delta, index, candidate
+        if best_trip is not None:
+            depot_trips[best_index] = best_trip
+            self.merges += 1
+        else:
+            depot_trips.append(single)
+        return depot
+
+    def build(self) -> Dict[Tuple[float, float], List[TripSequence]]:
+        """Tüm depolar için turları kur; her depo listesi en geç kalkış zamanına göre sıralı"""
+        trips = {}
+        for depot, deliveries in self.assign_depots().items():
+            trips[depot] = sorted(self.build_depot(depot, deliveries), key=self.latest_start)
+        return trips
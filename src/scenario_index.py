@@ -0,0 +1,47 @@
+"""
+Senaryo İndeksi - Drone ve teslimat özelliklerine sabit zamanlı erişim
+Bu dosya, teslimat ve drone kimliklerini sıra numaralarına eşleyen ve ağırlık, öncelik, konum, zaman penceresi ile drone kapasitelerini kimlik sırasına göre tuple'larda tutan değişmez bir indeks sağlar. Genetik algoritmadaki tüm bireyler aynı indeksi paylaşır; böylece `next(d for d in deliveries if d.id == did)` gibi doğrusal aramalar ortadan kalkar.
+"""
+from types import MappingProxyType # Salt okunur sözlükler için
+from typing import List, Tuple
+from .drone import Drone # Drone sınıfı
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+
+class ScenarioIndex:
+    """Bireyler arasında paylaşılan, değişmez senaryo indeksi"""
+
+    def __init__(self, drones: List[Drone], deliveries: List[DeliveryPoint]):
+        # Teslimatlar: kimlik -> sıra ve sıraya göre özellikler
+        self.delivery_ids = tuple(d.id for d in deliveries)
+        self.delivery_position = MappingProxyType({d.id: i for i, d in enumerate(deliveries)})
+        self.delivery_by_id = MappingProxyType({d.id: d for d in deliveries})
+        self.weights = tuple(d.weight for d in deliveries)
+        self.priorities = tuple(d.priority for d in deliveries)
+        self.positions = tuple(d.pos for d in deliveries)
+        self.time_windows = tuple(d.time_window for d in deliveries)
+
+        # Drone'lar: kimlik -> sıra ve kapasiteler
+        self.drone_ids = tuple(d.id for d in drones)
+        self.drone_position = MappingProxyType({d.id: j for j, d in enumerate(drones)})
+        self.drone_by_id = MappingProxyType({d.id: d for d in drones})
+        self.capacities = tuple(d.max_weight for d in drones)
+
+    def weight(self, delivery_id: int) -> float:
+        """Teslimat ağırlığı"""
+        return self.weights[self.delivery_position[delivery_id]]
+
+    def priority(self, delivery_id: int) -> int:
+        """Teslimat önceliği"""
+        return self.priorities[self.delivery_position[delivery_id]]
+
+    def capacity(self, drone_id: int) -> float:
+        """Drone taşıma kapasitesi"""
+        return self.capacities[self.drone_position[drone_id]]
+
+    def total_weight(self, delivery_ids: List[int]) -> float:
+        """Teslimat listesinin toplam ağırlığı"""
+        return sum(self.weights[self.delivery_position[did]] for did in delivery_ids)
+
+    def sort_by_priority(self, delivery_ids: List[int]) -> Tuple[int, ...]:
+        """Öncelik sırası (büyükten küçüğe, eşitlikte liste sırası korunur)"""
+        return tuple(sorted(delivery_ids, key=self.priority, reverse=True))
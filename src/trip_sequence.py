@@ -0,0 +1,131 @@
+"""
+Tur Dizisi - Tek bir teslimat turunun gerçek geometrisi ve artımlı enerji hesabı
+Bu dosya, depodan çıkıp teslimatları sırayla bırakarak depoya dönen bir turu temsil eder. Her bacağın (leg) mesafesi, taşınan yükü ve önek mesafe toplamları önbellekte tutulur; böylece bir adayın tura en ucuz eklenme maliyeti, Drone.calculate_energy_consumption ile aynı enerji modeliyle, ekleme konumu başına O(1) hesaplanır. Uçuştan önce tur, en yakın komşu sırasından başlayıp 2-opt / Or-opt ile enerji ve gecikme cezası düşecek şekilde yeniden sıralanabilir.
+"""
+import math # Öklid mesafesi
+from typing import List, Tuple
+from .drone import Drone # Enerji modeli
+from .delivery_point import DeliveryPoint # Teslimat sınıfı
+from .route_optimizer import RouteOptimizer # 2-opt / Or-opt
+
+class TripSequence:
+    """Depo -> teslimatlar -> depo turu; bacak yükleri ve önek mesafeleri önbellekte"""
+
+    service_time = 2 # Her teslimatta geçen süre (dakika), execute_trip ile aynı
+
+    def __init__(self, drone: Drone, stops: List[DeliveryPoint] = ()):
+        self.drone = drone # Enerji modeli ve depo konumu
+        self.depot = drone.start_pos # Tur depoda başlar ve biter
+        self.stops = list(stops) # Ziyaret sırası
+        self.rebuild()
+
+    def rebuild(self):
+        """Bacak mesafelerini, yüklerini, önek toplamlarını ve tur enerjisini yeniden hesapla (O(k))"""
+        self.positions = [self.depot] + [d.pos for d in self.stops] + [self.depot]
+        self.total_weight = sum(d.weight for d in self.stops)
+
+        # Bacak i: positions[i] -> positions[i+1]; yük = henüz bırakılmamış paketler
+        self.leg_distance = [math.dist(self.positions[i], self.positions[i + 1])
+                             for i in range(len(self.positions) - 1)]
+        self.leg_load = []
+        load = self.total_weight
+        for i in range(len(self.leg_distance)):
+            self.leg_load.append(load)
+            if i < len(self.stops):
+                load -= self.stops[i].weight
+
+        # prefix_distance[i]: bacak 0..i-1'in toplam mesafesi
+        self.prefix_distance = [0.0]
+        for distance in self.leg_distance:
+            self.prefix_distance.append(self.prefix_distance[-1] + distance)
+
+        self.distance = self.prefix_distance[-1]
+        self.energy = sum(self.drone.calculate_energy_consumption(distance, load)
+                          for distance, load in zip(self.leg_distance, self.leg_load))
+
+    def insertion_cost(self, delivery: DeliveryPoint, position: int) -> float:
+        """Teslimatı stops[position] öncesine eklemenin enerji farkı (O(1))
+
+        Eklenen paket, ekleme noktasına kadar olan tüm bacaklarda taşınır; enerji yükte doğrusal
+        olduğundan bu ek, önek mesafe üzerinden tek çağrıyla hesaplanır.
+        """
+        energy = self.drone.calculate_energy_consumption
+        a, b = self.positions[position], self.positions[position + 1]
+        load = self.leg_load[position]
+        carried = self.prefix_distance[position]
+
+        extra_load = energy(carried, delivery.weight) - energy(carried, 0)
+        detour = (energy(math.dist(a, delivery.pos), load + delivery.weight) +
+                  energy(math.dist(delivery.pos, b), load) -
+                  energy(self.leg_distance[position], load))
+        return extra_load + detour
+
+    def cheapest_insertion(self, delivery: DeliveryPoint) -> Tuple[float, int]:
+        """En düşük enerji farkını veren ekleme konumu: (enerji farkı, konum)"""
+        return min((self.insertion_cost(delivery, position), position)
+                   for position in range(len(self.stops) + 1))
+
+    def insert(self, delivery: DeliveryPoint, position: int):
+        """Teslimatı verilen konuma ekle ve önbelleği güncelle"""
+        self.stops.insert(position, delivery)
+        self.rebuild()
+
+    def arrival_times(self, start_time: float) -> List[float]:
+        """Her teslimata varış zamanı (dakika): uçuş süresi + önceki teslimatların servis süresi"""
+        return [start_time + self.prefix_distance[i + 1] / self.drone.speed / 60 + self.service_time * i
+                for i in range(len(self.stops))]
+
+    def lateness(self, start_time: float) -> float:
+        """Zaman penceresi bitişinden sonraki toplam gecikme (dakika)"""
+        return sum(max(0.0, arrival - delivery.time_window[1])
+                   for arrival, delivery in zip(self.arrival_times(start_time), self.stops))
+
+    def nearest_neighbour_order(self) -> List[DeliveryPoint]:
+        """Depodan başlayıp her adımda en yakın ziyaret edilmemiş teslimata giden sıra"""
+        remaining = list(self.stops)
+        order, position = [], self.depot
+        while remaining:
+            nearest = min(remaining, key=lambda d: math.dist(position, d.pos))
+            remaining.remove(nearest)
+            order.append(nearest)
+            position = nearest.pos
+        return order
+
+    def optimize(self, start_time: float, budget: int = 100, late_penalty: float = 1e6) -> float:
+        """Turu 2-opt / Or-opt ile yeniden sırala; maliyet düşüşünü döndür
+
+        Arama mevcut, en yakın komşu ve bitiş zamanı sıralarından ayrı ayrı başlatılır (her biri budget değerlendirme).
+        Maliyet = tur enerjisi + late_penalty * gecikme dakikası; varsayılan ceza, gecikmeyi artıran hamleleri
+        fiilen yasaklar (zaman penceresi kısıt gibi davranır). Bataryayı aşan sıralar kabul edilmez.
+        """
+        if len(self.stops) < 2:
+            return 0.0
+        by_id = {delivery.id: delivery for delivery in self.stops}
+
+        def cost(order: List[int]) -> float:
+            trip = TripSequence(self.drone, [by_id[delivery_id] for delivery_id in order])
+            if trip.energy > self.drone.battery:
+                return float('inf')
+            return trip.energy + late_penalty * trip.lateness(start_time)
+
+        current = [delivery.id for delivery in self.stops]
+        initial_cost = cost(current)
+        nearest = [delivery.id for delivery in self.nearest_neighbour_order()]
+        # 2-opt / Or-opt sadece mesafeyi kısaltan hamleleri dener; sıkı pencereler için bitiş zamanı sırası da başlangıç
+        deadline = [delivery.id for delivery in sorted(self.stops, key=lambda d: d.time_window[1])]
+
+        positions = {delivery_id: delivery.pos for delivery_id, delivery in by_id.items()}
+        positions['depot'] = self.depot
+        optimizer = RouteOptimizer(positions)
+        route = min((optimizer.improve(start, 'depot', cost=cost, budget=budget)
+                     for start in (current, nearest, deadline)), key=cost)
+
+        final_cost = cost(route)
+        if final_cost < initial_cost:
+            self.stops = [by_id[delivery_id] for delivery_id in route]
+            self.rebuild()
+            return initial_cost - final_cost
+        return 0.0
+
+    def __len__(self) -> int:
+        return len(self.stops)
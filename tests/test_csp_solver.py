@@ -0,0 +1,177 @@
+"""
+CSP çözücü testleri - Optimizasyon modlarının örnek veri üzerinde doğru çalıştığını kontrol eder
+"""
+import sys
+import os
+import random
+
+# Proje dizinini python path'ine ekle (modüllerin bulunması için)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_loader import DataLoader # Veri yükleme sınıfı
+from src.graph_builder import DeliveryGraph # Teslimat grafiği oluşturma
+from src.csp_solver import CSPSolver # CSP algoritması için sınıf
+from src.csp_decomposition import DecomposedCSPSolver # Bölgesel paralel CSP
+from src.drone import Drone # Elle kurulan küçük senaryolar için
+from src.delivery_point import DeliveryPoint
+from src.data_generator import DataGenerator # Rastgele senaryo üretici
+
+DATA_PATH = os.path.join(project_root, "data", "sample_data.txt")
+
+def build_solver():
+    """Örnek veriden CSP çözücü oluştur"""
+    drones, deliveries, no_fly_zones = DataLoader().load_from_txt(DATA_PATH)
+    graph = DeliveryGraph(drones, deliveries, no_fly_zones)
+    return CSPSolver(drones, deliveries, no_fly_zones, graph)
+
+def test_branch_and_bound_beats_first_solution():
+    """B&B kapsaması forward checking'in ilk çözümünden kötü olmamalı"""
+    fc_solver = build_solver()
+    fc_quality = fc_solver.get_solution_quality(fc_solver.solve_with_forward_checking())
+    
+    solver = build_solver()
+    solution = solver.solve_optimal()
+    quality = solver.get_solution_quality(solution)
+    
+    assert solver.is_consistent(solution)
+    assert quality['covered_deliveries'] >= fc_quality['covered_deliveries']
+    
+    # Arama tamamlandığında üst sınır incumbent'a eşitlenir
+    final = solver.progress_log[-1]
+    assert final['incumbent'] == quality['covered_deliveries']
+    assert final['bound'] == final['incumbent'] and final['gap'] == 0.0
+
+def test_backjumping_skips_irrelevant_drone():
+    """Drone 3'ün çakışması drone 1'den kaynaklanıyorsa drone 2 atlanmalı"""
+    drones = [Drone(i, 5.0, 10000, 10.0, (0, 0)) for i in (1, 2, 3)]
+    deliveries = [DeliveryPoint(1, (5, 5), 1.0, 3, (0, 100)),
+                  DeliveryPoint(2, (6, 5), 1.0, 5, (0, 100)),
+                  DeliveryPoint(3, (5, 6), 1.0, 2, (0, 100)),
+                  DeliveryPoint(4, (6, 6), 1.0, 4, (0, 100))]
+    graph = DeliveryGraph(drones, deliveries, [])
+    solver = CSPSolver(drones, deliveries, [], graph)
+    # Boş set olmadan: drone 1 önce {2}'yi dener, drone 3 sadece {2} alabilir
+    solver.domains = {1: [{1}, {2}], 2: [{3}, {4}], 3: [{2}]}
+    
+    solution = solver.solve_with_backjumping()
+    
+    assert solution == {1: {1}, 2: {4}, 3: {2}}
+    assert solver.search_stats['backjumps'] == 1
+    assert solver.search_stats['nogoods_stored'] == 1
+    assert frozenset({(1, frozenset({2}))}) in solver.nogoods
+
+def test_decomposition_covers_full_scenario():
+    """Ayrıştırılmış çözüm tüm drone'ları içermeli ve teslimatlar çakışmamalı"""
+    drones, deliveries, no_fly_zones = DataLoader().load_from_txt(DATA_PATH)
+    graph = DeliveryGraph(drones, deliveries, no_fly_zones)
+    solver = DecomposedCSPSolver(drones, deliveries, no_fly_zones, graph,
+                                 max_drones_per_cluster=3, n_workers=2)
+    
+    solution = solver.solve()
+    
+    assert set(solution) == {d.id for d in drones}
+    assigned = [did for delivery_set in solution.values() for did in delivery_set]
+    assert len(assigned) == len(set(assigned)) # Her teslimat en fazla bir drone'da
+    assert len(solver.clusters) == 2
+    assert solver.get_solution_quality(solution)['covered_deliveries'] == len(assigned)
+    
+    # Onarım yardımcı kısıt fonksiyonlarıyla yapılır; sonuç tam çözücünün kısıtlarını da sağlamalı
+    checker = CSPSolver(drones, deliveries, no_fly_zones, graph, lazy_domains=True)
+    assert checker.is_consistent(solution)
+    assert all(CSPSolver.can_drone_handle_deliveries(drone, [checker.delivery_by_id[did] for did in solution[drone.id]])
+               for drone in drones if solution[drone.id])
+
+def test_oversized_cluster_is_split_spatially():
+    """Boyut sınırını aşan k-means grubu liste sırasına göre değil, konuma göre bölünmeli"""
+    # Aynı bölgedeki dört üs liste sırasında karışık; iki uzak üs ayrı gruplar oluşturur
+    drones = [Drone(i + 1, 5.0, 1000, 10.0, (x, 0)) for i, x in enumerate([0, 30, 10, 20])]
+    drones += [Drone(5, 5.0, 1000, 10.0, (1000, 1000)), Drone(6, 5.0, 1000, 10.0, (-1000, 1000))]
+    deliveries = [DeliveryPoint(1, (5, 5), 1.0, 3, (0, 100))]
+    solver = DecomposedCSPSolver(drones, deliveries, [], DeliveryGraph(drones, deliveries, []),
+                                 max_drones_per_cluster=2)
+    
+    clusters = [sorted(d.start_pos for d in group) for group in solver.cluster_drones()]
+    
+    assert all(len(group) <= 2 for group in clusters)
+    assert [(0, 0), (10, 0)] in clusters and [(20, 0), (30, 0)] in clusters
+
+def test_lazy_domains_match_eager_values():
+    """Tembel domain tam listelemeyle aynı tutarlı setleri, büyükten küçüğe üretmeli"""
+    eager = build_solver()
+    drones, deliveries, no_fly_zones = DataLoader().load_from_txt(DATA_PATH)
+    lazy = CSPSolver(drones, deliveries, no_fly_zones, DeliveryGraph(drones, deliveries, no_fly_zones),
+                     lazy_domains=True)
+    
+    for drone in drones:
+        eager_values = {frozenset(s) for s in eager.order_domain_values(drone.id)}
+        domain = lazy.domains[drone.id]
+        assert not domain.cache # Arama başlamadan hiçbir değer üretilmez
+        lazy_values = list(domain)
+        assert {frozenset(s) for s in lazy_values} == eager_values
+        assert [len(s) for s in lazy_values] == sorted((len(s) for s in lazy_values), reverse=True)
+        assert domain.estimate_size() == len(lazy_values) # Tükenen domain'de tahmin kesinleşir
+    
+    solution = lazy.solve_with_forward_checking()
+    assert lazy.is_consistent(solution)
+
+def test_anytime_search_respects_node_budget():
+    """Düğüm bütçesi dolduğunda o ana kadarki en iyi çözüm döndürülmeli"""
+    solver = build_solver()
+    improvements = []
+    
+    solution = solver.solve_optimal(node_limit=50, on_solution=improvements.append)
+    
+    assert solver.budget_hit and solver.stopped
+    assert solver.search_stats['nodes_visited'] <= 51
+    assert improvements and improvements[-1]['solution'] == solution
+    coverages = [r['quality']['covered_deliveries'] for r in improvements]
+    assert coverages == sorted(set(coverages)) # Sadece iyileşen çözümler bildirilir
+    
+    # Generator arayüzü: ilk çözüm arama bitmeden alınabilir
+    first = next(build_solver().iter_solutions())
+    assert first['quality']['covered_deliveries'] > 0
+
+def test_budgeted_fc_and_cbj_return_best_partial_assignment():
+    """Bütçe dolan fc / cbj araması None değil, en çok kapsayan kısmi atamayı (boş setlerle tamamlanmış) döndürmeli"""
+    for mode in ('fc', 'cbj'):
+        solver = build_solver()
+        if mode == 'fc':
+            solution = solver.solve_with_forward_checking(node_limit=3)
+        else:
+            solution = solver.solve_with_backjumping(node_limit=3)
+        
+        assert solver.budget_hit
+        assert sorted(solution) == sorted(d.id for d in solver.drones)
+        assert solver.is_consistent(solution)
+        assert solver.get_solution_quality(solution)['covered_deliveries'] == solver.best_partial_coverage > 0
+
+def test_backjumping_without_idle_drones_on_generated_instance():
+    """Boşta kalma yasakken üretilmiş senaryoda çakışmalar gerçek backjump'lara yol açmalı"""
+    random.seed(1)
+    scenario = DataGenerator().create_balanced_scenario(6, 10, 1)
+    drones, deliveries, no_fly_zones = DataLoader().load_python_data(
+        scenario['drones'], scenario['deliveries'], scenario['no_fly_zones'])
+    solver = CSPSolver(drones, deliveries, no_fly_zones, DeliveryGraph(drones, deliveries, no_fly_zones))
+    
+    solution = solver.solve_with_backjumping(allow_idle=False)
+    
+    assert solution is not None and all(solution[drone.id] for drone in drones)
+    assert solver.is_consistent(solution)
+    assert solver.search_stats['backjumps'] > 0 and solver.search_stats['nogoods_stored'] > 0
+    
+    # Örnek veride bazı drone'lar tek teslimat bile alamaz: arama başarısızlığı kanıtlar
+    sample = build_solver()
+    assert sample.solve_with_backjumping(allow_idle=False) is None and not sample.budget_hit
+    assert sample.search_stats['backjumps'] > 0
+
+if __name__ == "__main__":
+    test_branch_and_bound_beats_first_solution()
+    test_backjumping_skips_irrelevant_drone()
+    test_decomposition_covers_full_scenario()
+    test_oversized_cluster_is_split_spatially()
+    test_lazy_domains_match_eager_values()
+    test_anytime_search_respects_node_budget()
+    test_budgeted_fc_and_cbj_return_best_partial_assignment()
+    test_backjumping_without_idle_drones_on_generated_instance()
+    print("✅ CSP testleri tamamlandı")
@@ -0,0 +1,258 @@
+"""
+Genetik algoritma testleri - GA motorlarının örnek veri üzerinde tutarlı çalıştığını kontrol eder
+"""
+import sys
+import os
+import random
+
+# Proje dizinini python path'ine ekle (modüllerin bulunması için)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_loader import DataLoader # Veri yükleme sınıfı
+from src.graph_builder import DeliveryGraph # Teslimat grafiği oluşturma
+from src.genetic_algorithm import GeneticAlgorithm, Individual # Nesne tabanlı GA
+from src.vectorized_ga import VectorizedGeneticAlgorithm # NumPy tabanlı GA
+from src.island_ga import IslandGeneticAlgorithm # Ada modeli GA
+from src.route_optimizer import RouteOptimizer # 2-opt / Or-opt
+
+DATA_PATH = os.path.join(project_root, "data", "sample_data.txt")
+
+def load_scenario():
+    """Örnek veriyi ve grafı yükle"""
+    drones, deliveries, no_fly_zones = DataLoader().load_from_txt(DATA_PATH)
+    graph = DeliveryGraph(drones, deliveries, no_fly_zones)
+    return drones, deliveries, no_fly_zones, graph
+
+def test_vectorized_fitness_matches_individual():
+    """Toplu fitness, Individual.calculate_fitness ile birebir aynı olmalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = VectorizedGeneticAlgorithm(drones, deliveries, no_fly_zones, graph, seed=7)
+    ga.mutation_rate = 1.0 # İhlalli bireyler de üretilsin
+    population = ga.mutate_population(ga.random_population(100))
+    fitness = ga.evaluate_population(population)
+
+    for row, value in zip(population, fitness):
+        individual = ga.to_individual(row, value)
+        assert abs(individual.calculate_fitness(graph, no_fly_zones) - value) < 1e-6
+
+    # Evrim sonucu kapasiteyi aşmayan bir Individual döner
+    ga.generations = 20
+    best = ga.evolve()
+    assert best.is_feasible()
+    assert len(ga.fitness_history) == 20
+
+def test_fitness_cache_skips_unchanged_individuals():
+    """Değişmemiş bireyler yeniden hesaplanmamalı, önbellekten gelen fitness doğru olmalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    ga.generations = 30
+    ga.evolve()
+    
+    stats = ga.get_cache_stats()
+    assert stats['skipped_evaluations'] >= ga.elite_size * (ga.generations - 1) # Elitler hiç yeniden hesaplanmaz
+    assert stats['evaluations'] + stats['fitness_cache_hits'] + stats['skipped_evaluations'] == \
+        ga.population_size * (ga.generations + 1)
+    assert len(ga.cache_history) == len(ga.fitness_history)
+    
+    for individual in ga.population:
+        if not individual.dirty:
+            assert abs(individual.copy().calculate_fitness(graph, no_fly_zones) - individual.fitness) < 1e-6
+
+def test_mutation_updates_only_touched_drones():
+    """Mutasyon en fazla iki drone'u işaretlemeli ve artımlı fitness tam hesapla aynı olmalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    ga.mutation_rate = 1.0
+    random.seed(5)
+    base = Individual(drones, deliveries)
+    base.randomize()
+    base.repair()
+    base.calculate_fitness(graph, no_fly_zones)
+    
+    for _ in range(50):
+        child = base.copy()
+        ga.mutate(child)
+        assert len(child.dirty_drones) <= 2
+        
+        fresh = Individual(drones, deliveries)
+        fresh.chromosome = dict(child.chromosome)
+        assert child.calculate_fitness(graph, no_fly_zones) == fresh.calculate_fitness(graph, no_fly_zones)
+
+def test_crossover_children_have_no_duplicates():
+    """Tüm çaprazlama operatörleri her teslimatı en fazla bir drone'a atamalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    ga.crossover_rate = 1.0
+    random.seed(2)
+    ga.initialize_population()
+    
+    # Dev tur dönüşümü kayıpsız
+    tour = ga.to_giant_tour(ga.population[0])
+    restored = ga.population[0].copy()
+    ga.from_giant_tour(restored, tour)
+    assert restored.chromosome == ga.population[0].chromosome
+    
+    for operator in ('drone', 'ox', 'pmx'):
+        ga.crossover_operator = operator
+        for _ in range(30):
+            parent1, parent2 = random.sample(ga.population, 2)
+            for child in ga.crossover(parent1, parent2):
+                assigned = [did for delivery_list in child.chromosome.values() for did in delivery_list]
+                assert len(assigned) == len(set(assigned))
+                
+        if operator == 'drone':
+            # Drone takasında düşen teslimatlar yeniden atanır (kapasite yettiği sürece)
+            child, _ = ga.crossover(parent1, parent2)
+            child.repair()
+            assert child.is_feasible()
+
+def test_route_optimizer_untangles_tour():
+    """Çember üzerindeki karışık sıralı tur, 2-opt / Or-opt ile çemberin çevresine inmeli"""
+    import math
+    points = {k: (50 + 40 * math.cos(2 * math.pi * k / 8), 50 + 40 * math.sin(2 * math.pi * k / 8))
+              for k in range(1, 9)}
+    points['depot'] = (90, 50)
+    optimizer = RouteOptimizer(points, neighbour_count=4)
+    
+    route = optimizer.improve([5, 2, 7, 1, 4, 8, 3, 6], 'depot', budget=200)
+    assert sorted(route) == list(range(1, 9))
+    optimal = optimizer.tour_length(list(range(1, 9)), 'depot')
+    assert abs(optimizer.tour_length(route, 'depot') - optimal) < 1e-6
+    
+    # Memetik GA: yerel arama bireyin fitness'ını düşürmez
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    ga.memetic = True
+    random.seed(4)
+    individual = Individual(drones, deliveries, ga.index, ordered=True)
+    individual.randomize()
+    individual.repair()
+    before = individual.calculate_fitness(graph, no_fly_zones)
+    ga.local_search(individual)
+    assert individual.calculate_fitness(graph, no_fly_zones) >= before
+
+def test_stagnation_stops_early_and_diversity_is_bounded():
+    """Durgunlukta erken durulmalı; çeşitlilik 0-1 aralığında olmalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    ga.generations = 300
+    ga.stagnation_limit = 10
+    ga.adaptive_rates = True
+    ga.restart_after = 5
+    random.seed(8)
+    best = ga.evolve()
+    
+    assert ga.stopped_generation is not None and len(ga.fitness_history) < 300
+    assert best.fitness == max(ga.fitness_history)
+    assert ga.restarts >= 1
+    assert all(0.0 <= d <= 1.0 for d in ga.diversity_history)
+    assert (ga.mutation_rate, ga.crossover_rate) == ga.base_rates # Oranlar geri yüklenir
+    
+    # Aynı bireylerden oluşan popülasyonun çeşitliliği 0
+    ga.population = [best.copy() for _ in range(5)]
+    assert ga.population_diversity() == 0.0
+
+def test_copy_on_write_and_steady_state():
+    """Kopyalar drone tuple'larını paylaşmalı; değişiklik sadece kopyayı etkilemeli"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph)
+    random.seed(6)
+    ga.initialize_population()
+    original = ga.population[0]
+    snapshot = dict(original.chromosome)
+    
+    clone = original.copy()
+    assert all(clone.chromosome[d] is original.chromosome[d] for d in snapshot)
+    drone_id = next(d for d, route in snapshot.items() if route)
+    clone.remove_delivery(drone_id, snapshot[drone_id][0])
+    assert original.chromosome == snapshot and clone.chromosome[drone_id] == snapshot[drone_id][1:]
+    assert clone.dirty_drones == {drone_id}
+    
+    # Steady-state: liste yerinde güncellenir, en iyi fitness asla düşmez
+    ga.replacement = 'steady_state'
+    population = ga.population
+    best = max(ind.fitness for ind in population)
+    for generation in range(10):
+        ga.step(generation)
+        assert ga.population is population
+        assert max(ind.fitness for ind in population) >= best
+        best = max(ind.fitness for ind in population)
+
+def test_parallel_fitness_matches_serial():
+    """Süreç havuzuyla hesaplanan evrim, tek süreçli evrimle aynı sonucu vermeli"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    histories = []
+    for n_workers in (1, 2):
+        random.seed(11) # Genetik operatörler ana süreçte çalışır, sonuçlar aynı olmalı
+        ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph, n_workers=n_workers)
+        ga.generations = 10
+        ga.evolve()
+        histories.append(ga.fitness_history)
+    
+    assert histories[0] == histories[1]
+
+def test_cached_fitness_restores_metrics():
+    """Önbellekten veya işçiden fitness alan bireylerin enerji / ihlal / teslimat metrikleri de güncel olmalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    for n_workers in (1, 2):
+        random.seed(3)
+        ga = GeneticAlgorithm(drones, deliveries, no_fly_zones, graph, n_workers=n_workers)
+        ga.generations = 10
+        ga.evolve()
+        assert ga.fitness_cache.hits > 0
+        
+        for individual in ga.population:
+            if individual.dirty:
+                continue
+            fresh = Individual(drones, deliveries, ga.index, ordered=individual.ordered)
+            fresh.chromosome = dict(individual.chromosome)
+            fresh.calculate_fitness(graph, no_fly_zones)
+            assert abs(fresh.total_energy - individual.total_energy) < 1e-6
+            assert (fresh.delivered_count, fresh.rule_violations) == \
+                (individual.delivered_count, individual.rule_violations)
+            assert fresh.drone_metrics.keys() == individual.drone_metrics.keys()
+            for drone_id, (energy, violations, count) in fresh.drone_metrics.items():
+                cached_energy, cached_violations, cached_count = individual.drone_metrics[drone_id]
+                assert abs(energy - cached_energy) < 1e-6 and (violations, count) == (cached_violations, cached_count)
+
+def test_island_model_merges_histories():
+    """Ada modeli her ada için geçmiş tutmalı ve en iyi adanın çözümünü döndürmeli"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = IslandGeneticAlgorithm(drones, deliveries, no_fly_zones, graph, n_islands=3,
+                                migration_interval=5, seed=1)
+    ga.generations = 20
+    best = ga.evolve()
+    
+    assert sorted(ga.island_histories) == [0, 1, 2]
+    assert all(len(history) == 20 for history in ga.island_histories.values())
+    assert best.fitness == max(ga.island_best.values()) == max(ga.fitness_history)
+    assert abs(best.copy().calculate_fitness(graph, no_fly_zones) - best.fitness) < 1e-6
+
+def test_island_model_applies_adaptive_rates_and_restarts():
+    """Adalar uyarlamalı oranları ve durgunlukta yeniden başlatmayı kendi döngülerinde uygulamalı"""
+    drones, deliveries, no_fly_zones, graph = load_scenario()
+    ga = IslandGeneticAlgorithm(drones, deliveries, no_fly_zones, graph, n_islands=2,
+                                migration_interval=5, seed=1)
+    ga.generations = 12
+    ga.adaptive_rates = True
+    ga.restart_after = 1
+    ga.evolve()
+    
+    assert all(len(diversity) == 12 for diversity in ga.island_diversity.values())
+    assert len(ga.diversity_history) == 12 and all(0 <= d <= 1 for d in ga.diversity_history)
+    assert ga.restarts > 0
+
+if __name__ == "__main__":
+    test_vectorized_fitness_matches_individual()
+    test_fitness_cache_skips_unchanged_individuals()
+    test_mutation_updates_only_touched_drones()
+    test_crossover_children_have_no_duplicates()
+    test_route_optimizer_untangles_tour()
+    test_stagnation_stops_early_and_diversity_is_bounded()
+    test_copy_on_write_and_steady_state()
+    test_parallel_fitness_matches_serial()
+    test_cached_fitness_restores_metrics()
+    test_island_model_merges_histories()
+    test_island_model_applies_adaptive_rates_and_restarts()
+    print("✅ GA testleri tamamlandı")
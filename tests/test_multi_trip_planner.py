@@ -0,0 +1,321 @@
+"""
+Çoklu tur planlayıcı testleri - Olay tabanlı simülasyonun drone zaman çizelgelerini kontrol eder
+"""
+import sys
+import os
+import json
+import tempfile
+from contextlib import closing
+
+# Proje dizinini python path'ine ekle (modüllerin bulunması için)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_loader import DataLoader # Veri yükleme sınıfı
+from src.graph_builder import DeliveryGraph # Teslimat grafiği oluşturma
+from src.multi_trip_planner import MultiTripPlanner # Çoklu tur planlayıcı
+from src.delivery_pool import DeliveryPool # İndeksli teslimat havuzu
+from src.delivery_point import DeliveryPoint # Teslimat sınıfı
+from src.trip_sequence import TripSequence # Artımlı tur enerjisi
+from src.drone import Drone # Drone sınıfı
+from src.event_log import event_log # Olay günlüğü
+from src.savings_builder import SavingsTripBuilder # Tasarruf tur kurucu
+from src.insertion_builder import InsertionTripBuilder # Zaman pencereli ekleme
+from src.alns_improver import ALNSImprover # ALNS iyileştirici
+from src.order_stream import OrderStream # Çevrimiçi sipariş akışı
+from src.charging_station import ChargingStation # Şarj cihazı kuyruğu
+
+DATA_PATH = os.path.join(project_root, "data", "scenario2_data.txt")
+
+def make_planner(drone_count=None):
+    """Senaryo 2 verisinden planlayıcı oluştur (isteğe bağlı olarak ilk n drone)"""
+    drones, deliveries, no_fly_zones = DataLoader().load_from_txt(DATA_PATH)
+    drones = drones[:drone_count] if drone_count else drones
+    graph = DeliveryGraph(drones, deliveries, no_fly_zones)
+    return MultiTripPlanner(drones, deliveries, no_fly_zones, graph)
+
+def test_drone_timelines_overlap():
+    """Farklı drone'ların turları çakışmalı, aynı drone'un turları çakışmamalı"""
+    planner = make_planner()
+    results = planner.plan_multi_trip_delivery()
+    
+    delivered = [did for trips in results['drone_trips'].values() for trip in trips for did in trip['deliveries']]
+    assert len(delivered) == len(set(delivered)) == results['delivery_count']
+    
+    for trips in results['drone_trips'].values():
+        for previous, trip in zip(trips, trips[1:]):
+            assert trip['start_time'] >= previous['end_time']
+    
+    first_trips = [trips[0] for trips in results['drone_trips'].values() if trips]
+    assert sum(trip['start_time'] == 0 for trip in first_trips) > 1 # Filo aynı anda kalkar
+    assert results['makespan'] == max(trip['end_time'] for trips in results['drone_trips'].values() for trip in trips)
+
+def test_throughput_scales_with_fleet():
+    """Daha büyük filo aynı teslimatları daha kısa sürede bitirmeli"""
+    small = make_planner(drone_count=2).plan_multi_trip_delivery()
+    large = make_planner().plan_multi_trip_delivery()
+    
+    assert large['delivery_count'] >= small['delivery_count']
+    assert large['deliveries_per_hour'] > small['deliveries_per_hour']
+
+def test_delivery_pool_order_and_lazy_removal():
+    """Havuz öncelik sırasını korumalı, silinen ve süresi geçen teslimatları atlamalı"""
+    deliveries = [DeliveryPoint(1, (0, 0), 2.0, 3, (0, 60)),
+                  DeliveryPoint(2, (0, 0), 1.0, 5, (0, 200)),
+                  DeliveryPoint(3, (0, 0), 4.0, 5, (0, 30)),
+                  DeliveryPoint(4, (0, 0), 1.0, 3, (0, 90))]
+    pool = DeliveryPool(deliveries)
+    
+    with closing(pool.candidates()) as candidates:
+        assert [d.id for d in candidates] == [2, 3, 4, 1] # Öncelik azalan, ağırlık artan
+    
+    assert pool.remove(2).id == 2 and 2 not in pool
+    assert [d.id for d in pool.expire(50)] == [3] # Bitişi 50'den önce olanlar
+    assert len(pool) == 2 and pool.lightest_weight() == 1.0
+    
+    # Erken kapatılan tarama, okunmamış girişleri kaybetmez
+    with closing(pool.candidates()) as candidates:
+        assert next(candidates).id == 4
+    with closing(pool.candidates()) as candidates:
+        assert [d.id for d in candidates] == [4, 1]
+
+def test_trip_energy_matches_execution():
+    """Ekleme maliyeti tam hesapla, tur enerjisi de execute_trip'in tükettiği enerjiyle aynı olmalı"""
+    planner = make_planner()
+    drone = planner.drones[0]
+    drone.max_weight = 50 # Kapasite değil enerji sınırlasın
+    
+    trip = TripSequence(drone)
+    for delivery in planner.deliveries[:6]:
+        for position in range(len(trip) + 1):
+            expected = TripSequence(drone, trip.stops[:position] + [delivery] + trip.stops[position:]).energy
+            assert abs(trip.energy + trip.insertion_cost(delivery, position) - expected) < 1e-6
+        trip.insert(delivery, trip.cheapest_insertion(delivery)[1])
+    
+    drone.reset()
+    planner.execute_trip(drone, trip.stops, 0)
+    assert abs(drone.max_battery - drone.battery - trip.energy) < 1e-6
+    
+    # Seçilen tur bataryayı asla eksiye düşürmez
+    drone.reset()
+    drone.battery = trip.energy * 0.5
+    selected = planner.plan_single_trip(drone, planner.deliveries, 0)
+    planner.execute_trip(drone, selected, 0)
+    assert drone.battery >= 0
+
+def test_trip_sequencing_removes_zigzag():
+    """Zikzak sıralı tur, en yakın komşu + 2-opt ile düz gidiş-dönüşe inmeli; geç teslimat önce gelmeli"""
+    drone = Drone(1, 20.0, 10000, 10.0, (0, 0))
+    stops = [DeliveryPoint(i, (x, 0), 1.0, 3, (0, 480)) for i, x in enumerate((10, 40, 20, 30), start=1)]
+    trip = TripSequence(drone, stops)
+    assert trip.optimize(0) > 0
+    assert [d.id for d in trip.stops] == [1, 3, 4, 2] and abs(trip.distance - 80) < 1e-9
+    
+    # Uzaktaki paketin penceresi çok erken biterse gecikme cezası sırayı değiştirir
+    stops[1].time_window = (0, 1)
+    trip = TripSequence(drone, stops)
+    trip.optimize(0)
+    assert trip.stops[0].id == 2 and trip.lateness(0) == 0
+
+def test_event_log_levels_and_trace_file():
+    """Kapalı seviyeler bayrakla atlanmalı; iz dosyası her olay için bir JSON satırı içermeli"""
+    channel = event_log.channel('multitrip')
+    trace_path = os.path.join(tempfile.mkdtemp(), "trace.jsonl")
+    try:
+        event_log.configure(level='debug', quiet=True, trace_file=trace_path)
+        assert channel.debug_enabled # İz dosyası debug seviyesinde açık
+        results = make_planner().plan_multi_trip_delivery()
+        event_log.close()
+        
+        with open(trace_path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        started = [r for r in records if r['event'] == 'trip_started']
+        assert len(started) == results['total_trips']
+        assert records[-1]['event'] == 'planning_complete' and records[-1]['delivered'] == results['delivery_count']
+        
+        # Sessiz konsol ve iz dosyası yok: debug/info olayları hiç üretilmez
+        assert not channel.debug_enabled and not channel.info_enabled and channel.warning_enabled
+        event_log.configure(disabled_modules=['multitrip'])
+        assert not channel.warning_enabled
+    finally:
+        event_log.close()
+        event_log.configure(level='info', disabled_modules=[])
+
+def test_savings_strategy_builds_feasible_trips():
+    """Tasarruf turları kapasite ve durak sınırına uymalı, planlayıcı daha kısa mesafe uçmalı"""
+    planner = make_planner()
+    builder = SavingsTripBuilder(planner.drones, planner.deliveries, max_stops=planner.max_stops)
+    trips = [trip for depot_trips in builder.build().values() for trip in depot_trips]
+    covered = [delivery.id for trip in trips for delivery in trip.stops]
+    assert len(covered) == len(set(covered)) == len(planner.deliveries)
+    assert builder.merges > 0
+    for trip in trips:
+        assert len(trip) <= planner.max_stops
+        assert trip.total_weight <= trip.drone.max_weight
+        assert trip.energy <= trip.drone.max_battery
+
+    greedy = make_planner().plan_multi_trip_delivery()
+    planner.strategy = 'savings'
+    savings = planner.plan_multi_trip_delivery()
+    delivered = [did for trips in savings['drone_trips'].values() for trip in trips for did in trip['deliveries']]
+    assert len(delivered) == len(set(delivered)) == savings['delivery_count']
+    assert savings['delivery_count'] >= greedy['delivery_count']
+    distance = lambda results: sum(report['total_distance'] for report in results['drone_reports'].values())
+    assert distance(savings) <= distance(greedy)
+
+def test_insertion_strategy_respects_time_windows():
+    """Ekleme turlarında her durak pencere bitişinden önce varılmalı; zamanında teslimat greedy'den az olmamalı"""
+    planner = make_planner()
+    builder = InsertionTripBuilder(planner.deliveries, max_stops=planner.max_stops)
+    pool = DeliveryPool(planner.deliveries)
+    for drone in planner.drones:
+        stops = builder.build(drone, pool, 0)
+        trip = TripSequence(drone, stops)
+        assert stops and len(stops) <= planner.max_stops
+        assert trip.total_weight <= drone.max_weight and trip.energy <= drone.battery
+        for delivery, arrival in zip(stops, trip.arrival_times(0)):
+            assert arrival <= delivery.time_window[1]
+        for delivery in stops:
+            pool.remove(delivery.id)
+
+    greedy = make_planner().plan_multi_trip_delivery()
+    planner.strategy = 'insertion'
+    insertion = planner.plan_multi_trip_delivery()
+    assert insertion['delivery_count'] == greedy['delivery_count']
+    assert insertion['on_time_count'] >= greedy['on_time_count']
+
+def test_alns_improves_plan_with_incremental_schedules():
+    """ALNS maliyeti düşürmeli; artımlı zaman çizelgeleri baştan hesaplananla aynı olmalı"""
+    planner = make_planner()
+    planner.plan_multi_trip_delivery()
+    by_id = {delivery.id: delivery for delivery in planner.deliveries}
+    trips = {drone_id: [[by_id[i] for i in trip['deliveries']] for trip in drone_trips]
+             for drone_id, drone_trips in planner.drone_trips.items()}
+    
+    improver = ALNSImprover(planner.drones, planner.deliveries, planner.no_fly_zones, seed=1)
+    schedules = improver.run(trips, time_budget=30, max_iterations=300)
+    assert improver.iterations == 300
+    assert improver.best_cost < improver.initial_cost
+    
+    served = [d.id for schedule in schedules.values() for trip in schedule.trips for d in trip.stops]
+    assert len(served) == len(set(served)) == len(planner.deliveries) - len(improver.unserved)
+    for schedule in schedules.values():
+        full = improver.schedule(schedule.drone, schedule.trips)
+        assert abs(full.cost - schedule.cost) < 1e-6 and full.starts == schedule.starts
+        for trip in schedule.trips:
+            assert len(trip) <= planner.max_stops and trip.total_weight <= schedule.drone.max_weight
+    
+    planner.apply_schedules(schedules)
+    assert len(planner.completed_deliveries) == len(served)
+    for schedule in schedules.values():
+        assert [trip['start_time'] for trip in planner.drone_trips[schedule.drone.id]] == schedule.starts
+
+def test_alns_never_lengthens_makespan():
+    """ALNS sonrası plan, açgözlü planın bitiş zamanını uzatmamalı (saatlik teslimat düşmemeli)"""
+    baseline = make_planner().plan_multi_trip_delivery()
+    for seed in (1, 2):
+        planner = make_planner()
+        planner.alns_time_budget = 0.3
+        planner.alns_seed = seed
+        results = planner.plan_multi_trip_delivery()
+        assert results['makespan'] <= baseline['makespan']
+        assert results['delivery_count'] == baseline['delivery_count']
+
+def test_rolling_horizon_releases_orders_over_time():
+    """Çevrimiçi modda hiçbir tur, içindeki siparişler gelmeden başlamamalı; akış JSONL'den okunabilmeli"""
+    _, deliveries, _ = DataLoader().load_from_txt(DATA_PATH)
+    orders = sorted(((d.time_window[0], d) for d in deliveries), key=lambda order: order[0])
+    release = {d.id: release_time for release_time, d in orders}
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "orders.jsonl")
+        OrderStream.write_jsonl(path, orders)
+        for strategy in ('greedy', 'savings', 'insertion'):
+            planner = make_planner()
+            planner.deliveries = []
+            planner.strategy = strategy
+            results = planner.plan_multi_trip_delivery(OrderStream.from_jsonl(path))
+            
+            assert len(planner.deliveries) == len(deliveries)
+            delivered = [did for trips in results['drone_trips'].values() for trip in trips for did in trip['deliveries']]
+            assert len(delivered) == len(set(delivered)) == results['delivery_count'] == len(deliveries)
+            for trips in results['drone_trips'].values():
+                for trip in trips:
+                    assert all(release[did] <= trip['start_time'] for did in trip['deliveries'])
+            assert results['event_latency_ms']['max'] < 1000
+    
+    stream = OrderStream(iter([(5, deliveries[0]), (3, deliveries[1])]))
+    assert stream.release(4) == [] and stream.peek_time() == 5
+    try:
+        stream.release(10)
+        assert False, "sıra dışı sipariş kabul edildi"
+    except ValueError:
+        pass
+
+def test_charging_station_queue_limits_concurrent_charges():
+    """Depo başına tek cihazda şarjlar çakışmamalı; kısmi şarj daha kısa sürmeli ve turlar bataryaya sığmalı"""
+    station = ChargingStation((0, 0), chargers=1)
+    first, second = Drone(1, 5, 1000, 10, (0, 0)), Drone(2, 5, 1000, 10, (0, 0))
+    assert station.request(first, 1000, 0) and not station.request(second, 500, 5)
+    assert station.release(20) == (second, 500) and station.total_wait == 15
+    assert station.release(30) is None and station.has_free_charger()
+    
+    for partial in (False, True):
+        planner = make_planner()
+        depot = planner.drones[0].start_pos
+        for drone in planner.drones:
+            drone.start_pos = drone.current_pos = depot # Tüm filo tek depoyu paylaşır
+            drone.max_battery /= 4 # Küçük batarya: drone'lar gün içinde birkaç kez şarj olur
+        planner.chargers_per_depot = 1
+        planner.partial_charging = partial
+        results = planner.plan_multi_trip_delivery()
+        
+        charges = sorted(planner.charge_log, key=lambda charge: charge['start'])
+        assert charges and all(a['end'] <= b['start'] for a, b in zip(charges, charges[1:]))
+        for drone in planner.drones:
+            busy = sorted([(trip['start_time'], trip['end_time']) for trip in planner.drone_trips[drone.id]] +
+                          [(charge['start'], charge['end']) for charge in charges if charge['drone'] == drone.id])
+            assert all(a[1] <= b[0] for a, b in zip(busy, busy[1:])) # Drone şarjdayken uçmaz
+            # Şarj döngüsü, kısmi şarjlarda da başlatılan şarj sayısıdır
+            assert results['drone_reports'][drone.id]['charging_cycles'] == \
+                sum(1 for charge in charges if charge['drone'] == drone.id)
+            assert drone.battery >= 0
+        assert results['charging']['stations'][0]['chargers'] == 1
+        if partial:
+            assert all(charge['end'] - charge['start'] <= planner.charge_time_per_cycle for charge in charges)
+            assert results['charging']['charge_time'] < len(charges) * planner.charge_time_per_cycle
+        else:
+            assert results['charging']['total_wait'] > 0 # Tek cihaz için drone'lar sıraya girdi
+
+def test_unreachable_delivery_schedules_no_charges():
+    """Tam bataryayla bile ulaşılamayan teslimat için şarj planlanmamalı; döngü takılma korumasıyla bitmeli"""
+    for chargers in (None, 1):
+        drones = [Drone(1, 5, 1000, 10, (0, 0)), Drone(2, 5, 1000, 10, (0, 0))]
+        deliveries = [DeliveryPoint(1, (5000, 5000), 1.0, 3, (0, 10000))] # Geniş pencere: süresi dolmaz
+        planner = MultiTripPlanner(drones, deliveries, [], DeliveryGraph(drones, deliveries, []))
+        planner.chargers_per_depot = chargers
+        results = planner.plan_multi_trip_delivery()
+        
+        assert results['delivery_count'] == 0
+        assert planner.charge_log == [] and all(drone.charging_time == 0 for drone in drones)
+        assert results['charging']['total_wait'] == 0 and results['charging']['max_queue'] == 0
+        # Her drone idle_wait aralığıyla yeniden dener; 10 * drone sayısı denemede simülasyon durur
+        last_wake = max(planner.drone_clock.values())
+        assert last_wake < planner.time_horizon
+        assert results['events_processed'] <= 10 * len(drones) + len(drones)
+
+if __name__ == "__main__":
+    test_drone_timelines_overlap()
+    test_throughput_scales_with_fleet()
+    test_delivery_pool_order_and_lazy_removal()
+    test_trip_energy_matches_execution()
+    test_trip_sequencing_removes_zigzag()
+    test_event_log_levels_and_trace_file()
+    test_savings_strategy_builds_feasible_trips()
+    test_insertion_strategy_respects_time_windows()
+    test_alns_improves_plan_with_incremental_schedules()
+    test_alns_never_lengthens_makespan()
+    test_rolling_horizon_releases_orders_over_time()
+    test_charging_station_queue_limits_concurrent_charges()
+    test_unreachable_delivery_schedules_no_charges()
+    print("✅ Multi-trip testleri tamamlandı")